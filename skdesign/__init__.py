@@ -0,0 +1,4 @@
+from skdesign._lazy import attach
+
+__getattr__, __dir__, _ = attach(__name__, submodules=[
+    'design', 'group_sequential', 'power', 'randomization'])
@@ -0,0 +1,90 @@
+""" Lazy loading of submodules and of heavy dependencies.
+
+The packages only import a submodule when one of its names is first used,
+through a module level `__getattr__` (PEP 562), so importing skdesign or
+one of its packages is cheap and loads no scipy.
+"""
+import sys
+import types
+
+
+def _import(name):
+    """ Import the module `name`.  It goes through `__import__` rather than
+    `importlib`, so that `python -X importtime` reports it.
+
+    This is an internal method only.
+    """
+    __import__(name)
+    return sys.modules[name]
+
+
+def attach(package_name, submodules=(), attributes=None):
+    """ Make the names of a package load their submodules on first use.
+
+    Arguments:
+        package_name: the `__name__` of the package.
+        submodules: (optional) the submodules that can be used as attributes
+            of the package.
+        attributes: (optional) a dictionary from each name to the submodule
+            that defines it.
+
+    Returns:
+        A tuple of the `__getattr__` and `__dir__` functions and the
+        `__all__` list for the package.
+    """
+    if attributes is None:
+        attributes = {}
+    names = sorted(set(submodules) | set(attributes))
+
+    def __getattr__(name):
+        if name in submodules:
+            value = _import(package_name + '.' + name)
+        elif name in attributes:
+            module = _import(package_name + '.' + attributes[name])
+            value = getattr(module, name)
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}".format(
+                package_name, name))
+        # Later uses find the name directly.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(names))
+
+    return __getattr__, __dir__, list(attributes)
+
+
+class _LazyModule(types.ModuleType):
+    """ A module that is imported the first time one of its attributes is
+    used.  Its attributes are then copied in and it becomes a plain module,
+    so later uses cost the same as with the module itself.
+
+    This is an internal class only.
+    """
+
+    def _load(self):
+        module = _import(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__class__ = types.ModuleType
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """ A stand-in for the module `name` that imports it on first use.
+
+    Arguments:
+        name: the full name of the module, such as 'scipy.special'.
+
+    Returns:
+        A module object.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
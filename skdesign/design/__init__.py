@@ -1,2 +1,8 @@
-from .factorial import block_design, two_series_factorial
-from .latin_squares import latin_square, greaco_latin_square
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'block_design': 'factorial',
+    'two_series_factorial': 'factorial',
+    'latin_square': 'latin_squares',
+    'greaco_latin_square': 'latin_squares'
+})
@@ -1,2 +1,10 @@
-from .pocock import pocock_cutoff, pocock_adjust_n, pocock_test
-from .obrien_fleming import obrien_fleming_cutoff, obrien_fleming_adjust_n, obrien_fleming_test
\ No newline at end of file
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'pocock_cutoff': 'pocock',
+    'pocock_adjust_n': 'pocock',
+    'pocock_test': 'pocock',
+    'obrien_fleming_cutoff': 'obrien_fleming',
+    'obrien_fleming_adjust_n': 'obrien_fleming',
+    'obrien_fleming_test': 'obrien_fleming'
+})
@@ -1,4 +1,7 @@
+import math
 import numbers
+import numpy
+from skdesign._lazy import attach
 
 
 class PowerBase(object):
@@ -103,19 +106,30 @@ class PowerBase(object):
             self.beta = 0.2
 
 
+def _is_number(value):
+    """ Checks if a value is a number or an array of numbers
+
+    This is an internal method only.
+    """
+    if isinstance(value, numpy.ndarray):
+        return (numpy.issubdtype(value.dtype, numpy.number) and
+                not numpy.issubdtype(value.dtype, numpy.complexfloating))
+    return isinstance(value, numbers.Number)
+
+
 def is_in_0_1(value, value_label):
     """ Checks if a value is within [0, 1]
 
     Arguments:
-        value: the value to check
+        value: the value to check.  It can be a number or an array.
         value_label: a name for the value to check
 
     Raises:
         ValueError: if `value` is not a number or not in [0, 1]
     """
-    if not isinstance(value, numbers.Number):
+    if not _is_number(value):
         raise ValueError("`" + value_label + "` must be a number")
-    if value > 1 or value < 0:
+    if numpy.any(value > 1) or numpy.any(value < 0):
         raise ValueError("`" + value_label + "` must be in [0, 1]")
 
 
@@ -123,15 +137,15 @@ def is_non_negative(value, value_label):
     """ Checks if a value is non-negative
 
     Arguments:
-        value: the value to check
+        value: the value to check.  It can be a number or an array.
         value_label: a name for the value to check
 
     Raises:
         ValueError: if `value` is not a number or not non-negative
     """
-    if not isinstance(value, numbers.Number):
+    if not _is_number(value):
         raise ValueError("`" + value_label + "` must be a number")
-    if value < 0:
+    if numpy.any(value < 0):
         raise ValueError("`" + value_label + "` must be non-negative")
 
 
@@ -139,15 +153,15 @@ def is_positive(value, value_label):
     """ Checks if a value is postive
 
     Arguments:
-        value: the value to check
+        value: the value to check.  It can be a number or an array.
         value_label: a name for the value to check
 
     Raises:
         ValueError: if `value` is not a number or not positive
     """
-    if not isinstance(value, numbers.Number):
+    if not _is_number(value):
         raise ValueError("`" + value_label + "` must be a number")
-    if value <= 0:
+    if numpy.any(value <= 0):
         raise ValueError("`" + value_label + "` must be postive")
 
 
@@ -155,13 +169,13 @@ def is_numeric(value, value_label):
     """ Checks if a value is a number (float or integer)
 
     Arguments:
-        value: the value to check
+        value: the value to check.  It can be a number or an array.
         value_label: a name for the value to check
 
     Raises:
         ValueError: if `value` is not a number
     """
-    if not isinstance(value, numbers.Number):
+    if not _is_number(value):
         raise ValueError("`" + value_label + "` must be a number")
 
 
@@ -183,13 +197,17 @@ def is_integer(value, value_label):
     """ Checks if a value is an integer
 
     Arguments:
-        value: the value to check
+        value: the value to check.  It can be an integer or an array of
+            integers.
         value_label: a name for the value to check
 
     Raises:
         ValueError: if `value` is not a integer
     """
-    if not isinstance(value, int):
+    if isinstance(value, numpy.ndarray):
+        if not numpy.issubdtype(value.dtype, numpy.integer):
+            raise ValueError("`" + value_label + "` must be an integer")
+    elif not isinstance(value, (int, numpy.integer)):
         raise ValueError("`" + value_label + "` must be an integer")
 
 
@@ -205,3 +223,80 @@ def is_boolean(value, value_label):
     """
     if not isinstance(value, bool):
         raise ValueError("`" + value_label + "` must be an Boolean")
+
+
+def are_scalars(**values):
+    """ Checks that each value is a single value rather than an array.  The
+    classes that are not vectorized use it to reject arrays, which the other
+    checks accept.
+
+    Arguments:
+        values: the values to check, by their names.  None is accepted.
+
+    Raises:
+        ValueError: if one of `values` is an array or a list
+    """
+    for value_label, value in values.items():
+        if value is not None and numpy.ndim(value) != 0:
+            raise ValueError("`" + value_label + "` must be a single value")
+
+
+def ceil(value):
+    """ The ceiling of a number or an array as integers.
+
+    Arguments:
+        value: a number or an array.
+
+    Returns:
+        An int for a number, or an array of ints for an array.
+    """
+    if numpy.ndim(value) == 0:
+        return math.ceil(value)
+    return numpy.ceil(value).astype(int)
+
+
+def to_float(value):
+    """ Converts a number or an array to floats.
+
+    Arguments:
+        value: a number or an array.
+
+    Returns:
+        A float for a number, or an array of floats for an array.
+    """
+    if numpy.ndim(value) == 0:
+        return float(value)
+    return numpy.asarray(value, dtype=float)
+
+
+def to_probabilities(value, value_label, ndim=None):
+    """ Converts a table of probabilities, as nested lists or an array, to an
+    array of floats and checks it.
+
+    Arguments:
+        value: the probabilities.
+        value_label: a name for the value to check
+        ndim: (optional) the number of dimensions the table must have.
+
+    Returns:
+        An array of floats.
+
+    Raises:
+        ValueError: if `value` is not a table of numbers in [0, 1] with
+            `ndim` dimensions
+    """
+    try:
+        probabilities = numpy.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("`" + value_label + "` must be an array of numbers")
+    if ndim is not None and probabilities.ndim != ndim:
+        raise ValueError("`" + value_label + "` must have " + str(ndim) +
+                         " dimensions")
+    is_in_0_1(probabilities, value_label)
+    return probabilities
+
+
+__getattr__, __dir__, _ = attach(__name__, submodules=[
+    'allocation', 'bioequivalence', 'distributions', 'functions', 'gof',
+    'means', 'non_parametric', 'numerics', 'proportions', 'search',
+    'simulation', 'time_to_event', 'variances'])
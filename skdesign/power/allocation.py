@@ -0,0 +1,159 @@
+""" The cheapest allocation of subjects between the two groups of two sample
+designs.
+"""
+import collections
+import numpy
+from skdesign.power.means import TwoSampleParallel
+from skdesign.power.non_parametric import TwoSample
+from skdesign.power.proportions import (RelativeRiskParallel,
+                                        TwoSampleParallel as
+                                        ProportionsParallel)
+
+AllocationResult = collections.namedtuple('AllocationResult',
+                                          ['n_1', 'n_2', 'ratio', 'cost'])
+
+# The designs whose sample sizes are calculated for an array of ratios at
+# once.  Exponential is a TwoSampleParallel.
+_VECTORIZED = (TwoSampleParallel, ProportionsParallel, RelativeRiskParallel,
+               TwoSample)
+
+# Parameters controling the search over the ratio.  The default grid runs
+# geometrically from 1 / `_MAX_RATIO` to `_MAX_RATIO`, and each refinement
+# puts `_GRID_SIZE` ratios between the neighbours of the best ratio so far.
+_MAX_RATIO = 10
+_GRID_SIZE = 41
+_REFINEMENTS = 3
+# The ratios of the sample sizes within `_WINDOW` of the best pair, as a
+# fraction, or within `_MIN_WINDOW` of it are tried last.
+_WINDOW = 0.1
+_MIN_WINDOW = 10
+
+
+def optimize_ratio(design, cost_1=1, cost_2=1, ratios=None, refinements=None,
+                   **parameters):
+    """ Find the ratio :math:`k = n_{1} / n_{2}` with the smallest cost
+    :math:`c_{1} n_{1} + c_{2} n_{2}`.
+
+    The sample sizes are calculated for every ratio on a grid, and the grid
+    is then refined around the cheapest ratio.  With equal costs this is the
+    allocation with the smallest total sample size, which is not 1 when the
+    groups have different variances or hazards.  For TwoSampleParallel
+    (means and proportions), Exponential, RelativeRiskParallel and the non
+    parametric TwoSample the sample sizes for the whole grid are calculated
+    together on arrays, and the ratios :math:`n_{1} / n_{2}` of the pairs
+    of sample sizes near the best one are tried last.  The other designs,
+    such as Fisher, are calculated for each ratio of the grids only, so a
+    short grid and few refinements keep them quick.
+
+    Arguments:
+        design: a two sample design that takes `ratio`, `n_1` and `n_2`.
+        cost_1: (optional) the cost of a subject in group 1.  The default
+            is 1.
+        cost_2: (optional) the cost of a subject in group 2.  The default
+            is 1.
+        ratios: (optional) the first grid of ratios.  The default runs from
+            0.1 to 10.
+        refinements: (optional) the number of times the grid is refined.
+            The default is 3.
+        parameters: the other arguments of `design`, such as the means or
+            the proportions and the hypothesis.  alpha defaults to 0.05 and
+            power to 0.8.
+
+    Returns:
+        An `AllocationResult` with the cheapest n_1, n_2, their ratio and
+        their cost.
+
+    Raises:
+        ValueError: if no ratio has a sample size.
+    """
+    if ratios is None:
+        ratios = numpy.geomspace(1.0 / _MAX_RATIO, _MAX_RATIO, _GRID_SIZE)
+    ratios = numpy.unique(numpy.asarray(ratios, dtype=float))
+    if ratios.size == 0 or numpy.any(ratios <= 0):
+        raise ValueError('`ratios` must be positive')
+    if refinements is None:
+        refinements = _REFINEMENTS
+    parameters.setdefault('alpha', 0.05)
+    if parameters.get('beta') is None:
+        parameters.setdefault('power', 0.8)
+
+    best = None
+    for _ in range(refinements + 1):
+        n_1, n_2 = _sample_sizes(design, ratios, parameters)
+        best = _cheapest(best, ratios, n_1, n_2, cost_1, cost_2)
+        if best is None or ratios.size < 3:
+            break
+        # Rounding n_2 up, and then n_1 = k n_2 up, adds up to a subject to
+        # group 2 and k + 1 subjects to group 1, so the next grid lies
+        # between the neighbours of every ratio whose cost is within that of
+        # the cheapest on this grid.
+        cost = cost_1 * n_1 + cost_2 * n_2
+        near = numpy.flatnonzero(cost <= numpy.nanmin(cost) +
+                                 cost_1 * (ratios + 1) + cost_2)
+        lower = ratios[max(near[0] - 1, 0)]
+        upper = ratios[min(near[-1] + 1, ratios.size - 1)]
+        ratios = numpy.geomspace(lower, upper, _GRID_SIZE)
+    if best is None:
+        raise ValueError('No ratio has a sample size')
+
+    if issubclass(design, _VECTORIZED):
+        # Since n_1 is k n_2 rounded up, a pair of sample sizes is reached
+        # exactly at the ratio n_1 / n_2, so every such ratio near the best
+        # pair is tried.
+        n_1 = numpy.arange(max(best.n_1 - _window(best.n_1), 1),
+                           best.n_1 + _window(best.n_1) + 1)
+        n_2 = numpy.arange(max(best.n_2 - _window(best.n_2), 1),
+                           best.n_2 + _window(best.n_2) + 1)
+        ratios = numpy.unique(n_1[:, None] / n_2[None, :].astype(float))
+        n_1, n_2 = _sample_sizes(design, ratios, parameters)
+        best = _cheapest(best, ratios, n_1, n_2, cost_1, cost_2)
+    return best
+
+
+def _window(n):
+    """ The number of sample sizes on each side of `n` whose ratios are
+    tried in the last refinement.
+
+    This is an internal method only.
+    """
+    return max(int(_WINDOW * n), _MIN_WINDOW)
+
+
+def _cheapest(best, ratios, n_1, n_2, cost_1, cost_2):
+    """ The cheaper of `best` and the cheapest of the sample sizes `n_1` and
+    `n_2` at `ratios`.
+
+    This is an internal method only.
+    """
+    cost = cost_1 * n_1 + cost_2 * n_2
+    if numpy.all(numpy.isnan(cost)):
+        return best
+    index = int(numpy.nanargmin(cost))
+    if best is None or cost[index] < best.cost:
+        return AllocationResult(int(n_1[index]), int(n_2[index]),
+                                float(ratios[index]), float(cost[index]))
+    return best
+
+
+def _sample_sizes(design, ratios, parameters):
+    """ n_1 and n_2 of `design` for each ratio in `ratios`, as float arrays
+    with NaN where there is no sample size.
+
+    This is an internal method only.
+    """
+    if issubclass(design, _VECTORIZED):
+        hypothesis = design(ratio=ratios, **parameters)
+        hypothesis.calculate()
+        n_1, n_2 = hypothesis.n_1, hypothesis.n_2
+    else:
+        n_1 = []
+        n_2 = []
+        for ratio in ratios:
+            hypothesis = design(ratio=float(ratio), **parameters)
+            hypothesis.calculate()
+            n_1.append(hypothesis.n_1)
+            n_2.append(hypothesis.n_2)
+    shape = numpy.shape(ratios)
+    n_1 = numpy.broadcast_to(numpy.asarray(n_1, dtype=float), shape)
+    n_2 = numpy.broadcast_to(numpy.asarray(n_2, dtype=float), shape)
+    return n_1, n_2
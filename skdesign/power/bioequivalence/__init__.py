@@ -1,4 +1,8 @@
-from .average import Average
-from .population import Population
-from .in_vitro import InVitro
-from .individual import Individual
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'Average': 'average',
+    'Population': 'population',
+    'InVitro': 'in_vitro',
+    'Individual': 'individual'
+})
@@ -12,7 +12,9 @@ class Average(TwoSampleCrossover):
     Attributes:
         n: The sample size required to test the hypothesis at an
             :math:`\\alpha` level and a power of :math:`1 - \\beta`.
-        delta: :math:`\\delta` is the average bioequivalence
+        delta: :math:`\\delta` is the average bioequivalence.  If it is
+            None, the largest :math:`\\delta` at which the test has the
+            power at n is calculated as `mu_1`.
         stdev: :math:`\\sigma` is the standard deviation of the sample.
         known_stdev: A boolean indicator if the standard deviation
         alpha: The :math:`\\alpha` level required by the hypothesis.
@@ -20,14 +22,19 @@ class Average(TwoSampleCrossover):
             :math:`1` - power).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
+        exact: (optional) A boolean indicator if the exact power of the two
+            one-sided tests is used when the standard deviation is unknown.
+            The default is False.
     """
 
     def __init__(self, n=None, delta=None, stdev=None, known_stdev=None,
-                 margin=None, alpha=None, beta=None, power=None):
+                 margin=None, alpha=None, beta=None, power=None,
+                 exact=None):
 
         # Initialize the remaining arguments through the parent.
         super(Average, self).__init__(n=n, mu_1=delta, mu_2=0,
                                       stdev=stdev, known_stdev=known_stdev,
                                       hypothesis="equivalence",
                                       margin=margin, alpha=alpha,
-                                      beta=beta, power=power)
+                                      beta=beta, power=power,
+                                      exact=exact)
@@ -1,10 +1,13 @@
 from skdesign.power import (PowerBase,
+                            are_scalars,
                             is_in_0_1,
                             is_integer,
                             is_numeric,
                             is_positive)
-import scipy.stats as stats
+from skdesign.power import numerics
+from skdesign.power.search import integer_search
 import math
+import numpy
 
 MAX_ITERATIONS = 1000
 
@@ -30,11 +33,20 @@ class InVitro(PowerBase):
             :math:`1` - power).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
+        m: The second sample size, found with n.
+        m_plus: (optional) The sizes m that are considered are below m_plus.
+            The default is 1000.
+        frontier: The (n, m) pairs that show bioequivalence and are not
+            beaten in both n and m by another pair, sorted by n.  (n, m) is
+            the first of them.
     """
 
     def __init__(self, delta=None, stdev_wr=None, stdev_wt=None,
                  stdev_br=None, stdev_bt=None, theta_BE=None, m_plus=None,
                  alpha=None, power=None, beta=None):
+        are_scalars(delta=delta, stdev_wr=stdev_wr, stdev_wt=stdev_wt,
+                    stdev_br=stdev_br, stdev_bt=stdev_bt, theta_BE=theta_BE,
+                    m_plus=m_plus, alpha=alpha, power=power, beta=beta)
         is_numeric(delta, 'delta')
         self.delta = delta
 
@@ -58,6 +70,7 @@ class InVitro(PowerBase):
         else:
             is_integer(m_plus, 'm_plus')
         self.m_plus = m_plus
+        self.frontier = None
 
         # Initialize the remaining arguments through the parent.
         super(InVitro, self).__init__(hypothesis="equivalence",
@@ -70,15 +83,15 @@ class InVitro(PowerBase):
         return gamma
 
     def _calculate_u(self, m, n, cut):
-        dist = stats.norm()
-        tmp_1 = ((m - 1) / stats.chi2.ppf(1 - cut, df=m - 1) - 1)**2
-        tmp_2 = (n * (m - 1) / stats.chi2.ppf(1 - cut, df=n * (m - 1)) - 1)**2
-        tmp_3 = ((m - 1) / stats.chi2.ppf(cut, df=m - 1) - 1)**2
-        tmp_4 = (n * (m - 1) / stats.chi2.ppf(cut, df=n * (m - 1)) - 1)**2
+        tmp_1 = ((m - 1) / numerics.chi2_ppf(1 - cut, df=m - 1) - 1)**2
+        tmp_2 = (n * (m - 1) /
+                 numerics.chi2_ppf(1 - cut, df=n * (m - 1)) - 1)**2
+        tmp_3 = ((m - 1) / numerics.chi2_ppf(cut, df=m - 1) - 1)**2
+        tmp_4 = (n * (m - 1) / numerics.chi2_ppf(cut, df=n * (m - 1)) - 1)**2
         c = 1
         U = ((abs(self.delta) +
-              dist.ppf(cut) *
-              math.sqrt((self.stdev_bt**2 + self.stdev_br**2) / m))**2 -
+              numerics.norm_ppf(cut) *
+              numpy.sqrt((self.stdev_bt**2 + self.stdev_br**2) / m))**2 -
              self.delta**2)**2
         U += self.stdev_bt**4 * tmp_1
         U += (1 - 1 / n)**2 * self.stdev_wt**4 * tmp_2
@@ -92,18 +105,55 @@ class InVitro(PowerBase):
                  b * self.stdev_wr**2)
         return sigma
 
+    def bound(self, n, m):
+        """ The upper bound of the in vitro BE criterion at sample sizes
+        `n` and `m`.
+
+        Bioequivalence is shown with the required power once the bound is
+        not positive.  The bound decreases with m, but not always with n.
+
+        Arguments:
+            n: the first sample size.  It can be an array.
+            m: the second sample size.  It can be an array.
+
+        Returns:
+            The bound, with the broadcast shape of `n` and `m`.
+        """
+        self._set_default_alpha()
+        self._set_default_power()
+        n, m = numpy.broadcast_arrays(n, m)
+        bound = (self._calculate_gamma() +
+                 numpy.sqrt(self._calculate_u(m, n, self.alpha)) +
+                 numpy.sqrt(self._calculate_u(m, n, self.power)))
+        if bound.ndim == 0:
+            return float(bound)
+        return bound
+
     def calculate(self):
-        gamma = self._calculate_gamma()
-        # Step 1 is the first iteration of the inner loop.
-        # Step 2 is the inner loop.
-        # Step 3 is the outer loop
-        for n in range(1, MAX_ITERATIONS):
-            for m in range(30, self.m_plus):
-                U = math.sqrt(self._calculate_u(m, n, 0.05))
-                U_beta = math.sqrt(self._calculate_u(m, n, self.power))
-                print(str(n) + ', ' + str(m))
-                print(str(gamma) + ', ' + str(U) + ', ' + str(U_beta))
-                if gamma + U + U_beta <= 0:
-                    self.n = n
-                    self.m = m
-                    return
+        """ Find the frontier of (n, m) pairs that show bioequivalence.
+
+        The frontier is walked in increasing n.  A pair only joins it if its
+        m is below the smallest m so far, so each n is first checked at that
+        m less one, with every remaining n checked at once.  For the first n
+        that passes, m is lowered by galloping and bisection, which is
+        possible because the bound decreases with m.
+        """
+        m_minimum = 30
+        n_values = numpy.arange(1, MAX_ITERATIONS)
+        m_best = self.m_plus
+        frontier = []
+        while len(n_values) > 0 and m_best > m_minimum:
+            passed = numpy.flatnonzero(self.bound(n_values, m_best - 1) <= 0)
+            if len(passed) == 0:
+                break
+            n = int(n_values[passed[0]])
+            result = integer_search(lambda m: -self.bound(n, m), 0,
+                                    m_best - 1, m_minimum, m_best - 1)
+            m_best = result.n
+            frontier.append((n, m_best))
+            n_values = n_values[passed[0] + 1:]
+
+        if not frontier:
+            raise BaseException("N is greater than maximum N")
+        self.frontier = frontier
+        self.n, self.m = frontier[0]
@@ -1,11 +1,12 @@
 from skdesign.power import (PowerBase,
+                            are_scalars,
                             is_in_0_1,
                             is_numeric,
                             is_positive)
-import scipy.stats as stats
+from skdesign.power import numerics
+from skdesign.power.search import gallop_search
 import math
-
-MAX_ITERATIONS = 1000
+import numpy
 
 
 class Individual(PowerBase):
@@ -30,10 +31,17 @@ class Individual(PowerBase):
             :math:`1 - \\beta`).
     """
 
+    # Parameters controling the search for n
+    _minN = 2
+    _maxN = 10**7
+
     def __init__(self, delta=None, stdev_wr=None, stdev_wt=None,
                  stdev_br=None, stdev_bt=None, rho=None,
                  theta_IBE=None, alpha=None, power=None,
                  beta=None):
+        are_scalars(delta=delta, stdev_wr=stdev_wr, stdev_wt=stdev_wt,
+                    stdev_br=stdev_br, stdev_bt=stdev_bt, rho=rho,
+                    theta_IBE=theta_IBE, alpha=alpha, power=power, beta=beta)
         is_numeric(delta, 'delta')
         self.delta = delta
 
@@ -68,10 +76,10 @@ class Individual(PowerBase):
     def _calculate_u(self, n, cut):
         nu = 2 * n - 1
         sigma = self._calculate_sigma(0.5, 0.5)
-        tmp_1 = ((nu - 1) / stats.chi2.ppf(1 - cut, df=nu - 1) - 1)**2
-        tmp_2 = ((nu - 1) / stats.chi2.ppf(cut, df=nu - 1) - 1)**2
+        tmp_1 = ((nu - 1) / numerics.chi2_ppf(1 - cut, df=nu - 1) - 1)**2
+        tmp_2 = ((nu - 1) / numerics.chi2_ppf(cut, df=nu - 1) - 1)**2
         U = (abs(self.delta) +
-             stats.t.ppf(cut, df=nu) * sigma * math.sqrt(2 / n) / 2 -
+             numerics.t_ppf(cut, df=nu) * sigma * numpy.sqrt(2 / n) / 2 -
              self.delta**2)**2
         U += sigma**4 * tmp_1
         U += 0.25 * self.stdev_wt**4 * tmp_1
@@ -83,16 +91,32 @@ class Individual(PowerBase):
                  b * self.stdev_wr**2)
         return sigma
 
+    def bound(self, n):
+        """ The upper bound of the IBE criterion at a sample size of `n`.
+
+        Individual bioequivalence is shown with the required power once the
+        bound is negative.  The bound decreases with n.
+
+        Arguments:
+            n: the sample size.  It can be an array, in which case the bound
+                is calculated for every n at once.
+
+        Returns:
+            The bound, with the shape of `n`.
+        """
+        self._set_default_alpha()
+        self._set_default_power()
+        n = numpy.asarray(n)
+        bound = (self._calculate_gamma() +
+                 numpy.sqrt(self._calculate_u(n, self.alpha)) +
+                 numpy.sqrt(self._calculate_u(n, self.power)))
+        if bound.ndim == 0:
+            return float(bound)
+        return bound
+
     def calculate(self):
-        gamma = self._calculate_gamma()
-        self.n = None
-        found_solution = False
-        for i in range(2, MAX_ITERATIONS):
-            bound = gamma + math.sqrt(self._calculate_u(i, 0.05))
-            bound += math.sqrt(self._calculate_u(i, self.power))
-            if bound < 0:
-                self.n = i
-                found_solution = True
-                break
-        if not found_solution:
-            raise BaseException("N > " + str(MAX_ITERATIONS))
+        """ Calculate the smallest n with a negative bound, by galloping and
+        bisection over n.
+        """
+        self.n, _ = gallop_search(lambda n: -self.bound(n), 0, self._minN,
+                                  self._maxN)
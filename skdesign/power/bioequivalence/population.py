@@ -1,8 +1,9 @@
 from skdesign.power import (PowerBase,
+                            are_scalars,
                             is_in_0_1,
                             is_numeric,
                             is_positive)
-import scipy.stats as stats
+from skdesign.power import numerics
 import math
 
 
@@ -35,6 +36,10 @@ class Population(PowerBase):
     def __init__(self, delta=None, l=None, stdev_11=None, stdev_tt=None,
                  stdev_tr=None, stdev_bt=None, stdev_br=None, rho=None,
                  theta_PBE=None, alpha=None, power=None, beta=None):
+        are_scalars(delta=delta, l=l, stdev_11=stdev_11, stdev_tt=stdev_tt,
+                    stdev_tr=stdev_tr, stdev_bt=stdev_bt, stdev_br=stdev_br,
+                    rho=rho, theta_PBE=theta_PBE, alpha=alpha, power=power,
+                    beta=beta)
 
         if delta is None:
             delta = 0
@@ -70,12 +75,12 @@ class Population(PowerBase):
                                          alpha=alpha, beta=beta, power=power)
 
     def calculate(self):
-        dist = stats.norm()
         coef = (2 * self.delta**2 * self.stdev_11**2 +
                 self.stdev_tt**4 +
                 (1 + self.theta_PBE)**2 * self.stdev_tr**4 -
                 2 * (1 + self.theta_PBE) *
                 self.rho**2*self.stdev_bt**2 * self.stdev_br**2)
-        n = (dist.ppf(1 - self.alpha) + dist.ppf(1 - self.beta))**2
+        n = (numerics.norm_ppf(1 - self.alpha) +
+             numerics.norm_ppf(1 - self.beta))**2
         n *= coef / self.l**2
         self.n = math.ceil(n)
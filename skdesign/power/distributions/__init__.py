@@ -1,2 +1,6 @@
-from .normal import Normal
-from .distribution import Distribution
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'Normal': 'normal',
+    'Distribution': 'distribution'
+})
@@ -1,12 +1,61 @@
 from skdesign.power import (
-    PowerBase,
+    are_scalars,
+    is_boolean,
     is_integer
 )
-import scipy.stats as stats
-
-
-class Distribution(PowerBase):
-    """ """
+from skdesign.power.search import gallop_search
+from skdesign.power.simulation import (CommonRandomNumbers,
+                                       map_rows,
+                                       row_p_values,
+                                       sample_p_values,
+                                       simulate,
+                                       SimulationBase)
+from skdesign._lazy import lazy_import
+import functools
+import numpy
+
+stats = lazy_import('scipy.stats')
+
+
+def _is_distribution(name):
+    """ Checks if `name` is the name of a distribution in scipy.stats
+
+    This is an internal method only.
+    """
+    return isinstance(getattr(stats, str(name), None),
+                      (stats.rv_continuous, stats.rv_discrete))
+
+
+class Distribution(SimulationBase):
+    """ Simulated power and sample size for goodness of fit tests.
+
+    Attributes:
+        n: The sample size
+        alpha: The :math:`\\alpha` level required by the hypothesis.
+        beta: The :math:`\\beta` level required by the hypothesis (equal to
+            :math:`1 - power`).
+        power: The power required by the hypothesis (equal to
+            :math:`1 - \\beta`).
+        method: The goodness of fit test.
+        dist: The name of a distribution in `scipy.stats` to simulate from.
+            Any extra keyword arguments are passed to the distribution.
+        compare_dist: The name of the distribution in `scipy.stats` that is
+            tested against.
+        seed: (optional) The seed for the simulations.
+        common_random_numbers: (optional) If True, every sample size uses
+            the first `n` columns of one shared stream of draws instead of
+            fresh samples.  The default is False.
+        n_jobs: (optional) The number of processes to run the simulations
+            in.  -1 uses every CPU.  The results do not depend on `n_jobs`.
+            The default is to run in this process.
+        adaptive: (optional) If True, the simulations for each candidate
+            `n` stop once the simulated power is clearly above or below the
+            target power.  The default is False.
+        time_budget: (optional) The number of seconds the calculation may
+            run for.
+        mc_stderr: The Monte Carlo standard error of the simulated power.
+        n_sims: The number of simulations behind the simulated power.
+    """
 
     # Parameters controling the simulation of power
     _N_SIMS = 1000
@@ -17,17 +66,19 @@ class Distribution(PowerBase):
     _maxN = 1000
 
     def __init__(self, n=None, alpha=None, beta=None, power=None, method=None,
-                 dist=None, compare_dist=None, seed=None, **kwargs):
+                 dist=None, compare_dist=None, seed=None, common_random_numbers=None,
+                 n_jobs=None, adaptive=None, time_budget=None, **kwargs):
+        are_scalars(n=n, alpha=alpha, beta=beta, power=power)
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
         self.n = n
 
-        if dist in dir(stats):
+        if _is_distribution(dist):
             self.dist = getattr(stats, dist)(**kwargs)
         else:
             raise ValueError('{} is not a valid distribution'.format(dist))
 
-        if compare_dist not in dir(stats):
+        if not _is_distribution(compare_dist):
             raise ValueError('{} is not a valid distribution'.format(compare_dist))
 
         if seed is None:
@@ -35,25 +86,36 @@ class Distribution(PowerBase):
         else:
             self.seed = seed
 
+        if common_random_numbers is None:
+            common_random_numbers = False
+        else:
+            is_boolean(common_random_numbers, 'common_random_numbers')
+        self.common_random_numbers = common_random_numbers
+        self._stream = None
+
+        if n_jobs is not None:
+            is_integer(n_jobs, 'n_jobs')
+        self.n_jobs = n_jobs
+
         if method == 'anderson' or method == 'anderson-darling':
             if compare_dist not in ["norm", "expon", "logistic", "gumbel",
                                     "gumbel_l", "gumbel_r", "extreme1"]:
                 raise ValueError('{} is not a valid distribution'.format(compare_dist))
 
-            def dist_anderson(rvs):
-                return stats.anderson(rvs, dist=compare_dist)
-
-            self.distribution_test = dist_anderson
+            self.distribution_test = functools.partial(stats.anderson,
+                                                       dist=compare_dist)
         elif method == 'kolmogorov-smirnov' or method == 'ks':
-            def dist_ks(rvs):
-                return stats.kstest(rvs, dist=compare_dist)
-            self.distribution_test = dist_ks
+            self.distribution_test = functools.partial(stats.kstest,
+                                                       cdf=compare_dist)
 
         # Initialize the remaining arguments through the parent.
         super(Distribution, self).__init__(alpha=alpha, power=power,
-                                           beta=beta, hypothesis=None)
+                                           beta=beta, hypothesis=None,
+                                           adaptive=adaptive,
+                                           time_budget=time_budget)
 
     def calculate(self):
+        self._start_clock()
         if self.n is None:
             self._set_default_alpha()
             self._set_default_power()
@@ -63,8 +125,9 @@ class Distribution(PowerBase):
             self._calculate_power()
         elif self.alpha is None:
             self._calculate_alpha()
+        self._set_simulation_error(self.n)
 
-    def calculate_n(self):
+    def _calculate_n(self):
         """ Perfrom the power calculation """
         if self.power is None:
             power = 0.8
@@ -76,53 +139,59 @@ class Distribution(PowerBase):
         else:
             alpha = self.alpha
 
-        found_solution = False
-        for n in range(self._minN, self._maxN):
-            count = 0
-            for sim in range(self._N_SIMS):
-                res = self.dist.rvs(size=n, random_state=self.seed * sim)
-
-                _, p_val = self.normal_test(res)
-                if p_val < alpha:
-                    count += 1
-            test_power = count / self._N_SIMS
-            if test_power > power:
-                found_solution = True
-                self.power = test_power
-                self.n = n
-                break
-        if not found_solution:
-            raise BaseException("N is greater than maximum N")
-
-    def calculate_power(self):
+        def power_at(n):
+            return self._power_internals(n, alpha, power)
+
+        self.n, self.power = gallop_search(power_at, power, self._minN,
+                                           self._maxN)
+        self.beta = 1 - self.power
+
+    def _calculate_power(self):
         """ Perfrom the power calculation """
         if self.alpha is None:
             alpha = 0.05
         else:
             alpha = self.alpha
 
-        count = 0
-        for sim in range(self._N_SIMS):
-            res = self.dist.rvs(size=self.n, random_state=self.seed * sim)
-
-            _, p_val = self.distribution_test(res)
-            if p_val < alpha:
-                count += 1
-        self.power = count / self._N_SIMS
+        self.power = self._power_internals(self.n, alpha)
         self.beta = 1 - self.power
 
-    def calculate_alpha(self):
+    def _calculate_alpha(self):
         """ Perfrom the power calculation """
         if self.power is None:
             power = 0.8
         else:
             power = self.power
 
-        p_vals = []
-        for sim in range(self._N_SIMS):
-            res = self.dist.rvs(size=self.n, random_state=self.seed * sim)
-
-            _, p_val = self.distribution_test(res)
-            p_vals.append(p_val)
-        p_vals.sort()
-        self.alpha = p_vals[int(self._N_SIMS * power) - 1]
+        p_vals = numpy.sort(self._simulate_p_values(self.n))
+        self.alpha = float(p_vals[int(self._N_SIMS * power) - 1])
+        self._power_estimate(self.n, p_vals, self.alpha)
+
+    def _power_internals(self, n, alpha, target=None):
+        stop = self._stopping_rule(alpha, target)
+        p_vals = self._simulate_p_values(n, stop)
+        return self._power_estimate(n, p_vals, alpha)
+
+    def _simulate_p_values(self, n, stop=None):
+        """ Simulate `_N_SIMS` samples of size `n` and test each of them.
+
+        With common random numbers, the samples are the first `n` columns of
+        a shared stream.  Otherwise, each block of samples is drawn
+        separately.  If `stop` is given, the simulations end once it returns
+        True.
+
+        This is an internal method only.
+        """
+        if self.common_random_numbers:
+            if self._stream is None:
+                self._stream = CommonRandomNumbers(self.dist, self._N_SIMS,
+                                                   self.seed)
+            return map_rows(row_p_values, self._stream.sample(n),
+                            n_jobs=self.n_jobs,
+                            args=(self.distribution_test, False),
+                            stop=stop)
+
+        return simulate(sample_p_values, self._N_SIMS, self.seed,
+                        n_jobs=self.n_jobs,
+                        args=(self.dist, n, self.distribution_test, False),
+                        stop=stop)
@@ -1,13 +1,60 @@
 from skdesign.power import (
-    PowerBase,
+    are_scalars,
+    is_boolean,
     is_integer
 )
-import scipy.stats as stats
+from skdesign.power.distributions import vectorized as vectorized_tests
+from skdesign.power.distributions.distribution import _is_distribution
+from skdesign.power.simulation import (CommonRandomNumbers,
+                                       map_rows,
+                                       row_p_values,
+                                       sample_p_values,
+                                       simulate,
+                                       SimulationBase)
+from skdesign._lazy import lazy_import
+import functools
+import numpy
 import math
 
+stats = lazy_import('scipy.stats')
 
-class Normal(PowerBase):
-    """ """
+
+class Normal(SimulationBase):
+    """ Simulated power and sample size for tests of normality.
+
+    The power of the test given by `method` is estimated by simulating
+    `_N_SIMS` samples from the alternative distribution `dist`.
+
+    Attributes:
+        n: The sample size
+        alpha: The :math:`\\alpha` level required by the hypothesis.
+        beta: The :math:`\\beta` level required by the hypothesis (equal to
+            :math:`1 - power`).
+        power: The power required by the hypothesis (equal to
+            :math:`1 - \\beta`).
+        method: The test of normality.
+        dist: The name of a distribution in `scipy.stats` to simulate from.
+            Any extra keyword arguments are passed to the distribution.
+        seed: (optional) The seed for the simulations.
+        vectorized: (optional) If True, each batch of simulations is drawn
+            as a single matrix and tested along its rows.  The default is
+            True.
+        common_random_numbers: (optional) If True, every sample size uses
+            the first `n` columns of one shared stream of draws instead of
+            fresh samples.  This makes the simulated power smooth in `n`,
+            so the search for `n` is not thrown off by simulation noise.
+            The default is False.
+        n_jobs: (optional) The number of processes to run the simulations
+            in.  -1 uses every CPU.  The results do not depend on `n_jobs`.
+            The default is to run in this process.
+        adaptive: (optional) If True, the simulations for each candidate
+            `n` stop once the simulated power is clearly above or below the
+            target power.  The default is False.
+        time_budget: (optional) The number of seconds the calculation may
+            run for.
+        mc_stderr: The Monte Carlo standard error of the simulated power.
+        n_sims: The number of simulations behind the simulated power.
+    """
 
     # Parameters controling the simulation of power
     _N_SIMS = 1000
@@ -18,49 +65,81 @@ class Normal(PowerBase):
     _maxN = 1000
 
     def __init__(self, n=None, alpha=None, beta=None, power=None, method=None,
-                 dist=None, seed=None, **kwargs):
+                 dist=None, seed=None, vectorized=None,
+                 common_random_numbers=None, n_jobs=None, adaptive=None,
+                 time_budget=None, **kwargs):
+        are_scalars(n=n, alpha=alpha, beta=beta, power=power)
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
         self.n = n
 
-        if dist in dir(stats):
+        if _is_distribution(dist):
             self.dist = getattr(stats, dist)(**kwargs)
+        else:
+            raise ValueError('{} is not a valid distribution'.format(dist))
 
         if seed is None:
             self.seed = self._SEED
         else:
             self.seed = seed
 
+        if vectorized is None:
+            vectorized = True
+        else:
+            is_boolean(vectorized, 'vectorized')
+
+        if common_random_numbers is None:
+            common_random_numbers = False
+        else:
+            is_boolean(common_random_numbers, 'common_random_numbers')
+        self.common_random_numbers = common_random_numbers
+        self._stream = None
+
+        if n_jobs is not None:
+            is_integer(n_jobs, 'n_jobs')
+        self.n_jobs = n_jobs
+
+        # batch_test is the version of normal_test that tests every row of a
+        # matrix of samples at once.  It is None if there is no such version.
+        batch_test = None
         if method == 'anderson' or method == 'anderson-darling':
             # Need to figure out how to do this right
             raise ValueError('{} is not a valid method'.format(method))
         elif method == 'kolmogorov-smirnov' or method == 'ks':
-            def norm_ks(rvs):
-                return stats.kstest(rvs, 'norm')
-            self.normal_test = norm_ks
+            self.normal_test = functools.partial(stats.kstest, cdf='norm')
+            batch_test = vectorized_tests.norm_kstest
         elif method == 'kurt' or method == 'kurtosis':
             self.normal_test = stats.kurtosistest
+            batch_test = vectorized_tests.kurtosistest
             self._minN = 20
         elif method == 'martinez-iglewicz':
             raise ValueError('{} is not a valid method'.format(method))
         elif method in ['normaltest', 'omnibus']:
             self.normal_test = stats.normaltest
+            batch_test = vectorized_tests.normaltest
             self._minN = 20
         elif method == 'range':
             raise ValueError('{} is not a valid method'.format(method))
         elif method in ['shapiro', 'sw', 'shapiro-wilks']:
             self.normal_test = stats.shapiro
+            batch_test = vectorized_tests.shapiro
         elif method in ['skew', 'skewness']:
             self.normal_test = stats.skewtest
+            batch_test = vectorized_tests.skewtest
             self._minN = 8
         else:
             raise ValueError('{} is not a valid method'.format(method))
+        self._batch_test = batch_test
+        self.vectorized = vectorized and batch_test is not None
 
         # Initialize the remaining arguments through the parent.
         super(Normal, self).__init__(alpha=alpha, power=power,
-                                     beta=beta, hypothesis=None)
+                                     beta=beta, hypothesis=None,
+                                     adaptive=adaptive,
+                                     time_budget=time_budget)
 
     def calculate(self):
+        self._start_clock()
         if self.n is None:
             self._set_default_alpha()
             self._set_default_power()
@@ -70,6 +149,7 @@ class Normal(PowerBase):
             self._calculate_power()
         elif self.alpha is None:
             self._calculate_alpha()
+        self._set_simulation_error(self.n)
 
     def _calculate_n(self):
         """ Perfrom the power calculation """
@@ -85,12 +165,12 @@ class Normal(PowerBase):
 
         found_solution = False
         # Find power at endpoints
-        lag_lower = (self._minN, self._power_internals(self._minN, alpha))
+        lag_lower = (self._minN, self._power_internals(self._minN, alpha, power))
         if lag_lower[1] > power:
             self.power = lag_lower[1]
             self.n = lag_lower[0]
             return
-        lag_upper = (self._maxN, self._power_internals(self._maxN, alpha))
+        lag_upper = (self._maxN, self._power_internals(self._maxN, alpha, power))
 
         if lag_lower[1] > lag_upper[1]:
             # I
@@ -108,7 +188,7 @@ class Normal(PowerBase):
         while True:
             delta_n = lag_upper[0] - lag_lower[0]
             test_n = math.floor(delta_n / 2) + lag_lower[0]
-            test_power = self._power_internals(test_n, alpha)
+            test_power = self._power_internals(test_n, alpha, power)
             if test_power < power:
                 # Look at upper half of what's left
                 lag_lower = (test_n, test_power)
@@ -148,20 +228,40 @@ class Normal(PowerBase):
         else:
             power = self.power
 
-        p_vals = []
-        for sim in range(self._N_SIMS):
-            res = self.dist.rvs(size=self.n, random_state=self.seed * sim)
-
-            _, p_val = self.normal_test(res)
-            p_vals.append(p_val)
-        p_vals.sort()
-        self.alpha = p_vals[int(self._N_SIMS * power) - 1]
-
-    def _power_internals(self, n, alpha):
-        count = 0
-        for sim in range(self._N_SIMS):
-            res = self.dist.rvs(size=n, random_state=self.seed * sim)
-            _, p_val = self.normal_test(res)
-            if p_val < alpha:
-                count += 1
-        return count / self._N_SIMS
+        p_vals = numpy.sort(self._simulate_p_values(self.n))
+        self.alpha = float(p_vals[int(self._N_SIMS * power) - 1])
+        self._power_estimate(self.n, p_vals, self.alpha)
+
+    def _power_internals(self, n, alpha, target=None):
+        stop = self._stopping_rule(alpha, target)
+        p_vals = self._simulate_p_values(n, stop)
+        return self._power_estimate(n, p_vals, alpha)
+
+    def _simulate_p_values(self, n, stop=None):
+        """ Simulate `_N_SIMS` samples of size `n` and test each of them.
+
+        In vectorized mode, each block of samples is drawn as a single
+        matrix and tested along its rows.  Otherwise, the samples are tested
+        one at a time.  With common random numbers, the samples are the
+        first `n` columns of a shared stream.  If `stop` is given, the
+        simulations end once it returns True.
+
+        This is an internal method only.
+        """
+        if self.vectorized:
+            test = self._batch_test
+        else:
+            test = self.normal_test
+
+        if self.common_random_numbers:
+            if self._stream is None:
+                self._stream = CommonRandomNumbers(self.dist, self._N_SIMS,
+                                                   self.seed)
+            return map_rows(row_p_values, self._stream.sample(n),
+                            n_jobs=self.n_jobs,
+                            args=(test, self.vectorized), stop=stop)
+
+        return simulate(sample_p_values, self._N_SIMS, self.seed,
+                        n_jobs=self.n_jobs,
+                        args=(self.dist, n, test, self.vectorized),
+                        stop=stop)
@@ -0,0 +1,171 @@
+""" Goodness of fit tests that operate on a whole matrix of simulated samples.
+
+Each function takes an array whose last axis holds the observations of a
+single sample and returns the test statistics and p-values for every sample
+at once.  This avoids calling the scipy tests once per simulated sample.
+"""
+import functools
+import math
+import numpy
+from skdesign._lazy import lazy_import
+
+stats = lazy_import('scipy.stats')
+
+# Polynomial coefficients from Royston (1995), Algorithm AS R94.  They are
+# listed from the constant term upwards.
+_C1 = [0.0, 0.221157, -0.147981, -2.071190, 4.434685, -2.706056]
+_C2 = [0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633]
+_C3 = [0.5440, -0.39978, 0.025054, -6.714e-4]
+_C4 = [1.3822, -0.77857, 0.062767, -0.0020322]
+_C5 = [-1.5861, -0.31082, -0.083751, 0.0038915]
+_C6 = [-0.4803, -0.082676, 0.0030302]
+_G = [-2.273, 0.459]
+
+
+def kstest(sample, cdf):
+    """ The one sample Kolmogorov-Smirnov test along the last axis.
+
+    The p-values are the exact two-sided p-values, which is what
+    `scipy.stats.kstest` uses for the sample sizes considered here.
+
+    Arguments:
+        sample: an array of observations.  Each sample is along the last
+            axis.
+        cdf: the cumulative distribution function of the reference
+            distribution.
+
+    Returns:
+        A tuple of arrays with the statistics and the p-values.
+    """
+    sample = numpy.sort(sample, axis=-1)
+    n = sample.shape[-1]
+    cdf_values = cdf(sample)
+    upper = numpy.arange(1, n + 1) / n - cdf_values
+    lower = cdf_values - numpy.arange(0, n) / n
+    statistic = numpy.maximum(upper.max(axis=-1), lower.max(axis=-1))
+    p_value = numpy.clip(stats.kstwo.sf(statistic, n), 0, 1)
+    return statistic, p_value
+
+
+def norm_kstest(sample):
+    """ The Kolmogorov-Smirnov test against the standard normal distribution
+    along the last axis.
+    """
+    return kstest(sample, stats.norm.cdf)
+
+
+def skewtest(sample):
+    """ The skewness test along the last axis. """
+    return stats.skewtest(sample, axis=-1)
+
+
+def kurtosistest(sample):
+    """ The kurtosis test along the last axis. """
+    return stats.kurtosistest(sample, axis=-1)
+
+
+def normaltest(sample):
+    """ D'Agostino and Pearson's omnibus test along the last axis. """
+    return stats.normaltest(sample, axis=-1)
+
+
+def _poly(coefficients, x):
+    """ Evaluate a polynomial whose coefficients start at the constant term """
+    return sum(c * x**i for i, c in enumerate(coefficients))
+
+
+@functools.lru_cache(maxsize=None)
+def shapiro_coefficients(n):
+    """ The Shapiro-Wilk coefficients for a sample of size `n`.
+
+    The coefficients are Royston's approximations.  Only the first half are
+    returned, since the second half are the same with the opposite sign.
+    They are cached, so they are calculated once per sample size.
+
+    Arguments:
+        n: the sample size.  It must be at least 3.
+
+    Returns:
+        An array of length `n // 2` for the smallest order statistics.
+    """
+    if n < 3:
+        raise ValueError('`n` must be at least 3.')
+    if n == 3:
+        return numpy.array([math.sqrt(0.5)])
+
+    half = n // 2
+    m = stats.norm.ppf((numpy.arange(1, half + 1) - 0.375) / (n + 0.25))
+    summ2 = 2 * numpy.sum(m**2)
+    ssumm2 = math.sqrt(summ2)
+    rsn = 1 / math.sqrt(n)
+
+    a_1 = _poly(_C1, rsn) - m[0] / ssumm2
+    if n > 5:
+        a_2 = _poly(_C2, rsn) - m[1] / ssumm2
+        fac = math.sqrt((summ2 - 2 * m[0]**2 - 2 * m[1]**2) /
+                        (1 - 2 * a_1**2 - 2 * a_2**2))
+        a = -m / fac
+        a[1] = a_2
+    else:
+        fac = math.sqrt((summ2 - 2 * m[0]**2) / (1 - 2 * a_1**2))
+        a = -m / fac
+    a[0] = a_1
+    return a
+
+
+def shapiro(sample):
+    """ The Shapiro-Wilk test along the last axis.
+
+    The statistic is calculated from Royston's coefficients with a single
+    matrix-vector product over the sorted samples, and the p-values use
+    Royston's normalizing transformations.
+
+    Arguments:
+        sample: an array of observations.  Each sample is along the last
+            axis and must have at least 3 observations.
+
+    Returns:
+        A tuple of arrays with the statistics and the p-values.
+    """
+    sample = numpy.sort(sample, axis=-1)
+    n = sample.shape[-1]
+    a = shapiro_coefficients(n)
+    half = len(a)
+
+    # The coefficients are antisymmetric so only the difference between the
+    # upper and lower order statistics is needed.
+    spread = sample[..., ::-1][..., :half] - sample[..., :half]
+    numerator = (spread @ a)**2
+    centered = sample - sample.mean(axis=-1, keepdims=True)
+    denominator = numpy.sum(centered**2, axis=-1)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        w = numpy.clip(numerator / denominator, 0, 1)
+    return w, shapiro_p_value(w, n)
+
+
+def shapiro_p_value(w, n):
+    """ Royston's p-values for Shapiro-Wilk statistics `w` from samples of
+    size `n`.
+    """
+    w = numpy.asarray(w, dtype=float)
+    if n == 3:
+        p_value = 6 / math.pi * (numpy.arcsin(numpy.sqrt(w)) -
+                                 math.asin(math.sqrt(0.75)))
+        return numpy.clip(p_value, 0, 1)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        y = numpy.log1p(-w)
+        if n <= 11:
+            gamma = _poly(_G, n)
+            m = _poly(_C3, n)
+            s = math.exp(_poly(_C4, n))
+            # Statistics beyond gamma are too extreme for the transformation
+            # and are significant at any level.
+            z = numpy.where(y < gamma, -numpy.log(gamma - y), numpy.inf)
+        else:
+            log_n = math.log(n)
+            m = _poly(_C5, log_n)
+            s = math.exp(_poly(_C6, log_n))
+            z = y
+        p_value = stats.norm.sf((z - m) / s)
+    return numpy.where(numpy.isnan(w), numpy.nan, p_value)
@@ -0,0 +1,187 @@
+""" Power functions with the constants of a hypothesis worked out once.
+
+The `power_function()` method of a hypothesis returns one of these objects.
+Calling it with a sample size gives the power, and its `n` method gives the
+smallest sample size with a given power.  It skips the argument checking
+and the set up of the hypothesis classes, so it is cheap to call many
+times, for example inside a cost optimizer.  Both methods accept numbers
+or arrays, and the objects can be pickled and sent to other processes.
+
+The sample size is the one the hypothesis searches over, which is the size
+of group 2 for the parallel designs.
+"""
+import numpy
+from skdesign.power import ceil
+from skdesign.power import numerics
+from skdesign.power.means import tost
+from skdesign.power.search import vectorized_search
+
+
+class PowerFunction(object):
+    """ The base for power functions.
+
+    Each power function defines `power(n)`, the power at the sample size
+    `n`, which is a number or an array.  Calling the object calls it.
+
+    Attributes:
+        alpha: The :math:`\\alpha` level of the test.
+    """
+
+    # Parameters controling the search for n.
+    _minN = 2
+    _maxN = 10**7
+
+    def __call__(self, n):
+        return self.power(n)
+
+    def n(self, power):
+        """ The smallest sample size with at least the power `power`.
+
+        Arguments:
+            power: the required power, as a number or an array.
+
+        Returns:
+            The sample size, as an integer or an array of integers.
+        """
+        return vectorized_search(self.power, power, self._start(power),
+                                 self._minN, self._maxN).n
+
+    def _start(self, power):
+        """ The first guess for the sample size with power `power`.
+
+        This is an internal method only.
+        """
+        return self._minN
+
+
+class NormalPower(PowerFunction):
+    """ The power of a z test whose statistic has mean
+    :math:`\\theta \\sqrt{n}`.
+
+    Attributes:
+        theta: :math:`\\theta`, the effect size per unit of
+            :math:`\\sqrt{n}`.
+        alpha: The :math:`\\alpha` level of the test.
+        z_alpha: The critical value of the test.
+    """
+
+    def __init__(self, theta, alpha, alpha_adjustment=1, beta_adjustment=1):
+        self.theta = theta
+        self.alpha = alpha
+        self._beta_adjustment = beta_adjustment
+        self.z_alpha = numerics.norm_ppf(1 - alpha / alpha_adjustment)
+
+    def power(self, n):
+        z_beta = numpy.sqrt(n) * self.theta - self.z_alpha
+        return 1 - (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
+
+    def n(self, power):
+        return ceil(self._start(power))
+
+    def _start(self, power):
+        """ The continuous sample size with power `power`.
+
+        This is an internal method only.
+        """
+        z_beta = numerics.norm_ppf(1 - (1 - power) / self._beta_adjustment)
+        with numpy.errstate(divide='ignore'):
+            return (self.z_alpha + z_beta)**2 / numpy.square(self.theta)
+
+
+class StudentPower(PowerFunction):
+    """ The power of a t test, from the `_calculate_power_unknown` static
+    method of a hypothesis on means.
+
+    Attributes:
+        alpha: The :math:`\\alpha` level of the test.
+        theta: :math:`\\theta`, the effect size per unit of
+            :math:`\\sqrt{n}`.
+        function: The static method, which is called as
+            `function(n, alpha, theta, *args, alpha_adjustment,
+            beta_adjustment)`.
+        args: The extra arguments of the static method, such as the ratio of
+            the group sizes.
+    """
+
+    def __init__(self, function, alpha, theta, args=(), alpha_adjustment=1,
+                 beta_adjustment=1, minimum=None, maximum=None):
+        self.function = function
+        self.alpha = alpha
+        self.theta = theta
+        self.args = tuple(args)
+        self._alpha_adjustment = alpha_adjustment
+        self._beta_adjustment = beta_adjustment
+        # The sample size with a known standard deviation starts the search.
+        self._normal = NormalPower(numpy.abs(theta), alpha, alpha_adjustment,
+                                   beta_adjustment)
+        if minimum is not None:
+            self._minN = minimum
+        if maximum is not None:
+            self._maxN = maximum
+
+    def power(self, n):
+        return self.function(n, self.alpha, self.theta, *(
+            self.args + (self._alpha_adjustment, self._beta_adjustment)))
+
+    def _start(self, power):
+        return self._normal._start(power)
+
+
+class TostPower(PowerFunction):
+    """ The exact power of the two one-sided tests for equivalence in a 2x2
+    crossover, as in `skdesign.power.means.tost`.
+
+    Attributes:
+        alpha: The :math:`\\alpha` level of each one-sided test.
+        theta: :math:`\\theta`, the noncentrality of the upper test per
+            unit of :math:`\\sqrt{n}`.
+        theta_width: The sum of the noncentralities of the two tests per
+            unit of :math:`\\sqrt{n}`.
+    """
+
+    def __init__(self, alpha, theta, theta_width, minimum=None,
+                 maximum=None):
+        self.alpha = alpha
+        self.theta = theta
+        self.theta_width = theta_width
+        self._normal = NormalPower(numpy.abs(theta), alpha, 1, 2)
+        if minimum is not None:
+            self._minN = minimum
+        if maximum is not None:
+            self._maxN = maximum
+
+    def power(self, n):
+        root_n = numpy.sqrt(n)
+        return tost.power(self.alpha, 2 * numpy.asarray(n) - 2,
+                          root_n * (self.theta_width - self.theta),
+                          root_n * self.theta)
+
+    def _start(self, power):
+        return self._normal._start(power)
+
+
+class ChiSquarePower(PowerFunction):
+    """ The power of a chi-squared test whose noncentrality is
+    :math:`n \\cdot effect`.
+
+    Attributes:
+        df: The degrees of freedom of the test.
+        effect: The noncentrality per subject.
+        alpha: The :math:`\\alpha` level of the test.
+        quantile: The critical value of the test.
+    """
+
+    def __init__(self, df, effect, alpha):
+        self.df = df
+        self.effect = effect
+        self.alpha = alpha
+        self.quantile = numerics.chi2_ppf(1 - alpha, df)
+
+    def power(self, n):
+        return 1 - numerics.ncx2_cdf(self.quantile, self.df,
+                                     numpy.asarray(n) * self.effect)
+
+    def n(self, power):
+        delta = numerics.noncentrality(self.df, self.alpha, power)
+        with numpy.errstate(divide='ignore'):
+            return ceil(delta / self.effect)
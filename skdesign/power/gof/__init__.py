@@ -1,8 +1,12 @@
-from .gof import GofBase
-from .pearson import Pearson
-from .pearson_independance import PearsonIndependance
-from .cmh import CMH
-from .likelihood_ratio import LikelihoodRatio
-from .stuart_maxwell import StuartMaxwell
-from .mcnemar import McNemar
-from .carry_over_effect import CarryOverEffect
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'GofBase': 'gof',
+    'Pearson': 'pearson',
+    'PearsonIndependance': 'pearson_independance',
+    'CMH': 'cmh',
+    'LikelihoodRatio': 'likelihood_ratio',
+    'StuartMaxwell': 'stuart_maxwell',
+    'McNemar': 'mcnemar',
+    'CarryOverEffect': 'carry_over_effect'
+})
@@ -1,10 +1,11 @@
 from skdesign.power import (PowerBase,
+                            are_scalars,
                             is_in_0_1,
                             is_integer,
                             is_numeric,
                             is_positive)
 import math
-import scipy.stats as stats
+from skdesign.power import numerics
 
 
 class CarryOverEffect(PowerBase):
@@ -38,6 +39,9 @@ class CarryOverEffect(PowerBase):
     def __init__(self, n=None, alpha=None, beta=None, power=None,
                  p_11=None, p_12=None, p_21=None, p_22=None,
                  gamma=None, stdev_1=None, stdev_2=None):
+        are_scalars(n=n, alpha=alpha, beta=beta, power=power, p_11=p_11,
+                    p_12=p_12, p_21=p_21, p_22=p_22, gamma=gamma,
+                    stdev_1=stdev_1, stdev_2=stdev_2)
 
         if gamma is None:
             is_in_0_1(p_11, 'p_11 should be in [0, 1].')
@@ -86,9 +90,8 @@ class CarryOverEffect(PowerBase):
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
 
         n = (z_alpha + z_beta)**2 / self.theta**2
         self.n = math.ceil(n)
@@ -99,20 +102,18 @@ class CarryOverEffect(PowerBase):
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
         z_alpha = math.sqrt(self.n) * self.theta - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
         z_beta = math.sqrt(self.n) * self.theta - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
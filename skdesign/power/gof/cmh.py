@@ -1,8 +1,11 @@
 from skdesign.power.gof import GofBase
-from skdesign.power import (is_in_0_1,
-                            is_integer)
+from skdesign.power import (is_integer,
+                            are_scalars,
+                            to_probabilities)
 import math
-import scipy.stats as stats
+import numpy
+from skdesign.power import numerics
+from skdesign.power.functions import NormalPower
 
 
 class CMH(GofBase):
@@ -18,32 +21,35 @@ class CMH(GofBase):
             :math:`1 - power`).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
-        p: A list of lists of lists of observed probabilities.  The depth of
-            the inception is the number of strata
+        p: The observed probabilities as a (strata, 2, 2) array, or as a
+            list of 2 x 2 lists with one for each stratum.
         pi: The proportion of subjects in each strata
     """
     def __init__(self, n=None, alpha=None, beta=None, power=None, p=None,
                  pi=None):
-        self._check_list(p, 'p')
+        are_scalars(n=n)
+        p = to_probabilities(p, 'p', 3)
+        if p.shape[1:] != (2, 2):
+            raise ValueError("Each stratum of `p` must be a 2 x 2 table")
+        self.p = p
 
         if pi is None:
-            pi = [1 / float(len(p))] * len(p)
+            pi = numpy.full(len(p), 1 / float(len(p)))
         else:
-            self._check_list(pi, 'pi')
+            pi = to_probabilities(pi, 'pi', 1)
+            if len(pi) != len(p):
+                raise ValueError("`pi` must have one value for each stratum")
+        self.pi = pi
 
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
         self.n = n
 
-        num = 0
-        denom = 0
-        for stratum in range(len(p)):
-            rowsums = [sum(p[stratum][0]), sum(p[stratum][1])]
-            colsums = [p[stratum][0][0] + p[stratum][1][0],
-                       p[stratum][0][1] + p[stratum][1][1]]
-            num += pi[stratum] * (p[stratum][0][0] - rowsums[0] * colsums[0])
-            denom += (pi[stratum] * rowsums[0] * rowsums[1] *
-                      colsums[0] * colsums[1])
+        rowsums = p.sum(axis=2)
+        colsums = p.sum(axis=1)
+        num = numpy.sum(pi * (p[:, 0, 0] - rowsums[:, 0] * colsums[:, 0]))
+        denom = numpy.sum(pi * rowsums[:, 0] * rowsums[:, 1] *
+                          colsums[:, 0] * colsums[:, 1])
 
         self.delta = num / math.sqrt(denom)
         self.n = n
@@ -63,14 +69,23 @@ class CMH(GofBase):
         elif self.alpha is None:
             self._calculate_alpha_known()
 
+    def power_function(self):
+        """ The power as a function of n, with the constants of the
+        hypothesis worked out once.  :math:`\\alpha` defaults to 0.05.
+
+        Returns:
+            A `skdesign.power.functions.NormalPower`.
+        """
+        self._set_default_alpha()
+        return NormalPower(self.delta, self.alpha, 2)
+
     def _calculate_n_known(self):
         """ Calculate n
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = distribution.ppf(1 - self.beta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         n = (z_alpha + z_beta)**2 / self.delta**2
         self.n = math.ceil(n)
@@ -80,33 +95,18 @@ class CMH(GofBase):
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta)
+        z_beta = numerics.norm_ppf(1 - self.beta)
         z_alpha = math.sqrt(self.n) * self.delta - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * 2.0
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * 2.0
 
     def _calculate_power_known(self):
         """ Calculate power
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
         z_beta = math.sqrt(self.n) * self.delta - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta))
+        self.beta = (1 - numerics.norm_cdf(z_beta))
         self.power = 1 - self.beta
-
-    def _check_list(self, lst, label):
-        """ Recursively check the lists in lst """
-        if isinstance(lst, list):
-            for values in lst:
-                if isinstance(values, list):
-                    self._check_list(values, label=label)
-                else:
-                    is_in_0_1(values,
-                              ('All values of ' + label +
-                               'p should be in (0, 1).'))
-        else:
-            raise ValueError("`p` must be a list of lists of numerics")
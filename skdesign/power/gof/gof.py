@@ -1,5 +1,7 @@
-from skdesign.power import PowerBase
-import scipy.stats as stats
+from skdesign.power import (PowerBase,
+                            are_scalars)
+from skdesign.power import numerics
+from skdesign.power.functions import ChiSquarePower
 
 
 class GofBase(PowerBase):
@@ -16,11 +18,33 @@ class GofBase(PowerBase):
     """
 
     def __init__(self, alpha=None, beta=None, power=None):
+        are_scalars(alpha=alpha, beta=beta, power=power)
         # Error handling is handled at the Hypothesis level.
         super(GofBase, self).__init__(alpha=alpha, beta=beta, power=power)
 
+    def power_function(self):
+        """ The power as a function of n, with the constants of the
+        hypothesis worked out once.  It needs the degrees of freedom `df`
+        and the noncentrality per subject `_denom` of the test.
+        :math:`\\alpha` defaults to 0.05.
+
+        Returns:
+            A `skdesign.power.functions.ChiSquarePower`.
+        """
+        self._set_default_alpha()
+        return ChiSquarePower(self.df, self._denom, self.alpha)
+
     @staticmethod
     def _beta(df, delta, alpha):
-        q = stats.chi2.ppf(1 - alpha, df=df)
-        beta = stats.ncx2.cdf(q, df=df, nc=delta)
+        q = numerics.chi2_ppf(1 - alpha, df=df)
+        beta = numerics.ncx2_cdf(q, df=df, nc=delta)
         return beta
+
+    @staticmethod
+    def _delta(df, alpha, power):
+        """ The noncentrality at which the test has power `power`, which
+        inverts `_beta` directly.
+
+        This is an internal static method only.
+        """
+        return numerics.noncentrality(df, alpha, power)
@@ -1,8 +1,10 @@
 from skdesign.power import (PowerBase,
+                            ceil,
                             is_in_0_1,
-                            is_integer)
-import math
-import scipy.stats as stats
+                            is_integer,
+                            to_probabilities)
+import numpy
+from skdesign.power import numerics
 
 
 class McNemar(PowerBase):
@@ -20,12 +22,21 @@ class McNemar(PowerBase):
             :math:`1 - power`).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
-        p_01: The value of :math:`p_{01}`
-        p_10: The value of :math:`p_{10}`
+        p_01: The value of :math:`p_{01}`.  It can be an array.
+        p_10: The value of :math:`p_{10}`.  It can be an array.
+        p: (optional) The 2 x 2 table of probabilities, or an array of
+            tables with the tables in the last two dimensions.  If it is
+            given, :math:`p_{01}` and :math:`p_{10}` are read from it.
     """
     def __init__(self, n=None, alpha=None, beta=None, power=None, p_01=None,
-                 p_10=None):
-
+                 p_10=None, p=None):
+
+        if p is not None:
+            p = to_probabilities(p, 'p')
+            if p.shape[-2:] != (2, 2):
+                raise ValueError("`p` must be a 2 x 2 table")
+            p_01 = p[..., 0, 1]
+            p_10 = p[..., 1, 0]
         is_in_0_1(p_01, 'p_01 should be in [0, 1].')
         is_in_0_1(p_10, 'p_10 should be in [0, 1].')
 
@@ -35,8 +46,8 @@ class McNemar(PowerBase):
 
         self.p_01 = p_01
         self.p_10 = p_10
-        self.alpha_factor = math.sqrt(p_01 + p_10)
-        self.beta_factor = math.sqrt(p_10 + p_01 - (p_01 - p_10)**2)
+        self.alpha_factor = numpy.sqrt(p_01 + p_10)
+        self.beta_factor = numpy.sqrt(p_10 + p_01 - (p_01 - p_10)**2)
 
         # Set remaining variables.
         super(McNemar, self).__init__(alpha=alpha, beta=beta, power=power)
@@ -58,35 +69,32 @@ class McNemar(PowerBase):
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = distribution.ppf(1 - self.beta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         n = ((z_alpha * self.alpha_factor + z_beta * self.beta_factor)**2 /
              (self.p_10 - self.p_01)**2)
-        self.n = math.ceil(n)
+        self.n = ceil(n)
 
     def _calculate_alpha_known(self):
         """ Calculate :math:`\\alpha`
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta)
-        z_alpha = (math.sqrt(self.n) * abs(self.p_10 - self.p_01) -
+        z_beta = numerics.norm_ppf(1 - self.beta)
+        z_alpha = (numpy.sqrt(self.n) * numpy.abs(self.p_10 - self.p_01) -
                    z_beta * self.beta_factor) / self.alpha_factor
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * 2.0
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * 2.0
 
     def _calculate_power_known(self):
         """ Calculate power
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = (math.sqrt(self.n) * abs(self.p_10 - self.p_01) -
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = (numpy.sqrt(self.n) * numpy.abs(self.p_10 - self.p_01) -
                   z_alpha * self.alpha_factor) / self.beta_factor
 
-        self.beta = (1 - stats.norm.cdf(z_beta))
+        self.beta = (1 - numerics.norm_cdf(z_beta))
         self.power = 1 - self.beta
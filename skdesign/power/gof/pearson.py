@@ -1,8 +1,9 @@
 from skdesign.power.gof import GofBase
-from skdesign.power import (is_in_0_1,
-                            is_integer)
+from skdesign.power import (is_integer,
+                            are_scalars,
+                            to_probabilities)
 import math
-import scipy.optimize as optimize
+import numpy
 
 
 class Pearson(GofBase):
@@ -22,28 +23,21 @@ class Pearson(GofBase):
             :math:`1 - power`).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
-        p_0: A list of expected probabilities
-        p: A list of observed probabilities
+        p_0: A list or an array of expected probabilities
+        p: A list or an array of observed probabilities
     """
     def __init__(self, n=None, alpha=None, beta=None, power=None,
                  p_0=None, p=None):
-        if isinstance(p, list):
-            for value in p:
-                is_in_0_1(value, 'All values of p should be in (0, 1).')
-        else:
-            raise ValueError("`p` must be a list of Numerics.")
-        self.p = p
+        are_scalars(n=n)
+        self.p = to_probabilities(p, 'p', 1)
+        self.p_0 = to_probabilities(p_0, 'p_0', 1)
 
-        if isinstance(p_0, list):
-            for value in p_0:
-                is_in_0_1(value, 'All values of p_0 should be in (0, 1).')
-        else:
-            raise ValueError("`p_0` must be a list of Numerics.")
-        self.p_0 = p_0
-
-        if not len(p) == len(p_0):
+        if not len(self.p) == len(self.p_0):
             raise ValueError("`p_0` and `p` must have the same length.")
 
+        self.df = len(self.p) - 1
+        self._denom = numpy.sum((self.p - self.p_0)**2 / self.p_0)
+
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
         self.n = n
@@ -52,11 +46,6 @@ class Pearson(GofBase):
         super(Pearson, self).__init__(alpha=alpha, beta=beta, power=power)
 
     def calculate(self):
-        p = self.p
-        p_0 = self.p_0
-
-        denom = sum([(i - j)**2 / j for i, j in zip(p, p_0)])
-
         if self.n is None:
             if self.alpha is None:
                 self.alpha = 0.05
@@ -65,11 +54,8 @@ class Pearson(GofBase):
             else:
                 power = self.power
             beta = 1 - power
-            df = len(p) - 1
-            delta = optimize.brenth(lambda delta:
-                                    self._beta(df, delta, self.alpha) - beta,
-                                    a=1e-7, b=1e4)
-            n = delta / denom
+            delta = self._delta(self.df, self.alpha, power)
+            n = delta / self._denom
             self.n = math.ceil(n)
             self.beta = beta
             self.power = power
@@ -1,8 +1,9 @@
 from skdesign.power.gof import GofBase
-from skdesign.power import (is_in_0_1,
-                            is_integer)
+from skdesign.power import (is_integer,
+                            are_scalars,
+                            to_probabilities)
 import math
-import scipy.optimize as optimize
+import numpy
 
 
 class PearsonIndependance(GofBase):
@@ -18,40 +19,20 @@ class PearsonIndependance(GofBase):
             :math:`1 - power`).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
-        p: A list of lists of observed probabilities.
+        p: A list of lists or a two dimensional array of observed
+            probabilities.
     """
     def __init__(self, n=None, alpha=None, beta=None, power=None, p=None):
-        # This should be made much better (see CMH)
-        if isinstance(p, list):
-            for values in p:
-                if isinstance(values, list):
-                    for value in values:
-                        is_in_0_1(value,
-                                  'All values of p should be in (0, 1).')
-                else:
-                    raise ValueError("Each list in `p` must be a list "
-                                     "of numerics")
-        else:
-            raise ValueError("`p` must be a list of lists  of numerics")
+        are_scalars(n=n)
+        p = to_probabilities(p, 'p', 2)
         self.p = p
 
         # needed for degree of freedom calculations
-        rows = len(p)
-        cols = len(p[0])
+        rows, cols = p.shape
         self.df = (rows - 1) * (cols - 1)
-        self._denom = 0
 
-        # This will be much improved when I implement this as a matrix!
-        colsums = [0] * cols
-        for i in range(rows):
-            for j in range(cols):
-                colsums[j] += p[i][j]
-
-        for i in range(rows):
-            rowsum = sum(p[i])
-            for j in range(cols):
-                self._denom += ((p[i][j] - rowsum * colsums[j])**2 /
-                                (rowsum * colsums[j]))
+        expected = numpy.outer(p.sum(axis=1), p.sum(axis=0))
+        self._denom = numpy.sum((p - expected)**2 / expected)
 
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
@@ -73,9 +54,7 @@ class PearsonIndependance(GofBase):
             beta = 1 - power
 
             df = self.df
-            delta = optimize.brenth(lambda delta:
-                                    self._beta(df, delta, self.alpha) - beta,
-                                    a=0.000001, b=1e7)
+            delta = self._delta(df, self.alpha, power)
             n = delta / self._denom
             self.n = math.ceil(n)
             self.beta = beta
@@ -1,8 +1,9 @@
 from skdesign.power.gof import GofBase
-from skdesign.power import (is_in_0_1,
-                            is_integer)
+from skdesign.power import (is_integer,
+                            are_scalars,
+                            to_probabilities)
 import math
-import scipy.optimize as optimize
+import numpy
 
 
 class StuartMaxwell(GofBase):
@@ -21,31 +22,20 @@ class StuartMaxwell(GofBase):
             :math:`1 - power`).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
-        p: The estimated probabilities as a list of lists.
+        p: The estimated probabilities as a list of lists or a square
+            array.
     """
     def __init__(self, n=None, alpha=None, beta=None, power=None, p=None):
-        # There should be a better way.
-        # This loop both checks the values for p and caclualtes a value needed
-        # for the calculation.
-        self._denom = 0
-        if isinstance(p, list):
-            len_p = len(p)
-            self.df = len_p * (len_p - 1) / 2.0
-            self._adjustment = 0
-            for i in range(len_p - 1):
-                if isinstance(p, list):
-                    for j in range(i, len_p):
-                        is_in_0_1(p[i][j],
-                                  'All values of p should be in [0, 1].')
-                        is_in_0_1(p[j][i],
-                                  'All values of p should be in [0, 1].')
-                        self._denom += ((p[i][j] - p[j][i])**2 /
-                                        (p[i][j] + p[j][i]))
-                else:
-                    raise ValueError("Each list in `p` must be a "
-                                     "list numerics")
-        else:
-            raise ValueError("`p` must be a list of lists  of numerics")
+        are_scalars(n=n)
+        p = to_probabilities(p, 'p', 2)
+        if p.shape[0] != p.shape[1]:
+            raise ValueError("`p` must be a square table")
+        self.p = p
+
+        len_p = len(p)
+        self.df = len_p * (len_p - 1) / 2.0
+        i, j = numpy.triu_indices(len_p, 1)
+        self._denom = numpy.sum((p[i, j] - p[j, i])**2 / (p[i, j] + p[j, i]))
 
         if n is not None:
             is_integer(n, '`n` should be of type Int.')
@@ -68,9 +58,7 @@ class StuartMaxwell(GofBase):
                 power = self.power
             beta = 1 - power
 
-            delta = optimize.brenth(lambda delta:
-                                    self._beta(df, delta, self.alpha) - beta,
-                                    a=0.00001, b=1e7)
+            delta = self._delta(df, self.alpha, power)
             n = delta / self._denom
             self.n = math.ceil(n)
             self.beta = beta
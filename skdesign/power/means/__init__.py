@@ -1,6 +1,10 @@
-from .means_base import MeansBase
-from .one_sample import OneSample
-from .two_sample_parallel import TwoSampleParallel
-from .two_sample_crossover import TwoSampleCrossover
-from .one_way_anova import OneWayAnova
-from .multi_sample_williams import MultiSampleWilliams
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'MeansBase': 'means_base',
+    'OneSample': 'one_sample',
+    'TwoSampleParallel': 'two_sample_parallel',
+    'TwoSampleCrossover': 'two_sample_crossover',
+    'OneWayAnova': 'one_way_anova',
+    'MultiSampleWilliams': 'multi_sample_williams'
+})
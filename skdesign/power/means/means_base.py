@@ -1,10 +1,15 @@
-import math
 from skdesign.power import (PowerBase,
+                            ceil,
                             is_integer,
                             is_numeric,
                             is_positive,
                             is_boolean)
-import scipy.stats as stats
+from skdesign.power.functions import (NormalPower,
+                                      StudentPower)
+from skdesign.power.search import (integer_search,
+                                   vectorized_root)
+from skdesign.power import numerics
+import numpy
 
 
 class MeansBase(PowerBase):
@@ -15,6 +20,14 @@ class MeansBase(PowerBase):
     hypothesis :math:`H_{0}: \\epsilon = 0` versus
     :math`H_{1}: \\epsilon \\ne 0`.
 
+    Any of the numeric parameters can be NumPy arrays.  They are broadcast
+    together and the calculated n, power or :math:`\\alpha` is an array
+    with the same values as the scalar calculations.
+
+    When :math:`\\epsilon` is None, the smallest :math:`\\epsilon` that is
+    detected with the power at n is calculated (the minimum detectable
+    effect).  :math:`\\alpha` and the power default to 0.05 and 0.8.
+
     Attributes:
         n: The sample size required to test the hypothesis at an
             :math:`\\alpha` level and a power of :math:`1 - \\beta`.
@@ -29,6 +42,11 @@ class MeansBase(PowerBase):
             :math:`1 - \\beta`).
     """
 
+    # Parameters controling the search for n when the standard deviation is
+    # unknown.
+    _minN = 2
+    _maxN = 10**7
+
     def __init__(self, n=None, epsilon=None, stdev=None, known_stdev=None,
                  alpha=None, beta=None, power=None, hypothesis=None):
 
@@ -38,13 +56,16 @@ class MeansBase(PowerBase):
         else:
             self.n = None
 
-        is_numeric(epsilon, 'epsilon')
-        self.epsilon = epsilon
-
         is_positive(stdev, 'stdev')
         self.stdev = stdev
 
-        self.theta = self.epsilon / self.stdev
+        # epsilon is calculated when it is None
+        if epsilon is not None:
+            is_numeric(epsilon, 'epsilon')
+            self.theta = epsilon / self.stdev
+        else:
+            self.theta = None
+        self.epsilon = epsilon
 
         if known_stdev is not None:
             is_boolean(known_stdev, 'known_stdev')
@@ -64,23 +85,150 @@ class MeansBase(PowerBase):
         This is an internal static method only.
         """
         nu = n - 1
-        ncp = math.sqrt(n) * abs(theta)
-        quantile = stats.t.ppf(1 - alpha / _alpha_adjustment, nu)
-        power = (1 - stats.nct.cdf(quantile, nu, ncp) +
-                 stats.nct.cdf(-1 * quantile, nu, ncp))
+        ncp = numpy.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.t_ppf(1 - alpha / _alpha_adjustment, nu)
+        power = (1 - numerics.nct_cdf(quantile, nu, ncp) +
+                 numerics.nct_cdf(-1 * quantile, nu, ncp))
         return power
 
+    @staticmethod
+    def _calculate_alpha_unknown(n, power, theta,
+                                 _alpha_adjustment, _beta_adjustment):
+        """ Calculate :math:`\\alpha` in the case that stdev is unknown.
+
+        The critical quantile is inverted directly from the noncentral t
+        distribution.  It is corrected once for the opposite tail, which only
+        matters when the power is small.  There is no opposite tail when the
+        quantile is not positive, and :math:`\\alpha` is then at least half
+        of `_alpha_adjustment`.
+
+        This is an internal static method only.
+        """
+        nu = n - 1
+        ncp = numpy.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.nct_ppf(1 - power, nu, ncp)
+        tail = numpy.where(quantile > 0,
+                           numerics.nct_cdf(-1 * quantile, nu, ncp), 0)
+        quantile = numerics.nct_ppf(1 - power + tail, nu, ncp)
+        return _alpha_adjustment * numerics.t_sf(quantile, nu)
+
+    def power_function(self):
+        """ The power as a function of n, with the constants of the
+        hypothesis worked out once.  :math:`\\alpha` defaults to 0.05.
+
+        Returns:
+            A `skdesign.power.functions.PowerFunction`.  Calling it with n
+            gives the power and its `n` method gives the smallest n with a
+            given power.
+        """
+        self._set_default_alpha()
+        if self.known_stdev:
+            return NormalPower(numpy.abs(self.theta), self.alpha,
+                               self._alpha_adjustment, self._beta_adjustment)
+        return StudentPower(self._calculate_power_unknown, self.alpha,
+                            self.theta, self._power_arguments(),
+                            self._alpha_adjustment, self._beta_adjustment,
+                            self._minN, self._maxN)
+
+    def _power_arguments(self):
+        """ The arguments of `_calculate_power_unknown` after
+        :math:`\\theta` other than the adjustments.
+
+        This is an internal method only.
+        """
+        return ()
+
+    def _power_n(self):
+        """ The sample size that the power is a function of.
+
+        This is an internal method only.
+        """
+        return self.n
+
+    def _calculate_effect(self):
+        """ Calculate the smallest :math:`\\theta`, and so
+        :math:`\\epsilon`, with the required power at n.
+
+        This is an internal method only.
+        """
+        if self._power_n() is None:
+            raise ValueError('`n` must be provided to calculate the effect')
+        self._set_default_alpha()
+        self._set_default_power()
+        self.theta = self._solve_theta(self._power_n())
+        self.epsilon = self.theta * self.stdev
+        self._set_effect()
+
+    def _solve_theta(self, n):
+        """ The smallest :math:`\\theta` with the required power at `n`.
+        It is the inverse of the normal power when the standard deviation is
+        known.  Otherwise that value brackets the root of the t power,
+        which needs a larger :math:`\\theta`.
+
+        This is an internal method only.
+        """
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        theta = (z_alpha + z_beta) / numpy.sqrt(n)
+        if self.known_stdev:
+            return theta
+        arguments = self._power_arguments() + (self._alpha_adjustment,
+                                               self._beta_adjustment)
+        theta, _ = vectorized_root(
+            lambda theta: self._calculate_power_unknown(n, self.alpha, theta,
+                                                        *arguments),
+            self.power, 0, theta)
+        return theta
+
+    def _set_effect(self):
+        """ Set the parameters of the hypothesis that give the calculated
+        :math:`\\epsilon`.  It is defined by each hypothesis.
+
+        This is an internal method only.
+        """
+        pass
+
+    def _normal_n(self, alpha, beta, theta):
+        """ The continuous sample size for a known standard deviation.
+
+        This is an internal method only.
+        """
+        z_alpha = numerics.norm_ppf(1 - alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - beta / self._beta_adjustment)
+        with numpy.errstate(divide='ignore'):
+            return (z_alpha + z_beta)**2 / theta**2
+
+    def _search_n(self, function, alpha, theta, power, *args):
+        """ The smallest integer n with `function(n, alpha, theta, *args)`
+        at least `power`, element by element when the parameters are arrays.
+
+        The search starts from the sample size for a known standard
+        deviation, which is close to the answer, and bisects over integers
+        so the power function is only evaluated a few times.
+
+        Returns:
+            A tuple of n and the power at n.
+
+        This is an internal method only.
+        """
+        def search(alpha, theta, power, *args):
+            start = self._normal_n(alpha, 1 - power, theta)
+            result = integer_search(lambda n: function(n, alpha, theta, *args),
+                                    power, start, self._minN, self._maxN)
+            return result.n, result.value
+        if all(numpy.ndim(value) == 0
+               for value in (alpha, theta, power) + args):
+            return search(alpha, theta, power, *args)
+        return numpy.vectorize(search, otypes=[int, float])(alpha, theta,
+                                                            power, *args)
+
     def _calculate_n_known(self):
         """ Calculate n in the case that the standard deviation is known.
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-
-        n = (z_alpha + z_beta)**2 / self.theta**2
-        self.n = math.ceil(n)
+        n = self._normal_n(self.alpha, self.beta, self.theta)
+        self.n = ceil(n)
 
     def _calculate_alpha_known(self):
         """ Calculate :math:`\\alpha` in the case that the standard deviation
@@ -88,20 +236,18 @@ class MeansBase(PowerBase):
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-        z_alpha = math.sqrt(self.n) * abs(self.theta) - z_beta
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numpy.sqrt(self.n) * numpy.abs(self.theta) - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
 
         This is an internal static method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = math.sqrt(self.n) * abs(self.theta) - z_alpha
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numpy.sqrt(self.n) * numpy.abs(self.theta) - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
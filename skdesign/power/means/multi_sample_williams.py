@@ -4,8 +4,9 @@ from skdesign.power import (PowerBase,
                             is_positive,
                             is_boolean)
 from skdesign.power.means import OneSample
-from scipy.optimize import brenth
-import scipy.stats as stats
+from skdesign.power.search import integer_search
+from skdesign.power import numerics
+import numpy
 
 
 class MultiSampleWilliams(PowerBase):
@@ -36,14 +37,22 @@ class MultiSampleWilliams(PowerBase):
             :math:`1` - power).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
+        pairwise_power: The power for each pair of means (i, j), i < j, in
+            the order of `numpy.triu_indices`, when the power is calculated.
 
     Note:
-        Currently, this function returns the best power and the best alpha when
-        power or alpha are unknown.  I don't think this is the best approach,
-        so it may change.  I may change it to return a power calculation for
-        each contrast.
+        When power or alpha are unknown, they are calculated for the pair of
+        means that limits the design, which is the pair that needs the
+        largest n.  The power of every pair is kept in `pairwise_power`.
+        A ValueError is raised when no alpha below 1 gives that pair the
+        required power.
     """
 
+    # Parameters controling the search for n when the standard deviation is
+    # unknown.
+    _minN = 2
+    _maxN = 10**7
+
     def __init__(self, n=None, mu=None, stdev=None, hypothesis=None,
                  margin=None, alpha=None, beta=None, power=None,
                  known_stdev=None):
@@ -83,6 +92,7 @@ class MultiSampleWilliams(PowerBase):
         else:
             margin = 0
         self.margin = float(margin)
+        self.pairwise_power = None
 
         # Initialize the remaining arguments (alpha, beta, power)
         # through the parent.
@@ -99,145 +109,140 @@ class MultiSampleWilliams(PowerBase):
         superclasses method.
         """
         nu = n_groups * (n - 1)
-        ncp = math.sqrt(n) * abs(theta)
-        quantile = stats.t.ppf(1 - alpha / _alpha_adjustment, nu)
-        power = (1 - stats.nct.cdf(quantile, nu, ncp) +
-                 stats.nct.cdf(-1 * quantile, nu, ncp))
+        ncp = math.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.t_ppf(1 - alpha / _alpha_adjustment, nu)
+        power = (1 - numerics.nct_cdf(quantile, nu, ncp) +
+                 numerics.nct_cdf(-1 * quantile, nu, ncp))
         return power
 
+    @staticmethod
+    def _calculate_alpha_unknown(n, power, theta, n_groups, _alpha_adjustment):
+        """ Calculate :math:`\\alpha` in the case that stdev is unknown.
+
+        The critical quantile is inverted directly from the noncentral t
+        distribution.  It is corrected once for the opposite tail, which only
+        matters when the power is small.  There is no opposite tail when the
+        quantile is not positive, and :math:`\\alpha` is then at least half
+        of `_alpha_adjustment`.
+
+        This is an internal static method only.
+        """
+        nu = n_groups * (n - 1)
+        ncp = math.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.nct_ppf(1 - power, nu, ncp)
+        tail = numpy.where(quantile > 0,
+                           numerics.nct_cdf(-1 * quantile, nu, ncp), 0)
+        quantile = numerics.nct_ppf(1 - power + tail, nu, ncp)
+        return _alpha_adjustment * numerics.t_sf(quantile, nu)
+
+    def _normal_n(self, theta):
+        """ The continuous sample size for a contrast when the standard
+        deviation is known.  It is the starting point for the search for n
+        when the standard deviation is unknown.
+
+        This is an internal method only.
+        """
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        if theta == 0:
+            return None
+        return (z_alpha + z_beta)**2 / theta**2
+
+    def _pairs(self):
+        """ The indices (i, j), i < j, of every pair of means and the effect
+        :math:`\\epsilon` of each pair under the hypothesis.
+
+        The effects are calculated for all pairs at once.  The sample size
+        and :math:`\\alpha` only depend on the pair with the smallest
+        :math:`|\\epsilon|`, so only that pair needs a full calculation.
+
+        This is an internal method only.
+        """
+        mu = numpy.asarray(self.mu)
+        i, j = numpy.triu_indices(self.n_groups, 1)
+        epsilon = numpy.abs(mu[i] - mu[j])
+        if self.hypothesis == 'superiority':
+            epsilon = epsilon - self.margin
+        elif self.hypothesis == 'equivalence':
+            epsilon = self.margin - epsilon
+        return i, j, epsilon
+
+    def _one_sample(self, i, j, **kwargs):
+        """ The one sample test for the pairs (`i`, `j`), which is what the
+        design collapses to when the standard deviation is known.
+
+        This is an internal method only.
+        """
+        mu = numpy.asarray(self.mu)
+        return OneSample(mu=mu[i], mu_0=mu[j], margin=self.margin,
+                         hypothesis=self.hypothesis,
+                         stdev=self.stdev / math.sqrt(self.k),
+                         known_stdev=True, **kwargs)
+
     def calculate(self):
         """ Performs the power calculation """
+        i, j, epsilon = self._pairs()
+        # The pair that needs the largest n, which limits the design.
+        hardest = numpy.argmin(numpy.abs(epsilon))
+        theta = epsilon * math.sqrt(self.k) / self.stdev
+
         if self.known_stdev:
             # When stdev is known, this collapses to a one sample test with
             # stdev = stdev / sqrt(k)
             if self.n is None:
-                n = 0
-                power = None
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = self.mu[i] - self.mu[j]
-                        one_sample = OneSample(mu=self.mu[i],
-                                               mu_0=self.mu[j],
-                                               margin=self.margin,
-                                               hypothesis=self.hypothesis,
-                                               stdev=(self.stdev /
-                                                      math.sqrt(self.k)),
-                                               known_stdev=self.known_stdev,
-                                               alpha=self.alpha,
-                                               power=self.power)
-                        one_sample.calculate()
-                        if one_sample.n > n:
-                            n = one_sample.n
-                            power = one_sample.power
-                self.n = n
-                self.power = power
+                one_sample = self._one_sample(i[hardest], j[hardest],
+                                              alpha=self.alpha,
+                                              power=self.power)
+                one_sample.calculate()
+                self.n = one_sample.n
+                self.power = one_sample.power
                 self.beta = 1 - self.power
             elif self.power is None:
-                power = 0
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = self.mu[i] - self.mu[j]
-                        one_sample = OneSample(n=self.n,
-                                               mu=self.mu[i],
-                                               mu_0=self.mu[j],
-                                               margin=self.margin,
-                                               hypothesis=self.hypothesis,
-                                               stdev=(self.stdev /
-                                                      math.sqrt(self.k)),
-                                               known_stdev=self.known_stdev,
-                                               alpha=self.alpha)
-                        one_sample.calculate()
-                        if one_sample.power > power:
-                            power = one_sample.power
-                self.power = power
+                one_sample = self._one_sample(i, j, n=self.n,
+                                              alpha=self.alpha)
+                one_sample.calculate()
+                self.pairwise_power = one_sample.power
+                self.power = self.pairwise_power.min()
                 self.beta = 1 - self.power
             elif self.alpha is None:
-                alpha = 1
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = self.mu[i] - self.mu[j]
-                        one_sample = OneSample(n=self.n,
-                                               mu=self.mu[i],
-                                               mu_0=self.mu[j],
-                                               margin=self.margin,
-                                               hypothesis=self.hypothesis,
-                                               stdev=(self.stdev /
-                                                      math.sqrt(self.k)),
-                                               known_stdev=self.known_stdev,
-                                               power=self.power)
-                        one_sample.calculate()
-                        if one_sample.alpha < alpha:
-                            alpha = one_sample.alpha
-                self.alpha = alpha
+                one_sample = self._one_sample(i[hardest], j[hardest],
+                                              n=self.n, power=self.power)
+                one_sample.calculate()
+                self.alpha = one_sample.alpha
+                self._check_alpha()
         else:
             # When stdev is unknown, this should collapse to a one sample test
             # but the degrees of freedom are different.
             if self.n is None:
-                n = 0
-                power = None
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = abs(self.mu[i] - self.mu[j])
-                        if self.hypothesis is 'superiority':
-                            epsilon = epsilon - self.margin
-                        elif self.hypothesis is 'equivalence':
-                            epsilon = self.margin - abs(epsilon)
-                        theta = epsilon * math.sqrt(self.k) / self.stdev
-                        res = brenth(lambda n:
-                                     self._calculate_power_unknown(n,
-                                                                   self.alpha,
-                                                                   theta,
-                                                                   self._alpha_adjustment,
-                                                                   self._beta_adjustment) -
-                                     self.power, a=2, b=1e7)
-                        test_n = math.ceil(res)
-                        test_power = self._calculate_power_unknown(test_n,
-                                                                   self.alpha,
-                                                                   theta,
-                                                                   self._alpha_adjustment,
-                                                                   self._beta_adjustment)
-                        if test_n > n:
-                            n = test_n
-                            power = test_power
-                self.n = n
-                self.power = power
+                result = integer_search(
+                    lambda n: self._calculate_power_unknown(
+                        n, self.alpha, theta[hardest], self.n_groups,
+                        self._alpha_adjustment),
+                    self.power, self._normal_n(theta[hardest]),
+                    self._minN, self._maxN)
+                self.n = result.n
+                self.power = result.value
             elif self.power is None:
-                power = 0
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = abs(self.mu[i] - self.mu[j])
-                        if self.hypothesis is 'superiority':
-                            epsilon = epsilon - self.margin
-                        elif self.hypothesis is 'equivalence':
-                            epsilon = self.margin - abs(epsilon)
-                        theta = epsilon * math.sqrt(self.k) / self.stdev
-                        test_power = self._calculate_power_unknown(self.n,
-                                                                   self.alpha,
-                                                                   theta,
-                                                                   self._alpha_adjustment,
-                                                                   self._beta_adjustment)
-                        if test_power > power:
-                            power = test_power
-                self.power = power
+                self.pairwise_power = self._calculate_power_unknown(
+                    self.n, self.alpha, theta, self.n_groups,
+                    self._alpha_adjustment)
+                self.power = self.pairwise_power.min()
                 self.beta = 1 - self.power
             elif self.alpha is None:
-                alpha = 1
-                for i in range(0, self.n_groups - 1):
-                    for j in range(i + 1, self.n_groups):
-                        epsilon = abs(self.mu[i] - self.mu[j])
-                        if self.hypothesis is 'superiority':
-                            epsilon = epsilon - self.margin
-                        elif self.hypothesis is 'equivalence':
-                            epsilon = self.margin - abs(epsilon)
-                        theta = epsilon * math.sqrt(self.k) / self.stdev
-                        res = brenth(lambda alpha:
-                                     self._calculate_power_unknown(self.n,
-                                                                   alpha,
-                                                                   theta,
-                                                                   self._alpha_adjustment,
-                                                                   self._beta_adjustment) -
-                                     self.power,
-                                     a=0, b=1)
-                        if res < alpha:
-                            alpha = res
-                self.alpha = self.tau * one_sample.alpha
+                self.alpha = self._calculate_alpha_unknown(
+                    self.n, self.power, theta[hardest], self.n_groups,
+                    self._alpha_adjustment)
+                self._check_alpha()
+
+    def _check_alpha(self):
+        """ Checks that the calculated :math:`\\alpha` is a level.  It is
+        not when even :math:`\\alpha = 1` misses the power for the limiting
+        pair.
+
+        Raises:
+            ValueError: if :math:`\\alpha` is not below 1
+
+        This is an internal method only.
+        """
+        if not self.alpha < 1:
+            raise ValueError('No alpha below 1 has the required power')
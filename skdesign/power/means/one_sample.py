@@ -1,7 +1,7 @@
-import math
-from skdesign.power import is_numeric
+from skdesign.power import (is_numeric,
+                            to_float)
 from . import MeansBase
-from scipy.optimize import brenth
+import numpy
 
 
 class OneSample(MeansBase):
@@ -23,7 +23,9 @@ class OneSample(MeansBase):
     Attributes:
         n: The sample size required to test the hypothesis at an
             :math:`\\alpha` level and a power of :math:`1 - \\beta`.
-        mu: :math:`\\mu` is the mean under the null hypothesis.
+        mu: :math:`\\mu` is the mean under the null hypothesis.  If it is
+            None, it is calculated as the :math:`\\mu` above
+            :math:`\\mu_{0}` at which the test has the power at n.
         mu_0: :math:`\\mu_{0}` is the mean under the alternative hypothesis.
         stdev: :math:`\\sigma` is the standard deviation of the sample.
         known_stdev: A boolean indicator if the standard deviation.
@@ -42,20 +44,27 @@ class OneSample(MeansBase):
                  known_stdev=None, hypothesis=None, margin=None,
                  alpha=None, beta=None, power=None):
 
-        is_numeric(mu, 'mu')
-
         is_numeric(mu_0, 'mu_0')
+        self.mu_0 = mu_0
 
         if margin is not None:
             is_numeric(margin, 'margin')
+        self.margin = margin
+
+        # mu is calculated when it is None
+        self.mu = mu
+        if mu is None:
+            epsilon = None
+        else:
+            is_numeric(mu, 'mu')
 
-        # Ensure that the values are floats
-        epsilon = abs(float(mu) - float(mu_0))
+            # Ensure that the values are floats
+            epsilon = numpy.abs(to_float(mu) - to_float(mu_0))
 
-        if hypothesis is 'superiority':
-            epsilon = epsilon - float(margin)
-        elif hypothesis is 'equivalence':
-            epsilon = float(margin) - abs(epsilon)
+            if hypothesis == 'superiority':
+                epsilon = epsilon - to_float(margin)
+            elif hypothesis == 'equivalence':
+                epsilon = to_float(margin) - numpy.abs(epsilon)
 
         # Initialize the remaining arguments through the parent.
         super(OneSample, self).__init__(n=n, epsilon=epsilon, stdev=stdev,
@@ -65,7 +74,9 @@ class OneSample(MeansBase):
 
     def calculate(self):
         """ Performs the power calculation """
-        if self.known_stdev:
+        if self.epsilon is None:
+            self._calculate_effect()
+        elif self.known_stdev:
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
@@ -80,19 +91,10 @@ class OneSample(MeansBase):
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
-                res = brenth(lambda n:
-                             self._calculate_power_unknown(n,
-                                                           self.alpha,
-                                                           self.theta,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=2, b=1e7)
-                self.n = math.ceil(res)
-                self.power = self._calculate_power_unknown(self.n,
-                                                           self.alpha,
-                                                           self.theta,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment)
+                self.n, self.power = self._search_n(self._power_at_n,
+                                                    self.alpha,
+                                                    self.theta,
+                                                    self.power)
             elif self.power is None:
                 self._set_default_alpha()
                 self.power = self._calculate_power_unknown(self.n,
@@ -101,12 +103,34 @@ class OneSample(MeansBase):
                                                            self._alpha_adjustment,
                                                            self._beta_adjustment)
             elif self.alpha is None:
-                n = self.n
-                res = brenth(lambda alpha:
-                             self._calculate_power_unknown(n,
-                                                           alpha,
+                self.alpha = self._calculate_alpha_unknown(self.n,
+                                                           self.power,
                                                            self.theta,
                                                            self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=0, b=1)
-                self.alpha = res
+                                                           self._beta_adjustment)
+
+    def _set_effect(self):
+        """ Set :math:`\\mu`, above :math:`\\mu_{0}`, from the calculated
+        :math:`\\epsilon`.
+
+        This is an internal method only.
+        """
+        if self.hypothesis == 'superiority':
+            difference = self.epsilon + to_float(self.margin)
+        elif self.hypothesis == 'equivalence':
+            difference = to_float(self.margin) - self.epsilon
+            # The power cannot be reached when epsilon exceeds the margin.
+            difference = to_float(numpy.where(difference >= 0, difference,
+                                              numpy.nan))
+        else:
+            difference = self.epsilon
+        self.mu = to_float(self.mu_0) + difference
+
+    def _power_at_n(self, n, alpha, theta):
+        """ The power at `n` when the standard deviation is unknown.
+
+        This is an internal method only.
+        """
+        return self._calculate_power_unknown(n, alpha, theta,
+                                             self._alpha_adjustment,
+                                             self._beta_adjustment)
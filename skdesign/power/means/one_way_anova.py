@@ -5,8 +5,8 @@ from skdesign.power import (PowerBase,
                             is_positive,
                             is_boolean)
 from skdesign.power.means import OneSample
-from scipy.optimize import brenth
-import scipy.stats as stats
+from skdesign.power import numerics
+import numpy
 
 
 class OneWayAnova(PowerBase):
@@ -56,6 +56,9 @@ class OneWayAnova(PowerBase):
         comparison: A string from ['simultaneous', 'pairwise'] indicating if
             the simultaneous or pairwise hypothesis is of interest.  The
             default is pairwise.
+        pairwise_power: The power for each pair of means (i, j), i < j, in
+            the order of `numpy.triu_indices`, when the power of the pairwise
+            comparisons is calculated.
     """
     def __init__(self, n=None, mu=None, stdev=None, comparison=None,
                  known_stdev=None, alpha=None, beta=None, power=None):
@@ -92,6 +95,7 @@ class OneWayAnova(PowerBase):
         else:
             known_stdev = True
         self.known_stdev = known_stdev
+        self.pairwise_power = None
 
         # Initialize the remaining arguments (alpha, beta, power)
         # through the parent.
@@ -113,10 +117,22 @@ class OneWayAnova(PowerBase):
         This is an internal static method only.
         """
         nu = n_groups - 1
-        quantile = stats.chi2.ppf(1 - alpha, nu)
-        power = (1 - stats.ncx2.cdf(quantile, nu, ncp))
+        quantile = numerics.chi2_ppf(1 - alpha, nu)
+        power = (1 - numerics.ncx2_cdf(quantile, nu, ncp))
         return power
 
+    @staticmethod
+    def _calculate_simultaneous_alpha(ncp, power, n_groups):
+        """ Calculate :math:`\\alpha` in the case that simultaneous
+        comparisons are used, by inverting the power through the noncentral
+        chi-squared quantile.
+
+        This is an internal static method only.
+        """
+        nu = n_groups - 1
+        quantile = numerics.ncx2_ppf(1 - power, nu, ncp)
+        return numerics.chi2_sf(quantile, nu)
+
     def calculate(self):
         """ Performs the power calculation """
         if self.comparison == 'pairwise':
@@ -125,57 +141,66 @@ class OneWayAnova(PowerBase):
             self.calculate_simultaneous()
 
     def calculate_pairwise(self):
-        """ Performs the power calculation for pairwise comparisions """
-        # Adjust alpha for multiple comparisons
-        alpha = self.alpha / (self.tau * 2)
+        """ Performs the power calculation for pairwise comparisions
+
+        Only the pair of means that are closest together limits the
+        calculation, so it is the only one that is solved.  When the power
+        is calculated, it is calculated for every pair at once and the
+        smallest is reported.
+
+        Raises:
+            ValueError: if no :math:`\\alpha` below 1 gives the closest
+                pair the required power.
+        """
+        mu = numpy.asarray(self.mu)
+        i, j = numpy.triu_indices(self.n_groups, 1)
+        closest = numpy.argmin(numpy.abs(mu[i] - mu[j]))
+        if self.n is None or self.power is None:
+            self._set_default_alpha()
+            # Adjust alpha for multiple comparisons
+            alpha = self.alpha / (self.tau * 2)
         if self.n is None:
-            n = 0
-            power = None
-            for i in range(0, self.n_groups - 1):
-                for j in range(i + 1, self.n_groups):
-                    one_sample = OneSample(mu=self.mu[i],
-                                           mu_0=self.mu[j],
-                                           stdev=self.stdev,
-                                           known_stdev=self.known_stdev,
-                                           alpha=alpha,
-                                           power=self.power)
-                    one_sample.calculate()
-                    if one_sample.n > n:
-                        n = one_sample.n
-                        power = one_sample.power
-            self.n = n
-            self.power = power
+            one_sample = OneSample(mu=mu[i[closest]],
+                                   mu_0=mu[j[closest]],
+                                   stdev=self.stdev,
+                                   known_stdev=self.known_stdev,
+                                   alpha=alpha,
+                                   power=self.power)
+            one_sample.calculate()
+            self.n = one_sample.n
+            self.power = one_sample.power
             self.beta = 1 - self.power
         elif self.power is None:
             one_sample = OneSample(n=self.n,
-                                   mu=self.mu[i],
-                                   mu_0=self.mu[j],
+                                   mu=mu[i],
+                                   mu_0=mu[j],
                                    stdev=self.stdev,
                                    known_stdev=self.known_stdev,
                                    alpha=alpha)
             one_sample.calculate()
-            self.power = one_sample.power
+            self.pairwise_power = one_sample.power
+            self.power = self.pairwise_power.min()
             self.beta = 1 - self.power
         elif self.alpha is None:
             one_sample = OneSample(n=self.n,
-                                   mu=self.mu[i],
-                                   mu_0=self.mu[j],
+                                   mu=mu[i[closest]],
+                                   mu_0=mu[j[closest]],
                                    stdev=self.stdev,
                                    known_stdev=self.known_stdev,
                                    power=self.power)
             one_sample.calculate()
-            self.alpha = (2 * self.tau) * one_sample.alpha
+            alpha = (2 * self.tau) * one_sample.alpha
+            if not alpha < 1:
+                raise ValueError('No alpha below 1 has the required power')
+            self.alpha = alpha
 
     def calculate_simultaneous(self):
         """ Performs the power calculation for simultaneous comparisions """
         delta = self.calculate_delta()
         if self.n is None:
-            res = brenth(lambda ncp:
-                         self._calculate_simultaneous_power(ncp,
-                                                            self.alpha,
-                                                            self.n_groups) - self.power,
-                         a=2, b=1e7)
-            self.n = math.ceil(res / delta)
+            ncp = numerics.noncentrality(self.n_groups - 1, self.alpha,
+                                         self.power)
+            self.n = math.ceil(ncp / delta)
             ncp = delta * self.n
             self.power = self._calculate_simultaneous_power(ncp,
                                                             self.alpha,
@@ -189,9 +214,6 @@ class OneWayAnova(PowerBase):
             self.beta = 1 - self.power
         elif self.alpha is None:
             ncp = delta * self.n
-            res = brenth(lambda alpha:
-                         self._calculate_simultaneous_power(ncp,
-                                                            alpha,
-                                                            self.n_groups) - self.power,
-                         a=0, b=1)
-            self.alpha = res
+            self.alpha = self._calculate_simultaneous_alpha(ncp,
+                                                            self.power,
+                                                            self.n_groups)
@@ -0,0 +1,156 @@
+""" Exact power of the two one-sided tests (TOST) for equivalence.
+
+With an unknown standard deviation, the two one-sided t statistics share
+their estimate of the standard deviation, so the power of the TOST is a
+bivariate noncentral t probability.  Conditioning on
+:math:`u = s / \\sigma`, where :math:`\\nu u^{2}` is chi-squared with
+:math:`\\nu` degrees of freedom, gives the difference of Owen's Q functions
+
+:math:`\\int_{0}^{u^{*}} [\\Phi(\\lambda_{U} - t u) -
+\\Phi(t u - \\lambda_{L})] f_{\\nu}(u) du`
+
+where :math:`t` is the critical value, :math:`\\lambda_{L}` and
+:math:`\\lambda_{U}` are the noncentralities of the two tests and
+:math:`u^{*} = (\\lambda_{L} + \\lambda_{U}) / (2 t)`.  The integral is
+evaluated with Gauss-Legendre quadrature over the part of
+:math:`[0, u^{*}]` where :math:`f_{\\nu}` has mass.  That range and the
+normalizing constant of :math:`f_{\\nu}` are cached per degrees of freedom,
+and every argument can be an array.
+"""
+import functools
+import numpy
+from skdesign._lazy import lazy_import
+from skdesign.power import numerics
+
+special = lazy_import('scipy.special')
+
+# Parameters controling the quadrature.  The density of u is integrated
+# between its `_TAIL` and 1 - `_TAIL` quantiles with `_ORDER` nodes.
+_ORDER = 64
+_TAIL = 1e-12
+
+
+@functools.lru_cache(maxsize=None)
+def _legendre():
+    """ The Gauss-Legendre nodes and weights on [-1, 1].
+
+    This is an internal method only.
+    """
+    return numpy.polynomial.legendre.leggauss(_ORDER)
+
+
+@functools.lru_cache(maxsize=None)
+def _chi_support(df):
+    """ The range of u that holds its mass and the log of the normalizing
+    constant of its density, for `df` degrees of freedom.
+
+    This is an internal method only.
+    """
+    lower = numpy.sqrt(numerics.chi2_ppf(_TAIL, df) / df)
+    upper = numpy.sqrt(numerics.chi2_ppf(1 - _TAIL, df) / df)
+    log_norm = (numpy.log(2.0) + (df / 2.0) * numpy.log(df / 2.0) -
+                special.gammaln(df / 2.0))
+    return float(lower), float(upper), float(log_norm)
+
+
+def _support(df):
+    """ `_chi_support` for a number or an array of degrees of freedom.
+
+    This is an internal method only.
+    """
+    if numpy.ndim(df) == 0:
+        return _chi_support(float(df))
+    values, inverse = numpy.unique(df, return_inverse=True)
+    table = numpy.array([_chi_support(float(value)) for value in values])
+    table = table[inverse.reshape(numpy.shape(df))]
+    return table[..., 0], table[..., 1], table[..., 2]
+
+
+def power_at_quantile(quantile, df, ncp_lower, ncp_upper):
+    """ The probability that both one-sided t statistics exceed `quantile`.
+
+    Arguments:
+        quantile: the critical value :math:`t`.
+        df: the degrees of freedom of the standard deviation.
+        ncp_lower: the noncentrality of the test against the lower margin.
+        ncp_upper: the noncentrality of the test against the upper margin.
+
+    Returns:
+        The power of the TOST.
+    """
+    quantile, df, ncp_lower, ncp_upper = numpy.broadcast_arrays(
+        *[numpy.asarray(value, dtype=float)
+          for value in (quantile, df, ncp_lower, ncp_upper)])
+    lower, upper, log_norm = map(numpy.asarray, _support(df))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        limit = numpy.where(quantile > 0,
+                            (ncp_lower + ncp_upper) / (2 * quantile),
+                            numpy.inf)
+    upper = numpy.minimum(upper, limit)
+    half_width = numpy.maximum(upper - lower, 0) / 2
+
+    nodes, weights = _legendre()
+    u = (lower + half_width)[..., None] + half_width[..., None] * nodes
+    t_u = quantile[..., None] * u
+    log_density = (log_norm[..., None] +
+                   (df[..., None] - 1) * numpy.log(u) -
+                   df[..., None] * u**2 / 2)
+    integrand = (special.ndtr(ncp_upper[..., None] - t_u) -
+                 special.ndtr(t_u - ncp_lower[..., None]))
+    power = half_width * numpy.sum(weights * integrand *
+                                   numpy.exp(log_density), axis=-1)
+    power = numpy.clip(power, 0, 1)
+    if power.ndim == 0:
+        return float(power)
+    return power
+
+
+def power(alpha, df, ncp_lower, ncp_upper):
+    """ The exact power of the TOST at level `alpha`.
+
+    Arguments:
+        alpha: the :math:`\\alpha` level of each one-sided test.
+        df: the degrees of freedom of the standard deviation.
+        ncp_lower: the noncentrality of the test against the lower margin.
+        ncp_upper: the noncentrality of the test against the upper margin.
+
+    Returns:
+        The power of the TOST.
+    """
+    quantile = numerics.t_ppf(1 - alpha, df)
+    return power_at_quantile(quantile, df, ncp_lower, ncp_upper)
+
+
+def alpha(power, df, ncp_lower, ncp_upper):
+    """ The :math:`\\alpha` level at which the TOST has power `power`.
+
+    The critical value is found by bisection, which is run on every element
+    of an array at once.  A power that cannot be reached with
+    :math:`\\alpha \\le 0.5` gives NaN.
+
+    Arguments:
+        power: the power of the TOST.
+        df: the degrees of freedom of the standard deviation.
+        ncp_lower: the noncentrality of the test against the lower margin.
+        ncp_upper: the noncentrality of the test against the upper margin.
+
+    Returns:
+        The :math:`\\alpha` level of each one-sided test.
+    """
+    power, df, ncp_lower, ncp_upper = numpy.broadcast_arrays(
+        *[numpy.asarray(value, dtype=float)
+          for value in (power, df, ncp_lower, ncp_upper)])
+    lower, _, _ = _support(df)
+    # Beyond this critical value the integration range is empty.
+    high = numpy.maximum((ncp_lower + ncp_upper) / (2 * lower), 0) + 1
+    low = numpy.zeros_like(high)
+    for _ in range(60):
+        middle = (low + high) / 2
+        above = power_at_quantile(middle, df, ncp_lower, ncp_upper) >= power
+        low = numpy.where(above, middle, low)
+        high = numpy.where(above, high, middle)
+    reachable = power_at_quantile(0, df, ncp_lower, ncp_upper) >= power
+    alpha = numpy.where(reachable, numerics.t_sf(low, df), numpy.nan)
+    if alpha.ndim == 0:
+        return float(alpha)
+    return alpha
@@ -1,8 +1,13 @@
-import math
 from . import MeansBase
-from skdesign.power import is_numeric
-from scipy.optimize import brenth
-import scipy.stats as stats
+from skdesign.power import (is_boolean,
+                            is_numeric,
+                            to_float)
+from skdesign.power import numerics
+from skdesign.power.functions import TostPower
+from skdesign.power.means import tost
+from skdesign.power.search import (vectorized_root,
+                                   vectorized_search)
+import numpy
 
 
 class TwoSampleCrossover(MeansBase):
@@ -25,7 +30,9 @@ class TwoSampleCrossover(MeansBase):
     Attributes:
         n: The sample size required to test the hypothesis at an
             :math:`\\alpha` level and a power of :math:`1 - \\beta`.
-        mu_1: :math:`\\mu_{1}` is the mean for treatment 1.
+        mu_1: :math:`\\mu_{1}` is the mean for treatment 1.  If it is
+            None, it is calculated as the :math:`\\mu_{1}` above
+            :math:`\\mu_{2}` at which the test has the power at n.
         mu_2: :math:`\\mu_{2}` is the the mean for treatment 2.
         sigma: :math:`\\sigma` is the standard deviation of the sample.
         known_stdev: A boolean indicator if the standard deviation.
@@ -38,32 +45,43 @@ class TwoSampleCrossover(MeansBase):
             :math:`1` - power).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
+        exact: (optional) A boolean indicator if the power of an equivalence
+            test with an unknown standard deviation is the exact power of the
+            two one-sided tests.  If False, it is approximated by doubling
+            :math:`\\beta`, which overstates the sample size when n is small.
+            The default is False.
     """
 
     def __init__(self, n=None, mu_1=None, mu_2=None, stdev=None,
                  known_stdev=None, hypothesis=None, margin=None,
-                 alpha=None, beta=None, power=None):
+                 alpha=None, beta=None, power=None, exact=None):
 
-        is_numeric(mu_1, 'mu_1')
         is_numeric(mu_2, 'mu_2')
+        self.mu_2 = mu_2
 
         if margin is not None:
             is_numeric(margin, 'margin')
         else:
             margin = 0
+        self.margin = margin
 
-        epsilon = mu_1 - mu_2
+        # mu_1 is calculated when it is None
+        self.mu_1 = mu_1
+        if mu_1 is None:
+            epsilon = None
+        else:
+            is_numeric(mu_1, 'mu_1')
 
-        epsilon = float(mu_1) - float(mu_2)
+            epsilon = to_float(mu_1) - to_float(mu_2)
 
-        if hypothesis is 'superiority':
-            epsilon = epsilon + float(margin)
-        elif hypothesis is 'equivalence':
-            # This should be margin - abs(epsilon), but the abs() is taken care
-            # of when epsilon is set for generality purposes
-            epsilon = float(margin) - abs(epsilon)
+            if hypothesis == 'superiority':
+                epsilon = epsilon + to_float(margin)
+            elif hypothesis == 'equivalence':
+                # This should be margin - abs(epsilon), but the abs() is taken
+                # care of when epsilon is set for generality purposes
+                epsilon = to_float(margin) - numpy.abs(epsilon)
 
-        epsilon *= math.sqrt(2)
+            epsilon = epsilon * numpy.sqrt(2)
 
         # Initialize the remaining arguments through the parent.
         super(TwoSampleCrossover, self).__init__(n=n,
@@ -75,6 +93,16 @@ class TwoSampleCrossover(MeansBase):
                                                  power=power,
                                                  hypothesis=hypothesis)
 
+        if exact is not None:
+            is_boolean(exact, 'exact')
+        else:
+            exact = False
+        self.exact = exact
+
+        # The noncentralities of the two one-sided tests add up to twice the
+        # margin.
+        self._theta_width = 2 * numpy.sqrt(2) * to_float(margin) / self.stdev
+
     @staticmethod
     def _calculate_power_unknown(n, alpha, theta,
                                  _alpha_adjustment, _beta_adjustment):
@@ -84,14 +112,30 @@ class TwoSampleCrossover(MeansBase):
         superclasses method.
         """
         nu = 2*n - 2
-        ncp = math.sqrt(n) * abs(theta)
-        quantile = stats.t.ppf(1 - alpha / _alpha_adjustment, nu)
-        power = 1 - _beta_adjustment * stats.nct.cdf(quantile, nu, ncp)
+        ncp = numpy.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.t_ppf(1 - alpha / _alpha_adjustment, nu)
+        power = 1 - _beta_adjustment * numerics.nct_cdf(quantile, nu, ncp)
         return power
 
+    @staticmethod
+    def _calculate_alpha_unknown(n, power, theta,
+                                 _alpha_adjustment, _beta_adjustment):
+        """ Calculate :math:`\\alpha` in the case that stdev is unknown by
+        inverting the power through the noncentral t quantile.
+
+        This is an internal static method only.  This overrides the
+        superclasses method.
+        """
+        nu = 2*n - 2
+        ncp = numpy.sqrt(n) * numpy.abs(theta)
+        quantile = numerics.nct_ppf((1 - power) / _beta_adjustment, nu, ncp)
+        return _alpha_adjustment * numerics.t_sf(quantile, nu)
+
     def calculate(self):
         """ Performs the power calculation """
-        if self.known_stdev:
+        if self.epsilon is None:
+            self._calculate_effect()
+        elif self.known_stdev:
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
@@ -102,23 +146,16 @@ class TwoSampleCrossover(MeansBase):
                 self._calculate_power_known()
             elif self.alpha is None:
                 self._calculate_alpha_known()
+        elif self.exact and self.hypothesis == 'equivalence':
+            self._calculate_exact()
         else:
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
-                res = brenth(lambda n:
-                             self._calculate_power_unknown(n,
-                                                           self.alpha,
-                                                           self.theta,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=2, b=1e7)
-                self.n = math.ceil(res)
-                self.power = self._calculate_power_unknown(self.n,
-                                                           self.alpha,
-                                                           self.theta,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment)
+                self.n, self.power = self._search_n(self._power_at_n,
+                                                    self.alpha,
+                                                    self.theta,
+                                                    self.power)
             elif self.power is None:
                 self._set_default_alpha()
                 self.power = self._calculate_power_unknown(self.n,
@@ -127,12 +164,103 @@ class TwoSampleCrossover(MeansBase):
                                                            self._alpha_adjustment,
                                                            self._beta_adjustment)
             elif self.alpha is None:
-                n = self.n
-                res = brenth(lambda alpha:
-                             self._calculate_power_unknown(n,
-                                                           alpha,
+                self.alpha = self._calculate_alpha_unknown(self.n,
+                                                           self.power,
                                                            self.theta,
                                                            self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=0, b=1)
-                self.alpha = res
+                                                           self._beta_adjustment)
+
+    def _set_effect(self):
+        """ Set :math:`\\mu_{1}`, above :math:`\\mu_{2}`, from the
+        calculated :math:`\\epsilon`.
+
+        This is an internal method only.
+        """
+        epsilon = self.epsilon / numpy.sqrt(2)
+        if self.hypothesis == 'superiority':
+            difference = epsilon - to_float(self.margin)
+        elif self.hypothesis == 'equivalence':
+            difference = to_float(self.margin) - epsilon
+            # The power cannot be reached when epsilon exceeds the margin.
+            difference = to_float(numpy.where(difference >= 0, difference,
+                                              numpy.nan))
+        else:
+            difference = epsilon
+        self.mu_1 = to_float(self.mu_2) + difference
+
+    def _power_at_n(self, n, alpha, theta):
+        """ The power at `n` when the standard deviation is unknown.
+
+        This is an internal method only.
+        """
+        return self._calculate_power_unknown(n, alpha, theta,
+                                             self._alpha_adjustment,
+                                             self._beta_adjustment)
+
+    def power_function(self):
+        """ The power as a function of n, with the constants of the
+        hypothesis worked out once.  It is the exact power of the two
+        one-sided tests when `exact` is set.
+
+        Returns:
+            A `skdesign.power.functions.PowerFunction`.
+        """
+        if self.exact and self.hypothesis == 'equivalence' and \
+                not self.known_stdev:
+            self._set_default_alpha()
+            return TostPower(self.alpha, self.theta, self._theta_width,
+                             self._minN, self._maxN)
+        return super(TwoSampleCrossover, self).power_function()
+
+    def _calculate_exact(self):
+        """ Perform the calculation with the exact power of the two one-sided
+        tests.  Arrays of parameters are solved together.
+
+        This is an internal method only.
+        """
+        if self.n is None:
+            self._set_default_alpha()
+            self._set_default_power()
+            start = self._normal_n(self.alpha, self.beta, self.theta)
+            result = vectorized_search(
+                lambda n: tost.power(self.alpha,
+                                     *self._tost_parameters(n, self.theta)),
+                self.power, start, self._minN, self._maxN)
+            self.n, self.power = result.n, result.value
+        elif self.power is None:
+            self._set_default_alpha()
+            self.power = tost.power(self.alpha,
+                                    *self._tost_parameters(self.n,
+                                                           self.theta))
+        elif self.alpha is None:
+            self.alpha = tost.alpha(self.power,
+                                    *self._tost_parameters(self.n,
+                                                           self.theta))
+        self.beta = 1 - self.power
+
+    def _solve_theta(self, n):
+        """ The smallest :math:`\\theta` with the required power at `n`.
+        With the exact power of the two one-sided tests it is searched for
+        up to the middle of the equivalence range, where the power is
+        largest.  It is NaN if the power cannot be reached.
+
+        This is an internal method only.
+        """
+        if not (self.exact and self.hypothesis == 'equivalence' and
+                not self.known_stdev):
+            return super(TwoSampleCrossover, self)._solve_theta(n)
+        theta, _ = vectorized_root(
+            lambda theta: tost.power(self.alpha,
+                                     *self._tost_parameters(n, theta)),
+            self.power, 0, self._theta_width / 2, self._theta_width / 2)
+        return theta
+
+    def _tost_parameters(self, n, theta):
+        """ The degrees of freedom and the noncentralities of the lower and
+        upper one-sided tests at `n` and :math:`\\theta`.
+
+        This is an internal method only.
+        """
+        ncp_upper = numpy.sqrt(n) * theta
+        ncp_lower = numpy.sqrt(n) * (self._theta_width - theta)
+        return 2 * n - 2, ncp_lower, ncp_upper
@@ -1,8 +1,9 @@
-import math
 from . import MeansBase
-from skdesign.power import is_numeric
-from scipy.optimize import brenth
-import scipy.stats as stats
+from skdesign.power import (ceil,
+                            is_numeric,
+                            to_float)
+from skdesign.power import numerics
+import numpy
 
 
 class TwoSampleParallel(MeansBase):
@@ -29,7 +30,9 @@ class TwoSampleParallel(MeansBase):
         n_2: The sample size required to test the hypothesis at an
             :math:`\\alpha` level and a power of :math:`1 - \\beta` for
             group 2.
-        mu_1: :math:`\\mu` is the mean for group 1.
+        mu_1: :math:`\\mu` is the mean for group 1.  If it is None, it is
+            calculated as the :math:`\\mu_{1}` above :math:`\\mu_{2}` at
+            which the test has the power at n.
         mu_2: :math:`\\mu_{0}` is the the mean for group 2.
         stdev: :math:`\\sigma` is the standard deviation of the sample.
         known_stdev: A boolean indicator if the standard deviation.
@@ -65,41 +68,49 @@ class TwoSampleParallel(MeansBase):
                     n = n_1 + n_2
                 else:
                     n = n_1 + n_2
-                    ratio = n_1 / float(n_2)
+                    ratio = n_1 / n_2
         else:
             if n_1 is None:
                 if n_2 is None:
                     n = None
                 else:
-                    n_1 = math.ceil(ratio * n_2)
+                    n_1 = ceil(ratio * n_2)
                     n = n_1 + n_2
             else:
                 if n_2 is None:
-                    n_2 = math.ceil(n_1 / ratio)
+                    n_2 = ceil(n_1 / ratio)
                     n = n_1 + n_2
                 else:
                     n = n_1 + n_2
 
         self.n_1 = n_1
         self.n_2 = n_2
-        self.ratio = float(ratio)
+        self.ratio = to_float(ratio)
 
-        stdev *= math.sqrt(1 + 1 / float(ratio))
+        stdev = stdev * numpy.sqrt(1 + 1 / self.ratio)
 
-        is_numeric(mu_1, 'mu_1')
         is_numeric(mu_2, 'mu_2')
+        self.mu_2 = mu_2
 
         if margin is not None:
             is_numeric(margin, 'margin')
+        self.margin = margin
 
-        epsilon = float(mu_1) - float(mu_2)
+        # mu_1 is calculated when it is None
+        self.mu_1 = mu_1
+        if mu_1 is None:
+            epsilon = None
+        else:
+            is_numeric(mu_1, 'mu_1')
+
+            epsilon = to_float(mu_1) - to_float(mu_2)
 
-        if hypothesis is 'superiority':
-            epsilon = epsilon + float(margin)
-        elif hypothesis is 'equivalence':
-            # This should be margin - abs(epsilon), but the abs() is taken care
-            # of when epsilon is set for generality purposes
-            epsilon = float(margin) - abs(epsilon)
+            if hypothesis == 'superiority':
+                epsilon = epsilon + to_float(margin)
+            elif hypothesis == 'equivalence':
+                # This should be margin - abs(epsilon), but the abs() is taken
+                # care of when epsilon is set for generality purposes
+                epsilon = to_float(margin) - numpy.abs(epsilon)
 
         # Initialize the remaining arguments through the parent.
         super(TwoSampleParallel, self).__init__(n=n,
@@ -122,23 +133,36 @@ class TwoSampleParallel(MeansBase):
         superclasses method.
         """
         nu = (1 + ratio) * n_2 - 2
-        ncp = math.sqrt(n_2) * abs(theta)
-        quantile = stats.t.ppf(1 - alpha / _alpha_adjustment, nu)
-        power = 1 - _beta_adjustment * stats.nct.cdf(quantile, nu, ncp)
+        ncp = numpy.sqrt(n_2) * numpy.abs(theta)
+        quantile = numerics.t_ppf(1 - alpha / _alpha_adjustment, nu)
+        power = 1 - _beta_adjustment * numerics.nct_cdf(quantile, nu, ncp)
         return power
 
+    @staticmethod
+    def _calculate_alpha_unknown(n_2, power, theta, ratio,
+                                 _alpha_adjustment, _beta_adjustment):
+        """ Calculate :math:`\\alpha` in the case that stdev is unknown by
+        inverting the power through the noncentral t quantile.
+
+        This is an internal static method only.  This overrides the
+        superclasses method.
+        """
+        nu = (1 + ratio) * n_2 - 2
+        ncp = numpy.sqrt(n_2) * numpy.abs(theta)
+        quantile = numerics.nct_ppf((1 - power) / _beta_adjustment, nu, ncp)
+        return _alpha_adjustment * numerics.t_sf(quantile, nu)
+
     def _calculate_n_known(self):
         """ Calculate n in the case that the standard deviation is known.
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
 
         n_2 = (z_alpha + z_beta)**2 / self.theta**2
-        self.n_2 = math.ceil(n_2)
-        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n_2 = ceil(n_2)
+        self.n_1 = ceil(self.ratio * self.n_2)
 
     def _calculate_alpha_known(self):
         """ Calculate :math:`\\alpha` in the case that the standard deviation
@@ -146,27 +170,27 @@ class TwoSampleParallel(MeansBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-        z_alpha = math.sqrt(self.n_2) * abs(self.theta) - z_beta
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numpy.sqrt(self.n_2) * numpy.abs(self.theta) - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = math.sqrt(self.n_2) * abs(self.theta) - z_alpha
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numpy.sqrt(self.n_2) * numpy.abs(self.theta) - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
 
     def calculate(self):
         """ Performs the power calculation """
-        if self.known_stdev:
+        if self.epsilon is None:
+            self._calculate_effect()
+        elif self.known_stdev:
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
@@ -182,24 +206,13 @@ class TwoSampleParallel(MeansBase):
             if self.n is None:
                 self._set_default_alpha()
                 self._set_default_power()
-                alpha = self.alpha
-                res = brenth(lambda n:
-                             self._calculate_power_unknown(n,
-                                                           alpha,
-                                                           self.theta,
-                                                           self.ratio,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=2, b=1e7)
-                self.n_2 = math.ceil(res)
-                self.n_1 = math.ceil(self.n_2 * self.ratio)
+                self.n_2, self.power = self._search_n(self._power_at_n,
+                                                      self.alpha,
+                                                      self.theta,
+                                                      self.power,
+                                                      self.ratio)
+                self.n_1 = ceil(self.n_2 * self.ratio)
                 self.n = self.n_1 + self.n_2
-                self.power = self._calculate_power_unknown(self.n_2,
-                                                           self.alpha,
-                                                           self.theta,
-                                                           self.ratio,
-                                                           self._alpha_adjustment,
-                                                           self._beta_adjustment)
             elif self.power is None:
                 self._set_default_alpha()
                 self.power = self._calculate_power_unknown(self.n_2,
@@ -209,15 +222,54 @@ class TwoSampleParallel(MeansBase):
                                                            self._alpha_adjustment,
                                                            self._beta_adjustment)
             elif self.alpha is None:
-                res = brenth(lambda alpha:
-                             self._calculate_power_unknown(self.n_2,
-                                                           alpha,
+                self.alpha = self._calculate_alpha_unknown(self.n_2,
+                                                           self.power,
                                                            self.theta,
                                                            self.ratio,
                                                            self._alpha_adjustment,
-                                                           self._beta_adjustment) - self.power,
-                             a=0, b=1)
-                self.alpha = res
+                                                           self._beta_adjustment)
+
+    def _power_n(self):
+        """ The sample size of group 2, which the power is a function of.
+
+        This is an internal method only.
+        """
+        return self.n_2
+
+    def _power_arguments(self):
+        """ The ratio, which `_calculate_power_unknown` takes after
+        :math:`\\theta`.  The power function is a function of n_2.
+
+        This is an internal method only.
+        """
+        return (self.ratio,)
+
+    def _set_effect(self):
+        """ Set :math:`\\mu_{1}`, above :math:`\\mu_{2}`, from the
+        calculated :math:`\\epsilon`.
+
+        This is an internal method only.
+        """
+        epsilon = self.epsilon
+        if self.hypothesis == 'superiority':
+            difference = epsilon - to_float(self.margin)
+        elif self.hypothesis == 'equivalence':
+            difference = to_float(self.margin) - epsilon
+            # The power cannot be reached when epsilon exceeds the margin.
+            difference = to_float(numpy.where(difference >= 0, difference,
+                                              numpy.nan))
+        else:
+            difference = epsilon
+        self.mu_1 = to_float(self.mu_2) + difference
+
+    def _power_at_n(self, n_2, alpha, theta, ratio):
+        """ The power at `n_2` when the standard deviation is unknown.
+
+        This is an internal method only.
+        """
+        return self._calculate_power_unknown(n_2, alpha, theta, ratio,
+                                             self._alpha_adjustment,
+                                             self._beta_adjustment)
 
     def __repr__(self):
         """ The canonical representation of a TwoSampleParallel object
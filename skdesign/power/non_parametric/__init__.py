@@ -1,3 +1,7 @@
-from .one_sample import OneSample
-from .two_sample import TwoSample
-from .independance import Independance
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'OneSample': 'one_sample',
+    'TwoSample': 'two_sample',
+    'Independance': 'independance'
+})
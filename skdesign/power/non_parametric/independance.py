@@ -1,7 +1,7 @@
 from skdesign.power import (PowerBase,
                             is_in_0_1,
                             is_integer)
-import scipy.stats as stats
+from skdesign.power import numerics
 import math
 
 
@@ -29,9 +29,8 @@ class Independance(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = distribution.ppf(1 - self.beta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         alpha_factor = 1 / 3.0
         beta_factor = math.sqrt(2 * self.p_2 - 1 - (2 * self.p_1 - 1)**2)
@@ -45,8 +44,7 @@ class Independance(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         alpha_factor = 1 / 3.0
         beta_factor = math.sqrt(2 * self.p_2 - 1 - (2 * self.p_1 - 1)**2)
@@ -55,15 +53,14 @@ class Independance(PowerBase):
         z_alpha = math.sqrt(self.n) * abs(n_factor) - z_beta * beta_factor
         z_alpha = z_alpha / alpha_factor
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * 2.0
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * 2.0
 
     def _calculate_power(self):
         """ Calculate power
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
 
         alpha_factor = 1 / 3.0
         beta_factor = math.sqrt(2 * self.p_2 - 1 - (2 * self.p_1 - 1)**2)
@@ -72,7 +69,7 @@ class Independance(PowerBase):
         z_beta = math.sqrt(self.n) * abs(n_factor) - z_alpha * alpha_factor
         z_beta = z_beta / beta_factor
 
-        self.beta = (1 - stats.norm.cdf(z_beta))
+        self.beta = (1 - numerics.norm_cdf(z_beta))
         self.power = 1 - self.beta
 
     def calculate(self):
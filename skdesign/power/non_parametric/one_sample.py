@@ -1,7 +1,7 @@
 from skdesign.power import (PowerBase,
                             is_in_0_1,
                             is_integer)
-import scipy.stats as stats
+from skdesign.power import numerics
 import math
 
 
@@ -31,9 +31,8 @@ class OneSample(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = distribution.ppf(1 - self.beta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         n = ((z_alpha / math.sqrt(12) + z_beta *
               math.sqrt(self.p_3 + 4 * self.p_4 - 4 * self.p_2**2))**2 /
@@ -45,8 +44,7 @@ class OneSample(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
         z_alpha = self.n * (0.25 - self.p_2)**2
         z_alpha = math.sqrt(z_alpha)
@@ -54,20 +52,19 @@ class OneSample(PowerBase):
                              self.p_4 - 4 * self.p_2**2))
         z_alpha *= math.sqrt(12)
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * 2.0
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * 2.0
 
     def _calculate_power(self):
         """ Calculate power
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
         num = math.sqrt(self.n) * (0.25 - self.p_2) + (z_alpha / math.sqrt(12))
         denom = (math.sqrt(self.p_3 + 4 * self.p_4 - 4 * self.p_2**2))
         z_beta = num / denom
 
-        self.beta = (1 - stats.norm.cdf(-z_beta))
+        self.beta = (1 - numerics.norm_cdf(-z_beta))
         self.power = 1 - self.beta
 
     def calculate(self):
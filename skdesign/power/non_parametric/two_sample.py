@@ -1,7 +1,10 @@
 from skdesign.power import (PowerBase,
-                            is_in_0_1)
-import scipy.stats as stats
+                            ceil,
+                            is_in_0_1,
+                            to_float)
+from skdesign.power import numerics
 import math
+import numpy
 
 
 class TwoSample(PowerBase):
@@ -42,7 +45,7 @@ class TwoSample(PowerBase):
         self.n = n
         self.n_1 = n_1
         self.n_2 = n_2
-        self.ratio = float(ratio)
+        self.ratio = to_float(ratio)
 
         is_in_0_1(p_1, 'p_1 should be in [0, 1].')
         is_in_0_1(p_2, 'p_2 should be in [0, 1].')
@@ -61,18 +64,17 @@ class TwoSample(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
-        z_beta = distribution.ppf(1 - self.beta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
-        alpha_factor = math.sqrt(self.ratio * (self.ratio + 1) / 12)
-        beta_factor = math.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
-                                self.ratio * (self.p_3 - self.p_1**2))
+        alpha_factor = numpy.sqrt(self.ratio * (self.ratio + 1) / 12)
+        beta_factor = numpy.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
+                                 self.ratio * (self.p_3 - self.p_1**2))
         n_factor = self.ratio * (0.5 - self.p_1)
         n = (z_alpha * alpha_factor + z_beta * beta_factor)**2 / n_factor**2
 
-        self.n_2 = math.ceil(n)
-        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n_2 = ceil(n)
+        self.n_1 = ceil(self.ratio * self.n_2)
         self.n = self.n_1 + self.n_2
 
     def _calculate_alpha(self):
@@ -80,36 +82,34 @@ class TwoSample(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta)
+        z_beta = numerics.norm_ppf(1 - self.beta)
 
-        alpha_factor = math.sqrt(self.ratio * (self.ratio + 1) / 12)
-        beta_factor = math.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
-                                self.ratio * (self.p_3 - self.p_1**2))
+        alpha_factor = numpy.sqrt(self.ratio * (self.ratio + 1) / 12)
+        beta_factor = numpy.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
+                                 self.ratio * (self.p_3 - self.p_1**2))
         n_factor = self.ratio * (0.5 - self.p_1)
 
-        z_alpha = math.sqrt(self.n_2) * abs(n_factor) - z_beta * beta_factor
+        z_alpha = numpy.sqrt(self.n_2) * abs(n_factor) - z_beta * beta_factor
         z_alpha = z_alpha / alpha_factor
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * 2.0
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * 2.0
 
     def _calculate_power(self):
         """ Calculate power
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / 2.0)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / 2.0)
 
-        alpha_factor = math.sqrt(self.ratio * (self.ratio + 1) / 12)
-        beta_factor = math.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
-                                self.ratio * (self.p_3 - self.p_1**2))
+        alpha_factor = numpy.sqrt(self.ratio * (self.ratio + 1) / 12)
+        beta_factor = numpy.sqrt(self.ratio**2 * (self.p_2 - self.p_1**2) +
+                                 self.ratio * (self.p_3 - self.p_1**2))
         n_factor = self.ratio * (0.5 - self.p_1)
 
-        z_beta = math.sqrt(self.n_2) * abs(n_factor) - z_alpha * alpha_factor
+        z_beta = numpy.sqrt(self.n_2) * abs(n_factor) - z_alpha * alpha_factor
         z_beta = z_beta / beta_factor
 
-        self.beta = (1 - stats.norm.cdf(z_beta))
+        self.beta = (1 - numerics.norm_cdf(z_beta))
         self.power = 1 - self.beta
 
     def calculate(self):
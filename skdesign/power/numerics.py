@@ -0,0 +1,232 @@
+""" Distribution functions for the power calculations.
+
+The functions call the `scipy.special` ufuncs directly.  They give the same
+values as the matching methods of the `scipy.stats` distributions, without
+the argument checking of `rv_continuous`, which costs far more than the
+functions themselves for scalar arguments.  The arguments follow the
+`scipy.stats` order, so `t_ppf(q, df)` is `scipy.stats.t.ppf(q, df)`.
+
+The quantile functions other than `norm_ppf` share a process-wide LRU
+cache keyed by the distribution, the probability and the shape parameters,
+since the same critical values are needed for every design with the same
+:math:`\\alpha`.  Only scalar arguments are cached.  The cache is
+thread-safe, can be turned off with `set_quantile_cache(False)` and reports
+its hits and misses through `quantile_cache_info()`.
+
+The noncentrality of a chi-squared test with a given power is inverted
+directly with `chndtrinc`.  For common degrees of freedom, :math:`\\alpha`
+levels and powers it is read from a table that is built with a single
+vectorized call the first time it is needed.
+"""
+import functools
+import numpy
+from skdesign._lazy import lazy_import
+
+# scipy is only imported when a distribution function is first called.
+special = lazy_import('scipy.special')
+
+_CACHE_SIZE = 4096
+
+# The degrees of freedom, alpha levels and powers in the noncentrality table.
+_TABLE_DF = numpy.arange(1, 101)
+_TABLE_ALPHA = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1)
+_TABLE_POWER = (0.5, 0.75, 0.8, 0.85, 0.9, 0.95, 0.975, 0.99)
+
+# The types of the arguments that are cached.
+_SCALARS = (float, int, numpy.float64, numpy.int64)
+
+_cache_enabled = True
+
+
+# The quantile functions, with their arguments in the scipy.stats order.
+_QUANTILES = {'t': lambda q, df: special.stdtrit(df, q),
+              'nct': lambda q, df, nc: special.nctdtrit(df, nc, q),
+              'chi2': lambda q, df: special.chdtri(df, 1 - numpy.asarray(q)),
+              'ncx2': lambda q, df, nc: special.chndtrix(q, df, nc),
+              'ncx2_nc': lambda x, df, q: special.chndtrinc(x, df, q),
+              'f': lambda q, dfn, dfd: special.fdtri(dfn, dfd, q)}
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _cached_quantile(name, *args):
+    """ A quantile of the distribution `name`, through the LRU cache.
+
+    This is an internal method only.
+    """
+    return _QUANTILES[name](*args)
+
+
+def _quantile(name, *args):
+    """ A quantile of the distribution `name`, from the cache when it is
+    enabled and every argument is a scalar.
+
+    This is an internal method only.
+    """
+    if _cache_enabled:
+        for arg in args:
+            if type(arg) not in _SCALARS:
+                break
+        else:
+            return _cached_quantile(name, *args)
+    return _QUANTILES[name](*args)
+
+
+def set_quantile_cache(enabled):
+    """ Turn the quantile cache on or off.  Turning it off also empties it.
+
+    Arguments:
+        enabled: if False, every quantile is calculated afresh.
+    """
+    global _cache_enabled
+    _cache_enabled = enabled
+    if not enabled:
+        _cached_quantile.cache_clear()
+
+
+def quantile_cache_info():
+    """ The hits, misses, maximum size and current size of the quantile
+    cache, as a `functools` cache info tuple.
+    """
+    return _cached_quantile.cache_info()
+
+
+def clear_quantile_cache():
+    """ Empty the quantile cache and reset its statistics. """
+    _cached_quantile.cache_clear()
+
+
+def norm_cdf(x):
+    """ The standard normal cdf. """
+    return special.ndtr(x)
+
+
+def norm_ppf(q):
+    """ The standard normal quantile.  It is not cached, since `ndtri` is
+    cheaper than a cache lookup.
+    """
+    return special.ndtri(q)
+
+
+def t_cdf(x, df):
+    """ The cdf of Student's t distribution. """
+    return special.stdtr(df, x)
+
+
+def t_sf(x, df):
+    """ The survival function of Student's t distribution. """
+    return special.stdtr(df, -1 * numpy.asarray(x))
+
+
+def t_ppf(q, df):
+    """ The quantile of Student's t distribution. """
+    return _quantile('t', q, df)
+
+
+def nct_cdf(x, df, nc):
+    """ The cdf of the noncentral t distribution.
+
+    `nctdtr` can return NaN far in the tails, where the cdf underflows.
+    Those values are replaced by the normal approximation of Abramowitz and
+    Stegun (26.7.10), which is accurate there to far better than the power
+    calculations need.
+    """
+    cdf = special.nctdtr(df, nc, x)
+    if numpy.any(numpy.isnan(cdf)):
+        x, df, nc = numpy.broadcast_arrays(x, df, nc)
+        z = ((x * (1 - 1 / (4 * df)) - nc) /
+             numpy.sqrt(1 + x**2 / (2 * df)))
+        cdf = numpy.where(numpy.isnan(cdf), special.ndtr(z), cdf)
+        if cdf.ndim == 0:
+            cdf = cdf[()]
+    return cdf
+
+
+def nct_ppf(q, df, nc):
+    """ The quantile of the noncentral t distribution. """
+    return _quantile('nct', q, df, nc)
+
+
+def chi2_cdf(x, df):
+    """ The cdf of the chi-squared distribution. """
+    return special.chdtr(df, x)
+
+
+def chi2_sf(x, df):
+    """ The survival function of the chi-squared distribution. """
+    return special.chdtrc(df, x)
+
+
+def chi2_ppf(q, df):
+    """ The quantile of the chi-squared distribution. """
+    return _quantile('chi2', q, df)
+
+
+def ncx2_cdf(x, df, nc):
+    """ The cdf of the noncentral chi-squared distribution. """
+    return special.chndtr(x, df, nc)
+
+
+def ncx2_ppf(q, df, nc):
+    """ The quantile of the noncentral chi-squared distribution. """
+    return _quantile('ncx2', q, df, nc)
+
+
+def f_cdf(x, dfn, dfd):
+    """ The cdf of the F distribution. """
+    return special.fdtr(dfn, dfd, x)
+
+
+def f_sf(x, dfn, dfd):
+    """ The survival function of the F distribution. """
+    return special.fdtrc(dfn, dfd, x)
+
+
+def f_ppf(q, dfn, dfd):
+    """ The quantile of the F distribution. """
+    return _quantile('f', q, dfn, dfd)
+
+
+def ncx2_nc(x, df, q):
+    """ The noncentrality at which the noncentral chi-squared cdf at `x` is
+    `q`.
+    """
+    return _quantile('ncx2_nc', x, df, q)
+
+
+@functools.lru_cache(maxsize=None)
+def _noncentrality_table():
+    """ The noncentralities for the common degrees of freedom, alpha levels
+    and powers, keyed by (df, alpha, power).
+
+    This is an internal method only.
+    """
+    df, alpha, power = numpy.meshgrid(_TABLE_DF, _TABLE_ALPHA, _TABLE_POWER,
+                                      indexing='ij')
+    nc = special.chndtrinc(special.chdtri(df, alpha), df, 1 - power)
+    keys = zip(df.ravel().tolist(), alpha.ravel().tolist(),
+               power.ravel().tolist())
+    return dict(zip(keys, nc.ravel().tolist()))
+
+
+def noncentrality(df, alpha, power):
+    """ The noncentrality at which a chi-squared test with `df` degrees of
+    freedom at level `alpha` has power `power`.
+
+    This inverts :math:`1 - F_{df, \\lambda}(\\chi^{2}_{df, 1 - \\alpha})`
+    in :math:`\\lambda`.  Common values are looked up in a precomputed
+    table.
+
+    Arguments:
+        df: the degrees of freedom.
+        alpha: the significance level.
+        power: the power.
+
+    Returns:
+        The noncentrality :math:`\\lambda`.
+    """
+    if type(df) in _SCALARS and type(alpha) in _SCALARS and \
+            type(power) in _SCALARS:
+        value = _noncentrality_table().get((df, alpha, power))
+        if value is not None:
+            return value
+    return ncx2_nc(chi2_ppf(1 - alpha, df), df, 1 - power)
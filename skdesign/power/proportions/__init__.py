@@ -1,9 +1,14 @@
-from .binomial import Binomial
-from .fisher import Fisher
-from .one_sample import OneSample
-from .two_sample_crossover import TwoSampleCrossover
-from .two_sample_parallel import TwoSampleParallel
-from .one_way_anova import OneWayAnova
-from .multi_sample_williams import MultiSampleWilliams
-from .relative_risk_parallel import RelativeRiskParallel
-from .relative_risk_crossover import RelativeRiskCrossover
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'Binomial': 'binomial',
+    'Fisher': 'fisher',
+    'OneSample': 'one_sample',
+    'TwoSampleCrossover': 'two_sample_crossover',
+    'TwoSampleParallel': 'two_sample_parallel',
+    'OneWayAnova': 'one_way_anova',
+    'MultiSampleWilliams': 'multi_sample_williams',
+    'RelativeRiskParallel': 'relative_risk_parallel',
+    'RelativeRiskCrossover': 'relative_risk_crossover',
+    'ExactUnconditional': 'exact_unconditional'
+})
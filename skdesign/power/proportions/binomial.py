@@ -1,12 +1,28 @@
 import math
-from skdesign.power import (PowerBase,
+from skdesign.power import (are_scalars,
+                            is_boolean,
                             is_in_0_1,
                             is_integer)
-import scipy.stats as stats
-import numpy.random as random
+from skdesign.power.proportions import exact as exact_power
+from skdesign.power.simulation import (simulate,
+                                       SimulationBase)
+from skdesign._lazy import lazy_import
+import numpy
 
+stats = lazy_import('scipy.stats')
 
-class Binomial(PowerBase):
+
+def _binomial_p_values(random_state, size, n, p, p_0):
+    """ Simulate `size` binomial samples and return the p-values of the
+    exact binomial test for each of them.
+
+    This is an internal method only.
+    """
+    res = random_state.binomial(n, p, size)
+    return numpy.array([stats.binomtest(x, n=n, p=p_0).pvalue for x in res])
+
+
+class Binomial(SimulationBase):
     """ Hypotheses for a Binomial test of proportions.
 
     Hypothesis:
@@ -33,6 +49,23 @@ class Binomial(PowerBase):
         p_0: The null value for the probability
         p_1: The estimated value for the probability
         margin: The margin used in superiority hypotheses
+        exact: (optional) If True, the power is calculated exactly from the
+            rejection region of the test instead of by simulation.  The
+            default is False.
+        n_conservative: With `exact`, the smallest sample size from which
+            every larger sample size also has the required power.  Exact
+            power is sawtooth shaped in `n`, so this can be larger than `n`.
+        seed: (optional) The seed for the simulations.
+        n_jobs: (optional) The number of processes to run the simulations
+            in.  -1 uses every CPU.  The results do not depend on `n_jobs`.
+            The default is to run in this process.
+        adaptive: (optional) If True, the simulations for each candidate
+            sample size stop once the simulated power is clearly above or
+            below the target power.  The default is False.
+        time_budget: (optional) The number of seconds the calculation may
+            run for.
+        mc_stderr: The Monte Carlo standard error of the simulated power.
+        n_sims: The number of simulations behind the simulated power.
     """
 
     # Parameters controling the simulation of power
@@ -42,9 +75,14 @@ class Binomial(PowerBase):
     # Parameters controling the search grid for the calculation of sample size.
     _minN = 2
     _maxN = 100
+    _maxN_exact = 5000
 
     def __init__(self, n=None, alpha=None, beta=None, power=None,
-                 p=None, p_0=None, margin=None):
+                 p=None, p_0=None, margin=None, exact=None, seed=None,
+                 n_jobs=None,
+                 adaptive=None, time_budget=None):
+        are_scalars(n=n, alpha=alpha, beta=beta, power=power, p=p, p_0=p_0,
+                    margin=margin)
 
         is_in_0_1(p, 'p')
         self.p = p
@@ -62,17 +100,37 @@ class Binomial(PowerBase):
         if n is not None:
             is_integer(n, 'n')
         self.n = n
+        self.n_conservative = None
+
+        if exact is None:
+            exact = False
+        else:
+            is_boolean(exact, 'exact')
+        self.exact = exact
+
+        if seed is None:
+            self.seed = self._SEED
+        else:
+            self.seed = seed
+
+        if n_jobs is not None:
+            is_integer(n_jobs, 'n_jobs')
+        self.n_jobs = n_jobs
 
         super(Binomial, self).__init__(alpha=alpha, power=power,
-                                       beta=beta, hypothesis='equality')
+                                       beta=beta, hypothesis='equality',
+                                       adaptive=adaptive,
+                                       time_budget=time_budget)
 
     def calculate(self):
+        self._start_clock()
         if self.n is None:
             self.calculate_n()
         elif self.power is None:
             self.calculate_power()
         elif self.alpha is None:
             self.calculate_alpha()
+        self._set_simulation_error(self.n)
 
     def calculate_n(self):
         """ Perfrom the power calculation """
@@ -86,17 +144,19 @@ class Binomial(PowerBase):
         else:
             alpha = self.alpha
 
-        random.seed(self._SEED)
+        if self.exact:
+            self._calculate_n_exact(alpha, power)
+            return
 
-        res = self._power_internals(self._minN, alpha)
+        res = self._power_internals(self._minN, alpha, power)
         lag_lower = (self._minN, res[0])
         if lag_lower[1] > power:
             self.power = res[0]
             self.alpha = res[1]
-            self.n = self._minN[0]
+            self.n = self._minN
             return
 
-        res = self._power_internals(self._maxN, alpha)
+        res = self._power_internals(self._maxN, alpha, power)
         lag_upper = (self._maxN, res[0])
         if lag_upper[1] < power:
             raise BaseException("N > " + str(self._maxN) +
@@ -105,7 +165,7 @@ class Binomial(PowerBase):
         while True:
             delta_n = lag_upper[0] - lag_lower[0]
             test_n = math.floor(delta_n / 2) + lag_lower[0]
-            test_power, test_alpha = self._power_internals(test_n, alpha)
+            test_power, test_alpha = self._power_internals(test_n, alpha, power)
             if test_power < power:
                 # Look at upper half of what's left
                 lag_lower = (test_n, test_power, test_alpha)
@@ -137,8 +197,6 @@ class Binomial(PowerBase):
         else:
             alpha = self.alpha
 
-        random.seed(self._SEED)
-
         self.power, _ = self._power_internals(self.n, alpha)
         self.beta = 1 - self.power
 
@@ -149,27 +207,54 @@ class Binomial(PowerBase):
         else:
             power = self.power
 
-        random.seed(self._SEED)
-
-        res = random.binomial(self.n, self.p, self._N_SIMS)
-
-        p_vals = []
-        for x in res:
-            p_val = stats.binom_test(x, n=self.n, p=self.p_0)
-            p_vals.append(p_val)
-        p_vals.sort()
-        self.alpha = p_vals[int(self._N_SIMS * power)]
-
-    def _power_internals(self, n, alpha):
-        count = 0
-        res = random.binomial(n, self.p, self._N_SIMS)
-        p_vals = []
-        for x in res:
-            p_val = stats.binom_test(x, n=n, p=self.p_0)
-            if p_val < alpha:
-                count += 1
-            p_vals.append(p_val)
-        p_vals.sort()
-        power = count / self._N_SIMS
-        alpha = p_vals[int(self._N_SIMS * power) - 1]
+        if self.exact:
+            self.alpha = exact_power.binomial_alpha(self.n, self.p, self.p_0,
+                                                    power)
+            self._exact_estimate(self.n, power)
+            return
+
+        p_vals = numpy.sort(self._simulate_p_values(self.n))
+        self.alpha = float(p_vals[int(self._N_SIMS * power)])
+        self._power_estimate(self.n, p_vals, self.alpha)
+
+    def _calculate_n_exact(self, alpha, power):
+        """ Scan every sample size for the exact power.
+
+        This is an internal method only.
+        """
+        res = exact_power.binomial_sample_size(self.p, self.p_0, alpha, power,
+                                               self._minN, self._maxN_exact)
+        self.n, self.n_conservative, self.power, _ = res
+        self._exact_estimate(self.n, self.power)
+        self.alpha = self._exact_size(self.n, alpha)
+        self.beta = 1 - self.power
+
+    def _exact_size(self, n, alpha):
+        """ The probability that the test rejects when `p` is `p_0`.
+
+        This is an internal method only.
+        """
+        return float(exact_power.binomial_power(n, self.p_0, self.p_0, alpha))
+
+    def _power_internals(self, n, alpha, target=None):
+        if self.exact:
+            power = float(exact_power.binomial_power(n, self.p, self.p_0,
+                                                     alpha))
+            return self._exact_estimate(n, power), self._exact_size(n, alpha)
+
+        stop = self._stopping_rule(alpha, target)
+        p_vals = numpy.sort(self._simulate_p_values(n, stop))
+        power = self._power_estimate(n, p_vals, alpha)
+        alpha = float(p_vals[int(len(p_vals) * power) - 1])
         return power, alpha
+
+    def _simulate_p_values(self, n, stop=None):
+        """ Simulate `_N_SIMS` samples of size `n` and return the p-values of
+        the exact binomial test.  If `stop` is given, the simulations end
+        once it returns True.
+
+        This is an internal method only.
+        """
+        return simulate(_binomial_p_values, self._N_SIMS, self.seed,
+                        n_jobs=self.n_jobs, args=(n, self.p, self.p_0),
+                        stop=stop)
@@ -0,0 +1,459 @@
+""" Exact power for tests on binomial outcomes.
+
+Rather than simulating trials, these functions enumerate every possible
+outcome, weight it by its binomial probability and add up the probability of
+the outcomes that are rejected.
+"""
+import functools
+import numpy
+from skdesign._lazy import lazy_import
+
+stats = lazy_import('scipy.stats')
+
+# The relative tolerance that `scipy.stats.fisher_exact` and
+# `scipy.stats.binomtest` use when they compare the probabilities of two
+# outcomes.
+_TOLERANCE = 1 + 1e-7
+
+# The number of sample sizes whose binomial rejection regions are calculated
+# together.
+_CHUNK_SIZE = 64
+
+
+def _two_sided_p_values(pmf):
+    """ Two-sided p-values for each row of a grid of probabilities.
+
+    The p-value of an outcome is the total probability of the outcomes in
+    its row that are no more likely than it is.  Every row is sorted once
+    and the p-values are read off the cumulative sums, for all the rows at
+    the same time.
+
+    This is an internal method only.
+    """
+    rows, columns = pmf.shape
+    ordered = numpy.sort(pmf, axis=1)
+    cumulative = numpy.cumsum(ordered, axis=1)
+
+    # Each row is shifted by twice its index so that one search over the
+    # flattened rows stays within the row of the outcome.
+    offset = 2 * numpy.arange(rows)[:, None]
+    position = numpy.searchsorted((ordered + offset).ravel(),
+                                  (pmf * _TOLERANCE + offset).ravel(),
+                                  side='right')
+    position = position.reshape(pmf.shape) - 1 - offset // 2 * columns
+    p_vals = numpy.take_along_axis(cumulative, position, axis=1)
+    return numpy.minimum(p_vals, 1)
+
+
+def _alpha_for_power(p_vals, weights, power):
+    """ The smallest p-value cut off that rejects outcomes with a total
+    weight of at least `power`.
+
+    This is an internal method only.
+    """
+    p_vals = p_vals.ravel()
+    order = numpy.argsort(p_vals, kind='stable')
+    cumulative = numpy.cumsum(weights.ravel()[order])
+    index = numpy.searchsorted(cumulative, power)
+    return float(p_vals[order][min(index, len(p_vals) - 1)])
+
+
+@functools.lru_cache(maxsize=256)
+def fisher_p_values(n_1, n_2):
+    """ The two-sided p-values of Fisher's exact test for every 2x2 table with
+    group sizes `n_1` and `n_2`.
+
+    The tables are grouped by their total number of successes `t`.  Given
+    `t`, the number of successes in the first group is hypergeometric and the
+    p-value of a table is the sum of the probabilities that are no larger
+    than its own.
+
+    The result is cached, so a search over sample sizes does not recompute
+    it.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+
+    Returns:
+        An array of shape (`n_1` + 1, `n_2` + 1) where entry [x_1, x_2] is the
+        p-value of the table with x_1 and x_2 successes.
+    """
+    total = numpy.arange(n_1 + n_2 + 1)[:, None]
+    x_1 = numpy.arange(n_1 + 1)[None, :]
+    # Entries outside the support of x_1 given t have a probability of 0.
+    pmf = stats.hypergeom.pmf(x_1, n_1 + n_2, n_1, total)
+    grid = _two_sided_p_values(pmf)
+
+    x_1 = numpy.arange(n_1 + 1)[:, None]
+    x_2 = numpy.arange(n_2 + 1)[None, :]
+    return grid[x_1 + x_2, x_1]
+
+
+def outcome_probabilities(n_1, n_2, p_1, p_2):
+    """ The probability of every 2x2 table for independent binomial groups.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        p_1: the probability of success in the first group.
+        p_2: the probability of success in the second group.
+
+    Returns:
+        An array of shape (`n_1` + 1, `n_2` + 1) where entry [x_1, x_2] is the
+        probability of x_1 and x_2 successes.
+    """
+    pmf_1 = stats.binom.pmf(numpy.arange(n_1 + 1), n_1, p_1)
+    pmf_2 = stats.binom.pmf(numpy.arange(n_2 + 1), n_2, p_2)
+    return numpy.outer(pmf_1, pmf_2)
+
+
+def fisher_power(n_1, n_2, p_1, p_2, alpha):
+    """ The exact power of Fisher's exact test.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        p_1: the probability of success in the first group.
+        p_2: the probability of success in the second group.
+        alpha: the significance level.
+
+    Returns:
+        A tuple of the power and the attained significance level, which is
+        the largest p-value that is still rejected.
+    """
+    p_vals = fisher_p_values(n_1, n_2)
+    rejected = p_vals < alpha
+    power = float(numpy.sum(outcome_probabilities(n_1, n_2, p_1, p_2),
+                            where=rejected))
+    if rejected.any():
+        attained = float(p_vals[rejected].max())
+    else:
+        attained = 0.0
+    return power, attained
+
+
+def fisher_alpha(n_1, n_2, p_1, p_2, power):
+    """ The smallest significance level for which Fisher's exact test has at
+    least the given power.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        p_1: the probability of success in the first group.
+        p_2: the probability of success in the second group.
+        power: the power required.
+
+    Returns:
+        The significance level.  Tables with a p-value at or below it are
+        rejected.
+    """
+    return _alpha_for_power(fisher_p_values(n_1, n_2),
+                            outcome_probabilities(n_1, n_2, p_1, p_2), power)
+
+
+@functools.lru_cache(maxsize=1024)
+def _binomial_regions(start, p_0, alpha):
+    """ The rejection regions of the two-sided binomial test for the sample
+    sizes `start` to `start + _CHUNK_SIZE - 1`.
+
+    This is an internal method only.
+    """
+    n = numpy.arange(start, start + _CHUNK_SIZE)[:, None]
+    x = numpy.arange(start + _CHUNK_SIZE)[None, :]
+    # Entries with x > n have a probability of 0 and are never rejected.
+    pmf = stats.binom.pmf(x, n, p_0)
+    rejected = (_two_sided_p_values(pmf) < alpha) & (x <= n)
+
+    # The binomial distribution is unimodal, so the rejection region is the
+    # two tails x <= lower and x >= upper.
+    mode = numpy.floor((n + 1) * p_0)
+    lower = numpy.where(rejected & (x <= mode), x, -1).max(axis=1)
+    upper = numpy.where(rejected & (x > mode), x, n + 1).min(axis=1)
+    return lower, upper
+
+
+def binomial_rejection_region(n, p_0, alpha):
+    """ The rejection region of the two-sided exact binomial test.
+
+    The regions are calculated for blocks of sample sizes at once and cached.
+
+    Arguments:
+        n: the sample size, or an array of sample sizes.
+        p_0: the probability of success under the null hypothesis.
+        alpha: the significance level.
+
+    Returns:
+        A tuple of arrays `lower` and `upper`.  The test rejects when the
+        number of successes is at most `lower` or at least `upper`.
+    """
+    n = numpy.asarray(n)
+    lower = numpy.empty(n.shape, dtype=int)
+    upper = numpy.empty(n.shape, dtype=int)
+    starts = n - n % _CHUNK_SIZE
+    for start in numpy.unique(starts):
+        chunk_lower, chunk_upper = _binomial_regions(int(start), p_0, alpha)
+        index = starts == start
+        lower[index] = chunk_lower[n[index] - start]
+        upper[index] = chunk_upper[n[index] - start]
+    return lower, upper
+
+
+def binomial_power(n, p, p_0, alpha):
+    """ The exact power of the two-sided exact binomial test.
+
+    Arguments:
+        n: the sample size, or an array of sample sizes.
+        p: the probability of success.
+        p_0: the probability of success under the null hypothesis.
+        alpha: the significance level.
+
+    Returns:
+        The power for each sample size.
+    """
+    lower, upper = binomial_rejection_region(n, p_0, alpha)
+    return stats.binom.cdf(lower, n, p) + stats.binom.sf(upper - 1, n, p)
+
+
+def binomial_alpha(n, p, p_0, power):
+    """ The smallest significance level for which the two-sided exact
+    binomial test has at least the given power.
+
+    Arguments:
+        n: the sample size.
+        p: the probability of success.
+        p_0: the probability of success under the null hypothesis.
+        power: the power required.
+
+    Returns:
+        The significance level.
+    """
+    x = numpy.arange(n + 1)
+    p_vals = _two_sided_p_values(stats.binom.pmf(x, n, p_0)[None, :])
+    return _alpha_for_power(p_vals, stats.binom.pmf(x, n, p), power)
+
+
+def binomial_sample_size(p, p_0, alpha, power, minimum, maximum):
+    """ The sample size for the two-sided exact binomial test.
+
+    Exact binomial power is not monotone in `n`: it rises in a sawtooth, so
+    a sample size that reaches the target can be followed by one that does
+    not.  Every sample size from `minimum` to `maximum` is scanned, which
+    is cheap since the power for all of them is calculated at once.
+
+    Arguments:
+        p: the probability of success.
+        p_0: the probability of success under the null hypothesis.
+        alpha: the significance level.
+        power: the power required.
+        minimum: the smallest sample size to consider.
+        maximum: the largest sample size to consider.
+
+    Returns:
+        A tuple of the smallest sample size with at least the required
+        power, the smallest sample size from which every larger sample size
+        up to `maximum` has at least the required power, and the powers of
+        both.
+
+    Raises:
+        BaseException: if the power at `maximum` is below `power`.
+    """
+    n = numpy.arange(minimum, maximum + 1)
+    powers = binomial_power(n, p, p_0, alpha)
+    reached = powers >= power
+    if not reached[-1]:
+        raise BaseException("N > " + str(maximum) +
+                            ".  You should use large sample theory.")
+    first = int(numpy.argmax(reached))
+    failed = numpy.flatnonzero(~reached)
+    if len(failed) == 0:
+        conservative = 0
+    else:
+        conservative = int(failed[-1]) + 1
+    return (int(n[first]), int(n[conservative]),
+            float(powers[first]), float(powers[conservative]))
+
+
+def _restricted_estimates(p_1, p_2, n_1, n_2, margin):
+    """ The maximum likelihood estimates of the two probabilities under the
+    restriction :math:`p_1 - p_2 = \\delta`, from Farrington and Manning
+    (1990).
+
+    This is an internal method only.
+    """
+    if margin == 0:
+        pooled = (n_1 * p_1 + n_2 * p_2) / (n_1 + n_2)
+        return pooled, pooled
+
+    theta = n_2 / n_1
+    a = 1 + theta
+    b = -(1 + theta + p_1 + theta * p_2 + margin * (theta + 2))
+    c = margin**2 + margin * (2 * p_1 + theta + 1) + p_1 + theta * p_2
+    d = -p_1 * margin * (1 + margin)
+    v = b**3 / (27 * a**3) - b * c / (6 * a**2) + d / (2 * a)
+    u = numpy.sign(v) * numpy.sqrt(b**2 / (9 * a**2) - c / (3 * a))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        w = (numpy.pi + numpy.arccos(numpy.clip(v / u**3, -1, 1))) / 3
+    restricted_1 = numpy.clip(2 * u * numpy.cos(w) - b / (3 * a), 0, 1)
+    restricted_2 = numpy.clip(restricted_1 - margin, 0, 1)
+    return restricted_1, restricted_2
+
+
+def unconditional_statistics(n_1, n_2, margin, method):
+    """ The test statistic of an unconditional test for every 2x2 table.
+
+    Larger values are more evidence for :math:`p_1 - p_2 > \\delta`.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        margin: the difference :math:`\\delta` under the null hypothesis.
+        method: 'barnard' for the unpooled Wald statistic, 'z-pooled' for
+            the score statistic or 'boschloo' for Fisher's one-sided p-value.
+
+    Returns:
+        An array of shape (`n_1` + 1, `n_2` + 1).
+    """
+    x_1 = numpy.arange(n_1 + 1)[:, None]
+    x_2 = numpy.arange(n_2 + 1)[None, :]
+    if method == 'boschloo':
+        # A smaller p-value is more extreme, so the statistic is its negative.
+        return -stats.hypergeom.sf(x_1 - 1, n_1 + n_2, n_1, x_1 + x_2)
+
+    p_1 = x_1 / n_1
+    p_2 = x_2 / n_2
+    if method == 'barnard':
+        variance = p_1 * (1 - p_1) / n_1 + p_2 * (1 - p_2) / n_2
+    else:
+        restricted_1, restricted_2 = _restricted_estimates(p_1, p_2, n_1, n_2,
+                                                           margin)
+        variance = (restricted_1 * (1 - restricted_1) / n_1 +
+                    restricted_2 * (1 - restricted_2) / n_2)
+    difference = p_1 - p_2 - margin
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        statistic = difference / numpy.sqrt(variance)
+    # Tables with no variance are only extreme through their difference.
+    extreme = numpy.where(difference > 0, numpy.inf,
+                          numpy.where(difference < 0, -numpy.inf, 0.0))
+    return numpy.where(variance > 0, statistic, extreme)
+
+
+def _nuisance_grid(margin, grid_size):
+    """ The values of :math:`p_2` on the boundary of the null hypothesis.
+
+    This is an internal method only.
+    """
+    return numpy.linspace(max(0, -margin), min(1, 1 - margin), grid_size)
+
+
+@functools.lru_cache(maxsize=64)
+def unconditional_p_values(n_1, n_2, margin, method, grid_size):
+    """ The p-values of an exact unconditional test for every 2x2 table.
+
+    The p-value of a table is the largest probability, over the nuisance
+    parameter :math:`p_2`, of a table at least as extreme.  The tables are
+    sorted by their statistic once.  For every point of the nuisance grid,
+    the tail probabilities are then the cumulative sums of the table
+    probabilities in that order, so all of the grid is handled in one pass.
+
+    The result is cached, so a search over sample sizes or significance
+    levels does not recompute it.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        margin: the difference :math:`\\delta` under the null hypothesis.
+        method: 'barnard', 'z-pooled' or 'boschloo'.
+        grid_size: the number of points in the nuisance grid.
+
+    Returns:
+        An array of shape (`n_1` + 1, `n_2` + 1) where entry [x_1, x_2] is the
+        p-value of the table with x_1 and x_2 successes.
+    """
+    statistic = unconditional_statistics(n_1, n_2, margin, method).ravel()
+    # Rounding makes tables with numerically equal statistics tie.
+    statistic = numpy.round(statistic, 10)
+    order = numpy.argsort(-statistic, kind='stable')
+
+    p_2 = _nuisance_grid(margin, grid_size)[:, None]
+    pmf_1 = stats.binom.pmf(numpy.arange(n_1 + 1), n_1, p_2 + margin)
+    pmf_2 = stats.binom.pmf(numpy.arange(n_2 + 1), n_2, p_2)
+    probabilities = (pmf_1[:, :, None] * pmf_2[:, None, :]).reshape(
+        grid_size, -1)
+    tails = numpy.cumsum(probabilities[:, order], axis=1).max(axis=0)
+
+    # A table is as extreme as every table it ties with, so its tail runs to
+    # the last table of its tie.
+    ordered = statistic[order]
+    last = numpy.searchsorted(-ordered, -ordered, side='right') - 1
+    p_vals = numpy.empty_like(tails)
+    p_vals[order] = numpy.minimum(tails[last], 1)
+    return p_vals.reshape(n_1 + 1, n_2 + 1)
+
+
+def unconditional_size(n_1, n_2, margin, rejected, grid_size):
+    """ The largest probability of rejecting over the null hypothesis.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        margin: the difference :math:`\\delta` under the null hypothesis.
+        rejected: a Boolean array of shape (`n_1` + 1, `n_2` + 1) marking the
+            rejected tables.
+        grid_size: the number of points in the nuisance grid.
+
+    Returns:
+        The size of the test.
+    """
+    p_2 = _nuisance_grid(margin, grid_size)[:, None]
+    pmf_1 = stats.binom.pmf(numpy.arange(n_1 + 1), n_1, p_2 + margin)
+    pmf_2 = stats.binom.pmf(numpy.arange(n_2 + 1), n_2, p_2)
+    size = numpy.einsum('gi,ij,gj->g', pmf_1, rejected.astype(float), pmf_2)
+    return float(size.max())
+
+
+def unconditional_power(n_1, n_2, p_1, p_2, margin, method, alpha,
+                        grid_size):
+    """ The exact power of an exact unconditional test.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        p_1: the probability of success in the first group.
+        p_2: the probability of success in the second group.
+        margin: the difference :math:`\\delta` under the null hypothesis.
+        method: 'barnard', 'z-pooled' or 'boschloo'.
+        alpha: the significance level.
+        grid_size: the number of points in the nuisance grid.
+
+    Returns:
+        A tuple of the power and the size of the test.
+    """
+    p_vals = unconditional_p_values(n_1, n_2, margin, method, grid_size)
+    rejected = p_vals < alpha
+    power = float(numpy.sum(outcome_probabilities(n_1, n_2, p_1, p_2),
+                            where=rejected))
+    return power, unconditional_size(n_1, n_2, margin, rejected, grid_size)
+
+
+def unconditional_alpha(n_1, n_2, p_1, p_2, margin, method, power,
+                        grid_size):
+    """ The smallest significance level for which an exact unconditional test
+    has at least the given power.
+
+    Arguments:
+        n_1: the size of the first group.
+        n_2: the size of the second group.
+        p_1: the probability of success in the first group.
+        p_2: the probability of success in the second group.
+        margin: the difference :math:`\\delta` under the null hypothesis.
+        method: 'barnard', 'z-pooled' or 'boschloo'.
+        power: the power required.
+        grid_size: the number of points in the nuisance grid.
+
+    Returns:
+        The significance level.
+    """
+    p_vals = unconditional_p_values(n_1, n_2, margin, method, grid_size)
+    return _alpha_for_power(p_vals, outcome_probabilities(n_1, n_2, p_1, p_2),
+                            power)
@@ -0,0 +1,199 @@
+import math
+from skdesign.power import (PowerBase,
+                            are_scalars,
+                            is_in_0_1,
+                            is_integer,
+                            is_numeric)
+from skdesign.power.proportions import exact as exact_power
+from skdesign.power.search import gallop_search
+
+
+class ExactUnconditional(PowerBase):
+    """ Hypotheses for exact unconditional tests of two proportions under a
+        parallel design.
+
+    Hypothesis:
+        The tests for superiority and non-inferiority are unified under the
+        hypothesis:
+
+        :math:`H_{0}: p_{1} - p_{2} \\le \\delta`
+        :math:`H_{1}: p_{1} - p_{2} > \\delta`
+
+        where :math:`\\delta` is the margin.  :math:`\\delta \\ge 0`
+        corresponds to a superiority test and :math:`\\delta < 0` to a
+        non-inferiority test.
+
+    The p-value of a table is the largest probability of a table at least as
+    extreme over a grid of the nuisance parameter :math:`p_{2}`, so the
+    power and size are calculated exactly.
+
+    Attributes:
+        n: The total sample size.
+        n_1: The sample size for group 1.
+        n_2: The sample size for group 2.
+        alpha: The :math:`\\alpha` level required by the hypothesis.
+        beta: The :math:`\\beta` level required by the hypothesis (equal to
+            :math:`1 - power`).
+        power: The power required by the hypothesis (equal to
+            :math:`1 - \\beta`).
+        p_1: The estimated value for the probability in group 1.
+        p_2: The estimated value for the probability in group 2.
+        ratio: The ratio of n_1 to n_2.
+        margin: The margin :math:`\\delta`.  The default is 0.
+        method: The test statistic.  One of 'barnard' (the unpooled Wald
+            statistic), 'z-pooled' (the score statistic) or 'boschloo'
+            (Fisher's one-sided p-value).  The default is 'z-pooled'.
+            'boschloo' only allows a margin of 0.
+        size: The largest probability of rejecting under the null hypothesis.
+    """
+
+    # Parameters controling the nuisance grid.
+    _GRID_SIZE = 200
+
+    # Parameters controling the search grid for the calculation of n_2.
+    _minN = 2
+    _maxN = 200
+
+    def __init__(self, n_1=None, n_2=None, ratio=None, alpha=None, beta=None,
+                 power=None, p_1=None, p_2=None, margin=None, method=None):
+        are_scalars(n_1=n_1, n_2=n_2, ratio=ratio, alpha=alpha, beta=beta,
+                    power=power, p_1=p_1, p_2=p_2, margin=margin)
+
+        is_in_0_1(p_1, 'p_1')
+        self.p_1 = p_1
+
+        is_in_0_1(p_2, 'p_2')
+        self.p_2 = p_2
+
+        if margin is None:
+            margin = 0
+        else:
+            is_numeric(margin, 'margin')
+            if abs(margin) >= 1:
+                raise ValueError('`margin` must be in (-1, 1)')
+        self.margin = margin
+
+        if method is None:
+            method = 'z-pooled'
+        if method not in ['barnard', 'z-pooled', 'boschloo']:
+            raise ValueError('{} is not a valid method'.format(method))
+        if method == 'boschloo' and margin != 0:
+            raise ValueError('boschloo only allows a margin of 0')
+        self.method = method
+
+        if n_1 is not None:
+            is_integer(n_1, 'n_1')
+        if n_2 is not None:
+            is_integer(n_2, 'n_2')
+
+        # n is only used to help with control flow
+        if ratio is None:
+            if n_1 is None:
+                ratio = 1
+                if n_2 is None:
+                    n = None
+                else:
+                    n_1 = n_2
+                    n = n_1 + n_2
+            else:
+                if n_2 is None:
+                    ratio = 1
+                    n_2 = n_1
+                    n = n_1 + n_2
+                else:
+                    n = n_1 + n_2
+                    ratio = n_1 / float(n_2)
+        else:
+            if n_1 is None:
+                if n_2 is None:
+                    n = None
+                else:
+                    n_1 = math.ceil(ratio * n_2)
+                    n = n_1 + n_2
+            else:
+                if n_2 is None:
+                    n_2 = math.ceil(n_1 / ratio)
+                    n = n_1 + n_2
+                else:
+                    n = n_1 + n_2
+
+        self.n_1 = n_1
+        self.n_2 = n_2
+        self.n = n
+        self.ratio = float(ratio)
+        self.size = None
+
+        super(ExactUnconditional, self).__init__(alpha=alpha, power=power,
+                                                 beta=beta,
+                                                 hypothesis='superiority')
+
+    def calculate(self):
+        """ Perfrom the power calculation """
+        if self.n is None:
+            self._set_default_alpha()
+            self._set_default_power()
+            self._calculate_n()
+        elif self.power is None:
+            self._set_default_alpha()
+            self._calculate_power()
+        elif self.alpha is None:
+            self._set_default_power()
+            self._calculate_alpha()
+
+    def _calculate_n(self):
+        """ Calculate n by galloping and bisection over n_2, with
+        :math:`n_1 = \\lceil ratio \\cdot n_2 \\rceil`.
+
+        Exact power is sawtooth shaped in n, so this is the first n found to
+        reach the power rather than a guaranteed minimum.
+
+        This is an internal method only.
+        """
+        def power_at(n_2):
+            power, _ = self._power_internals(math.ceil(self.ratio * n_2), n_2)
+            return power
+
+        self.n_2, self.power = gallop_search(power_at, self.power, self._minN,
+                                             self._maxN)
+        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n = self.n_1 + self.n_2
+        self.beta = 1 - self.power
+        _, self.size = self._power_internals(self.n_1, self.n_2)
+
+    def _calculate_power(self):
+        """ Calculate the exact power.
+
+        This is an internal method only.
+        """
+        self.power, self.size = self._power_internals(self.n_1, self.n_2)
+        self.beta = 1 - self.power
+
+    def _calculate_alpha(self):
+        """ Calculate the smallest :math:`\\alpha` with the required power.
+
+        This is an internal method only.
+        """
+        self.alpha = exact_power.unconditional_alpha(
+            self.n_1, self.n_2, self.p_1, self.p_2, self.margin, self.method,
+            self.power, self._GRID_SIZE)
+        # Tables with a p-value at the returned alpha are rejected too.
+        rejected = exact_power.unconditional_p_values(
+            self.n_1, self.n_2, self.margin, self.method,
+            self._GRID_SIZE) <= self.alpha
+        self.size = exact_power.unconditional_size(
+            self.n_1, self.n_2, self.margin, rejected, self._GRID_SIZE)
+
+    def _power_internals(self, n_1, n_2):
+        return exact_power.unconditional_power(n_1, n_2, self.p_1, self.p_2,
+                                               self.margin, self.method,
+                                               self.alpha, self._GRID_SIZE)
+
+    def __repr__(self):
+        """ The canonical representation of an ExactUnconditional object
+        """
+        representation = "Alpha: " + str(self.alpha) + "\n" + \
+                         "Power: " + str(self.power) + "\n" + \
+                         "Size: " + str(self.size) + "\n" + \
+                         "Sample Size (Group 1): " + str(self.n_1) + "\n" \
+                         "Sample Size (Group 2): " + str(self.n_2) + "\n"
+        return representation
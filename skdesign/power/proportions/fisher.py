@@ -1,11 +1,34 @@
 import math
-from skdesign.power import (PowerBase,
-                            is_in_0_1)
-import scipy.stats as stats
-import numpy.random as random
+from skdesign.power import (are_scalars,
+                            is_boolean,
+                            is_in_0_1,
+                            is_integer)
+from skdesign.power.proportions import exact as exact_power
+from skdesign.power.simulation import (simulate,
+                                       SimulationBase)
+from skdesign._lazy import lazy_import
+import numpy
 
+stats = lazy_import('scipy.stats')
 
-class Fisher(PowerBase):
+
+def _fisher_p_values(random_state, size, n_1, n_2, p_1, p_2):
+    """ Simulate `size` pairs of binomial samples and return the p-values of
+    Fisher's exact test for each of them.
+
+    This is an internal method only.
+    """
+    res_1 = random_state.binomial(n_1, p_1, size)
+    res_2 = random_state.binomial(n_2, p_2, size)
+
+    p_vals = numpy.empty(size)
+    for i, (x_1, x_2) in enumerate(zip(res_1, res_2)):
+        contingency = [[x_1, n_1 - x_1], [x_2, n_2 - x_2]]
+        _, p_vals[i] = stats.fisher_exact(contingency)
+    return p_vals
+
+
+class Fisher(SimulationBase):
     """ Hypotheses for Fisher's Exact Test
 
     Hypothesis:
@@ -32,6 +55,20 @@ class Fisher(PowerBase):
         p_0: The null value for the probability
         p_1: The estimated value for the probability
         margin: The margin used in superiority hypotheses
+        exact: (optional) If True, the power is calculated exactly by
+            enumerating every possible 2x2 table instead of by simulation.
+            The default is False.
+        seed: (optional) The seed for the simulations.
+        n_jobs: (optional) The number of processes to run the simulations
+            in.  -1 uses every CPU.  The results do not depend on `n_jobs`.
+            The default is to run in this process.
+        adaptive: (optional) If True, the simulations for each candidate
+            sample size stop once the simulated power is clearly above or
+            below the target power.  The default is False.
+        time_budget: (optional) The number of seconds the calculation may
+            run for.
+        mc_stderr: The Monte Carlo standard error of the simulated power.
+        n_sims: The number of simulations behind the simulated power.
     """
 
     # Parameters controling the simulation of power
@@ -43,7 +80,10 @@ class Fisher(PowerBase):
     _maxN = 200
 
     def __init__(self, n_1=None, n_2=None, ratio=None, alpha=None, beta=None, power=None,
-                 p_1=None, p_2=None):
+                 p_1=None, p_2=None, exact=None, seed=None, n_jobs=None,
+                 adaptive=None, time_budget=None):
+        are_scalars(n_1=n_1, n_2=n_2, ratio=ratio, alpha=alpha, beta=beta,
+                    power=power, p_1=p_1, p_2=p_2)
 
         is_in_0_1(p_1, 'p_1')
         self.p_1 = p_1
@@ -51,6 +91,21 @@ class Fisher(PowerBase):
         is_in_0_1(p_2, 'p_2')
         self.p_2 = p_2
 
+        if exact is None:
+            exact = False
+        else:
+            is_boolean(exact, 'exact')
+        self.exact = exact
+
+        if seed is None:
+            self.seed = self._SEED
+        else:
+            self.seed = seed
+
+        if n_jobs is not None:
+            is_integer(n_jobs, 'n_jobs')
+        self.n_jobs = n_jobs
+
         # n is only used to help with control flow
         if ratio is None:
             if n_1 is None:
@@ -88,15 +143,19 @@ class Fisher(PowerBase):
         self.ratio = float(ratio)
 
         super(Fisher, self).__init__(alpha=alpha, power=power,
-                                     beta=beta, hypothesis='equality')
+                                     beta=beta, hypothesis='equality',
+                                     adaptive=adaptive,
+                                     time_budget=time_budget)
 
     def calculate(self):
+        self._start_clock()
         if self.n is None:
             self.calculate_n()
         elif self.power is None:
             self.calculate_power()
         elif self.alpha is None:
             self.calculate_alpha()
+        self._set_simulation_error(self.n)
 
     def calculate_power(self):
         """ Perfrom the power calculation """
@@ -105,18 +164,14 @@ class Fisher(PowerBase):
         else:
             alpha = self.alpha
 
-        random.seed(self._SEED)
-
-        res_1 = random.binomial(self.n_1, self.p_1, self._N_SIMS)
-        res_2 = random.binomial(self.n_2, self.p_2, self._N_SIMS)
-
-        count = 0
-        for x_1, x_2 in zip(res_1, res_2):
-            contingency = [[x_1, self.n_1 - x_1], [x_2, self.n_2 - x_2]]
-            _, p_val = stats.fisher_exact(contingency)
-            if p_val < alpha:
-                count += 1
-        self.power = count / self._N_SIMS
+        if self.exact:
+            power, _ = exact_power.fisher_power(self.n_1, self.n_2, self.p_1,
+                                                self.p_2, alpha)
+            self.power = self._exact_estimate(self.n, power)
+        else:
+            p_vals = self._simulate_p_values(self.n_1, self.n_2,
+                                             self._stopping_rule(alpha))
+            self.power = self._power_estimate(self.n, p_vals, alpha)
         self.beta = 1 - self.power
 
     def calculate_alpha(self):
@@ -126,18 +181,15 @@ class Fisher(PowerBase):
         else:
             power = self.power
 
-        random.seed(self._SEED)
-
-        res_1 = random.binomial(self.n_1, self.p_1, self._N_SIMS)
-        res_2 = random.binomial(self.n_2, self.p_2, self._N_SIMS)
+        if self.exact:
+            self.alpha = exact_power.fisher_alpha(self.n_1, self.n_2,
+                                                  self.p_1, self.p_2, power)
+            self._exact_estimate(self.n, power)
+            return
 
-        res = []
-        for x_1, x_2 in zip(res_1, res_2):
-            contingency = [[x_1, self.n_1 - x_1], [x_2, self.n_2 - x_2]]
-            _, p_val = stats.fisher_exact(contingency)
-            res.append(p_val)
-        res.sort()
-        self.alpha = res[math.ceil(self._N_SIMS * power)]
+        res = numpy.sort(self._simulate_p_values(self.n_1, self.n_2))
+        self.alpha = float(res[math.ceil(self._N_SIMS * power)])
+        self._power_estimate(self.n, res, self.alpha)
 
     def calculate_n(self):
         """ Perfrom the power calculation """
@@ -151,17 +203,15 @@ class Fisher(PowerBase):
         else:
             alpha = self.alpha
 
-        random.seed(self._SEED)
-
-        res = self._power_internals(self._minN, alpha)
+        res = self._power_internals(self._minN, alpha, power)
         lag_lower = (self._minN, res[0])
         if lag_lower[1] > power:
             self.power = res[0]
             self.alpha = res[1]
-            self.n = self._minN[0]
+            self.n = self._minN
             return
 
-        res = self._power_internals(self._maxN, alpha)
+        res = self._power_internals(self._maxN, alpha, power)
         lag_upper = (self._maxN, res[0])
         if lag_upper[1] < power:
             raise BaseException("N > " + str(self._maxN) +
@@ -170,7 +220,7 @@ class Fisher(PowerBase):
         while True:
             delta_n = lag_upper[0] - lag_lower[0]
             test_n = math.floor(delta_n / 2) + lag_lower[0]
-            test_power, test_alpha, n_1, n_2 = self._power_internals(test_n, alpha)
+            test_power, test_alpha, n_1, n_2 = self._power_internals(test_n, alpha, power)
             if test_power < power:
                 # Look at upper half of what's left
                 lag_lower = (test_n, test_power, test_alpha, n_1, n_2)
@@ -199,22 +249,28 @@ class Fisher(PowerBase):
             self.n_2 = lag_upper[4]
         self.beta = 1 - self.power
 
-    def _power_internals(self, n, alpha):
-        count = 0
+    def _power_internals(self, n, alpha, target=None):
         n_1 = round(n * self.ratio / (1 + self.ratio))
         n_2 = n - n_1
 
-        res_1 = random.binomial(n_1, self.p_1, self._N_SIMS)
-        res_2 = random.binomial(n_2, self.p_2, self._N_SIMS)
-
-        p_vals = []
-        for x_1, x_2 in zip(res_1, res_2):
-            contingency = [[x_1, n_1 - x_1], [x_2, n_2 - x_2]]
-            _, p_val = stats.fisher_exact(contingency)
-            if p_val < alpha:
-                count += 1
-            p_vals.append(p_val)
-        p_vals.sort()
-        power = count / self._N_SIMS
-        alpha = p_vals[int(self._N_SIMS * power) - 1]
+        if self.exact:
+            power, alpha = exact_power.fisher_power(n_1, n_2, self.p_1,
+                                                    self.p_2, alpha)
+            return self._exact_estimate(n, power), alpha, n_1, n_2
+
+        stop = self._stopping_rule(alpha, target)
+        p_vals = numpy.sort(self._simulate_p_values(n_1, n_2, stop))
+        power = self._power_estimate(n, p_vals, alpha)
+        alpha = float(p_vals[int(len(p_vals) * power) - 1])
         return power, alpha, n_1, n_2
+
+    def _simulate_p_values(self, n_1, n_2, stop=None):
+        """ Simulate `_N_SIMS` trials with `n_1` and `n_2` subjects and
+        return the p-values of Fisher's exact test.  If `stop` is given, the
+        simulations end once it returns True.
+
+        This is an internal method only.
+        """
+        return simulate(_fisher_p_values, self._N_SIMS, self.seed,
+                        n_jobs=self.n_jobs,
+                        args=(n_1, n_2, self.p_1, self.p_2), stop=stop)
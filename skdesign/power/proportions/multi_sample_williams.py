@@ -33,10 +33,9 @@ class MultiSampleWilliams(MultiSampleWilliamsMeans):
         margin: This is the superiority or equivalence margin.
 
     Note:
-        Currently, this function returns the best power and the best alpha when
-        power or alpha are unknown.  I don't think this is the best approach,
-        so it may change.  I may change it to return a power calculation for
-        each contrast.
+        When power or alpha are unknown, they are calculated for the pair of
+        means that limits the design, which is the pair that needs the
+        largest n.  The power of every pair is kept in `pairwise_power`.
     """
 
     def __init__(self, n=None, p=None, stdev=None, hypothesis=None,
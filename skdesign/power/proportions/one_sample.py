@@ -1,6 +1,9 @@
 from skdesign.power.means import OneSample as OneSampleMeans
 from skdesign.power import is_in_0_1
+from skdesign.power import numerics
+from skdesign.power.search import vectorized_root
 import math
+import numpy
 
 
 class OneSample(OneSampleMeans):
@@ -28,7 +31,9 @@ class OneSample(OneSampleMeans):
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
         p_0: The null value for the probability
-        p: The estimated value for the probability
+        p: The estimated value for the probability.  If it is None, it is
+            calculated as the :math:`p` above :math:`p_{0}` at which the
+            test has the power at n.
         hypothesis: One of 'equality', 'superiority', or 'equvalence'.  Tests
             of 'non-inferiority' are the same as tests of 'superiority' with
             respect to the power calculation so choose 'superiority' for both.
@@ -38,16 +43,72 @@ class OneSample(OneSampleMeans):
     def __init__(self, n=None, p=None, p_0=None, margin=None,
                  alpha=None, beta=None, power=None, hypothesis=None):
 
-        is_in_0_1(p, 'p')
-        self.p = p
-
         is_in_0_1(p_0, 'p_0')
         self.p_0 = p_0
 
-        stdev = math.sqrt(p * (1 - p))
+        # p is calculated when it is None.  The standard deviation depends on
+        # p, so the largest one stands in until then.
+        if p is None:
+            stdev = 0.5
+        else:
+            is_in_0_1(p, 'p')
+            stdev = numpy.sqrt(p * (1 - p))
+        self.p = p
 
         # Initialize the remaining arguments through the parent.
         super(OneSample, self).__init__(n=n, mu=p, mu_0=p_0, stdev=stdev,
                                         known_stdev=True, alpha=alpha,
                                         beta=beta, power=power, margin=margin,
                                         hypothesis=hypothesis)
+
+    def _theta(self, p):
+        """ The standardized difference between `p` and :math:`p_{0}`.
+
+        This is an internal method only.
+        """
+        epsilon = numpy.abs(p - self.p_0)
+        if self.hypothesis == 'superiority':
+            epsilon = epsilon - self.margin
+        elif self.hypothesis == 'equivalence':
+            epsilon = self.margin - epsilon
+        with numpy.errstate(divide='ignore'):
+            return epsilon / numpy.sqrt(p * (1 - p))
+
+    def _calculate_effect(self):
+        """ Calculate the :math:`p` above :math:`p_{0}` at which the test has
+        the required power at n.
+
+        The standard deviation depends on :math:`p`, so
+        :math:`\\sqrt{n} \\theta = z_{\\alpha} + z_{\\beta}` is solved for
+        :math:`p` by a bracketed root search, as for the two sample test.
+        For equivalence it is the largest :math:`p` that still has the power.
+        It is NaN if no :math:`p` has the power.
+
+        This is an internal method only.
+        """
+        if self.n is None:
+            raise ValueError('`n` must be provided to calculate `p`')
+        self._set_default_alpha()
+        self._set_default_power()
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        target = (z_alpha + z_beta) / math.sqrt(self.n)
+
+        if self.hypothesis == 'equivalence':
+            # theta falls as p moves away from p_0.
+            upper = min(self.margin, 1 - self.p_0)
+            difference, _ = vectorized_root(
+                lambda difference: -1 * self._theta(self.p_0 + difference),
+                -1 * target, 0, upper, upper)
+            if self._theta(self.p_0) < target:
+                difference = math.nan
+        else:
+            upper = 1 - self.p_0
+            difference, _ = vectorized_root(
+                lambda difference: self._theta(self.p_0 + difference),
+                target, 0, upper, upper)
+        self.p = self.p_0 + difference
+        self.mu = self.p
+        self.stdev = math.sqrt(self.p * (1 - self.p))
+        self.theta = self._theta(self.p)
+        self.epsilon = self.theta * self.stdev
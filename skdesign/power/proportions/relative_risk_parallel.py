@@ -1,8 +1,11 @@
 from skdesign.power import (PowerBase,
-                            is_in_0_1)
+                            ceil,
+                            is_in_0_1,
+                            to_float)
 import math
 import numbers
-import scipy.stats as stats
+import numpy
+from skdesign.power import numerics
 
 
 class RelativeRiskParallel(PowerBase):
@@ -49,7 +52,8 @@ class RelativeRiskParallel(PowerBase):
         margin: This is the superiority or equivalence margin.
         p_1: The probability for the control group
         p_2: The probability for the treatment
-        ratio: The ratio of n_1 to n_2.
+        ratio: The ratio of n_1 to n_2.  It can be an array when n is
+            calculated.
     """
 
     def __init__(self, n_1=None, n_2=None, p_1=None, p_2=None, margin=None,
@@ -92,10 +96,10 @@ class RelativeRiskParallel(PowerBase):
         self.n_1 = n_1
         self.n_2 = n_2
         self.n = n
-        self.ratio = float(ratio)
+        self.ratio = to_float(ratio)
 
         stdev = (1 / (p_1 * (1 - p_1) * ratio)) + (1 / (p_2 * (1 - p_2)))
-        stdev = math.sqrt(stdev)
+        stdev = numpy.sqrt(stdev)
 
         odds_ratio = math.log((p_2 * (1 - p_1)) / (p_1 * (1 - p_2)))
 
@@ -119,13 +123,12 @@ class RelativeRiskParallel(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
 
         n_2 = (z_alpha + z_beta)**2 / self.theta**2
-        self.n_2 = math.ceil(n_2)
-        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n_2 = ceil(n_2)
+        self.n_1 = ceil(self.ratio * self.n_2)
         self.n = self.n_1 + self.n_2
 
     def _calculate_alpha_known(self):
@@ -134,22 +137,20 @@ class RelativeRiskParallel(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-        z_alpha = math.sqrt(self.n_2) * self.theta - z_beta
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numpy.sqrt(self.n_2) * self.theta - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = math.sqrt(self.n_2) * self.theta - z_alpha
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numpy.sqrt(self.n_2) * self.theta - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
 
     def calculate(self):
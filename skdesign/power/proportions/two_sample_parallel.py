@@ -1,7 +1,12 @@
 from skdesign.power import (PowerBase,
-                            is_in_0_1)
+                            ceil,
+                            is_in_0_1,
+                            to_float)
 import math
-import scipy.stats as stats
+import numpy
+from skdesign.power import numerics
+from skdesign.power.functions import NormalPower
+from skdesign.power.search import vectorized_root
 
 
 class TwoSampleParallel(PowerBase):
@@ -39,15 +44,24 @@ class TwoSampleParallel(PowerBase):
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
         p_1: The null value for the probability
-        p_2: The estimated value for the probability
-        ratio: The ratio of n_1 to n_2.
+        p_2: The estimated value for the probability.  If it is None, it is
+            calculated as the :math:`p_{2}` above :math:`p_{1}` at which the
+            test has the power at n_2.
+        ratio: The ratio of n_1 to n_2.  It can be an array when n is
+            calculated.
     """
 
     def __init__(self, n_1=None, n_2=None, p_1=None, p_2=None, margin=None,
                  ratio=None, hypothesis=None, alpha=None, beta=None,
                  power=None):
         is_in_0_1(p_1, '`p_1` should be in (0, 1).')
-        is_in_0_1(p_2, '`p_2` should be in (0, 1).')
+        self.p_1 = p_1
+
+        # p_2 is calculated when it is None
+        if p_2 is not None:
+            is_in_0_1(p_2, '`p_2` should be in (0, 1).')
+        self.p_2 = p_2
+        self.margin = margin
 
         # n is only used to help with control flow
         if ratio is None:
@@ -83,41 +97,99 @@ class TwoSampleParallel(PowerBase):
         self.n_1 = n_1
         self.n_2 = n_2
         self.n = n
-        self.ratio = float(ratio)
+        self.ratio = to_float(ratio)
+
+        # Initialize the remaining arguments through the parent.
+        super(TwoSampleParallel, self).__init__(alpha=alpha,
+                                                power=power,
+                                                beta=beta,
+                                                hypothesis=hypothesis)
+
+        if p_2 is None:
+            self.theta = None
+        else:
+            self.theta = self._theta(p_2)
 
-        stdev = p_1 * (1 - p_1) / ratio + p_2 * (1 - p_2)
-        stdev = math.sqrt(stdev)
+    def _theta(self, p_2):
+        """ The standardized difference between the proportions for the
+        proportion `p_2` in group 2.
+
+        This is an internal method only.
+        """
+        stdev = numpy.sqrt(self.p_1 * (1 - self.p_1) / self.ratio +
+                           p_2 * (1 - p_2))
 
-        epsilon = abs(p_1 - p_2)
+        epsilon = numpy.abs(self.p_1 - p_2)
 
-        if hypothesis is 'superiority':
-            epsilon = epsilon + margin
-        elif hypothesis is 'equivalence':
+        if self.hypothesis == 'superiority':
+            epsilon = epsilon + self.margin
+        elif self.hypothesis == 'equivalence':
             # This should be margin - abs(epsilon), but the abs() is taken care
             # of when epsilon is set for generality purposes
-            epsilon = margin - abs(epsilon)
+            epsilon = self.margin - epsilon
 
-        self.theta = epsilon / stdev
+        return epsilon / stdev
 
-        # Initialize the remaining arguments through the parent.
-        # Initialize the remaining arguments through the parent.
-        super(TwoSampleParallel, self).__init__(alpha=alpha,
-                                                power=power,
-                                                beta=beta,
-                                                hypothesis=hypothesis)
+    def _calculate_effect(self):
+        """ Calculate the :math:`p_{2}` above :math:`p_{1}` at which the
+        test has the required power at n_2.
+
+        The power is reached when
+        :math:`\\sqrt{n_{2}} \\theta = z_{\\alpha} + z_{\\beta}`, which is
+        solved for :math:`p_{2}` by a bracketed root search.  For
+        equivalence it is the largest :math:`p_{2}` that still has the
+        power.  It is NaN if no
+        :math:`p_{2}` has the power.
+
+        This is an internal method only.
+        """
+        if self.n_2 is None:
+            raise ValueError('`n_1` or `n_2` must be provided to calculate '
+                             '`p_2`')
+        self._set_default_alpha()
+        self._set_default_power()
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        target = (z_alpha + z_beta) / math.sqrt(self.n_2)
+
+        if self.hypothesis == 'equivalence':
+            # theta falls as p_2 moves away from p_1.
+            upper = min(self.margin, 1 - self.p_1)
+            difference, _ = vectorized_root(
+                lambda difference: -1 * self._theta(self.p_1 + difference),
+                -1 * target, 0, upper, upper)
+            if self._theta(self.p_1) < target:
+                difference = math.nan
+        else:
+            upper = 1 - self.p_1
+            difference, _ = vectorized_root(
+                lambda difference: self._theta(self.p_1 + difference),
+                target, 0, upper, upper)
+        self.p_2 = self.p_1 + difference
+        self.theta = self._theta(self.p_2)
+
+    def power_function(self):
+        """ The power as a function of n_2, with the constants of the
+        hypothesis worked out once.  :math:`\\alpha` defaults to 0.05.
+
+        Returns:
+            A `skdesign.power.functions.NormalPower`.
+        """
+        self._set_default_alpha()
+        return NormalPower(self.theta, self.alpha, self._alpha_adjustment,
+                           self._beta_adjustment)
 
     def _calculate_n_known(self):
         """ Calculate n in the case that the standard deviation is known.
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
 
         n_2 = (z_alpha + z_beta)**2 / self.theta**2
-        self.n_2 = math.ceil(n_2)
-        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n_2 = ceil(n_2)
+        self.n_1 = ceil(self.ratio * self.n_2)
         self.n = self.n_1 + self.n_2
 
     def _calculate_alpha_known(self):
@@ -126,27 +198,27 @@ class TwoSampleParallel(PowerBase):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-        z_alpha = math.sqrt(self.n_2) * self.theta - z_beta
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numpy.sqrt(self.n_2) * self.theta - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = math.sqrt(self.n_2) * self.theta - z_alpha
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numpy.sqrt(self.n_2) * self.theta - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
 
     def calculate(self):
         """ Perfrom the power calculation """
-        if self.n is None:
+        if self.p_2 is None:
+            self._calculate_effect()
+        elif self.n is None:
             self._set_default_alpha()
             self._set_default_power()
             self._calculate_n_known()
@@ -0,0 +1,267 @@
+""" Searches over integer sample sizes and continuous effects.
+"""
+import collections
+import math
+import numpy
+
+SearchResult = collections.namedtuple('SearchResult',
+                                      ['n', 'value', 'evaluations'])
+
+
+def gallop_search(function, target, minimum, maximum):
+    """ Find the smallest `n` in [`minimum`, `maximum`] with
+    `function(n) >= target`.
+
+    The search starts at `minimum` and doubles its step until the target is
+    reached (galloping), then bisects the last bracket.  It assumes that
+    `function` is increasing in `n`, so it needs about 2 log2(n) evaluations
+    instead of the n evaluations of a linear scan.
+
+    Arguments:
+        function: a function of the integer sample size, such as power.
+        target: the value that `function` must reach.
+        minimum: the smallest sample size to consider.
+        maximum: the largest sample size to consider.
+
+    Returns:
+        A tuple of the sample size and the value of `function` there.
+    """
+    result = integer_search(function, target, minimum, minimum, maximum)
+    return result.n, result.value
+
+
+def integer_search(function, target, start, minimum, maximum):
+    """ Find the smallest `n` in [`minimum`, `maximum`] with
+    `function(n) >= target`, starting from a guess.
+
+    The search evaluates `function` at the integer nearest to `start`, then
+    gallops down or up with a doubling step until the target is bracketed
+    and bisects the bracket.  It assumes that `function` is increasing in
+    `n`.  With a good guess, such as the sample size for a known standard
+    deviation, the bracket is found in a few evaluations.
+
+    Arguments:
+        function: a function of the integer sample size, such as power.
+        target: the value that `function` must reach.
+        start: the first guess for the sample size.  It does not have to be
+            an integer and is moved into [`minimum`, `maximum`].
+        minimum: the smallest sample size to consider.
+        maximum: the largest sample size to consider.
+
+    Returns:
+        A `SearchResult` with the sample size, the value of `function` there
+        and the number of evaluations of `function` used.
+    """
+    evaluations = [0]
+
+    def evaluate(n):
+        evaluations[0] += 1
+        return function(n)
+
+    if start is None or not math.isfinite(start):
+        start = maximum
+    start = min(max(int(math.ceil(start)), minimum), maximum)
+    start_value = evaluate(start)
+
+    step = 1
+    if start_value >= target:
+        # Gallop down until the target is missed.
+        upper, upper_value = start, start_value
+        while True:
+            if upper <= minimum:
+                return SearchResult(upper, upper_value, evaluations[0])
+            lower = max(upper - step, minimum)
+            lower_value = evaluate(lower)
+            if lower_value < target:
+                break
+            upper, upper_value = lower, lower_value
+            step *= 2
+    else:
+        # Gallop up until the target is reached.
+        lower = start
+        while True:
+            if lower >= maximum:
+                raise BaseException("N is greater than maximum N")
+            upper = min(lower + step, maximum)
+            upper_value = evaluate(upper)
+            if upper_value >= target:
+                break
+            lower = upper
+            step *= 2
+
+    while upper - lower > 1:
+        middle = (lower + upper) // 2
+        middle_value = evaluate(middle)
+        if middle_value >= target:
+            upper, upper_value = middle, middle_value
+        else:
+            lower = middle
+    return SearchResult(upper, upper_value, evaluations[0])
+
+
+def vectorized_search(function, target, start, minimum, maximum):
+    """ Find the smallest `n` in [`minimum`, `maximum`] with
+    `function(n) >= target` for every element of an array at once.
+
+    This is `integer_search` run in lockstep: every step evaluates
+    `function` once on an array of candidate sample sizes, so a vectorized
+    power function solves a whole table of designs in a few calls.
+
+    Arguments:
+        function: a vectorized function of an array of integer sample sizes.
+        target: the value that `function` must reach.  It can be an array.
+        start: the first guess for the sample sizes.  It can be an array and
+            non-finite guesses start at `maximum`.
+        minimum: the smallest sample size to consider.
+        maximum: the largest sample size to consider.
+
+    Returns:
+        A `SearchResult` with the sample sizes, the values of `function`
+        there and the number of calls to `function`.
+    """
+    start = numpy.nan_to_num(numpy.asarray(start, dtype=float), nan=maximum,
+                             posinf=maximum, neginf=minimum)
+    start = numpy.clip(numpy.ceil(start), minimum, maximum).astype(int)
+    evaluations = 1
+    start_value = numpy.asarray(function(start), dtype=float)
+    shape = numpy.broadcast(start, start_value, target).shape
+    start = numpy.broadcast_to(start, shape)
+    reached = numpy.broadcast_to(start_value >= target, shape)
+
+    # The largest n known to miss the target and the smallest n known to
+    # reach it.  minimum - 1 and maximum + 1 stand for none yet.
+    lower = numpy.where(reached, minimum - 1, start)
+    upper = numpy.where(reached, start, maximum + 1)
+    upper_value = numpy.where(reached, start_value, numpy.nan)
+
+    def update(candidate, active):
+        value = numpy.asarray(function(candidate), dtype=float)
+        reached = value >= target
+        new_upper = active & reached
+        new_lower = active & ~reached
+        return (numpy.where(new_lower, candidate, lower),
+                numpy.where(new_upper, candidate, upper),
+                numpy.where(new_upper, value, upper_value))
+
+    step = 1
+    while True:
+        down = (upper <= maximum) & (lower < minimum) & (upper > minimum)
+        up = (upper > maximum) & (lower < maximum)
+        if not numpy.any(down | up):
+            break
+        candidate = numpy.where(down, numpy.maximum(upper - step, minimum),
+                                numpy.where(up,
+                                            numpy.minimum(lower + step,
+                                                          maximum),
+                                            start))
+        lower, upper, upper_value = update(candidate, down | up)
+        evaluations += 1
+        step *= 2
+    if numpy.any(upper > maximum):
+        raise BaseException("N is greater than maximum N")
+
+    while numpy.any(upper - lower > 1):
+        active = upper - lower > 1
+        candidate = numpy.where(active, (lower + upper) // 2, upper)
+        lower, upper, upper_value = update(candidate, active)
+        evaluations += 1
+
+    if upper.ndim == 0:
+        return SearchResult(int(upper), float(upper_value), evaluations)
+    return SearchResult(upper, upper_value, evaluations)
+
+
+def vectorized_root(function, target, lower, upper, maximum=numpy.inf,
+                    tolerance=1e-10):
+    """ Find where an increasing `function` of a continuous value reaches
+    `target`, for every element of an array at once.
+
+    While `function(upper)` is below the target the bracket moves up, to
+    [`upper`, `upper` + 2 (`upper` - `lower`)], but not past `maximum`.  The
+    bracket is then narrowed by the Illinois variant of false position,
+    which keeps the root bracketed like bisection but converges in a few
+    steps for a smooth function such as power.  It stops when the bracket
+    is narrower than `tolerance` relative to `upper`, or when `function` is
+    within `tolerance` of the target.
+
+    Arguments:
+        function: a vectorized increasing function.
+        target: the value that `function` must reach.  It can be an array.
+        lower: the lower end of the first bracket.  It can be an array.
+        upper: the upper end of the first bracket.  It can be an array.
+        maximum: (optional) the largest value to consider.
+        tolerance: (optional) the relative width of the final bracket.
+
+    Returns:
+        A tuple of the smallest value found with `function` at least
+        `target` and the value of `function` there.  Both are NaN where the
+        target is not reached by `maximum`, and the value is `lower` where
+        the target is already reached there.
+    """
+    lower, upper, target = numpy.broadcast_arrays(
+        *[numpy.asarray(value, dtype=float)
+          for value in (lower, upper, target)])
+    lower = lower.copy()
+    upper = numpy.minimum(upper, maximum)
+    shape = upper.shape
+
+    def evaluate(x):
+        return numpy.broadcast_to(
+            numpy.asarray(function(x), dtype=float), shape)
+
+    value = evaluate(upper)
+    while True:
+        missed = (value < target) & (upper < maximum)
+        if not numpy.any(missed):
+            break
+        width = numpy.maximum(upper - lower, tolerance)
+        lower = numpy.where(missed, upper, lower)
+        upper = numpy.where(missed,
+                            numpy.minimum(upper + 2 * width, maximum),
+                            upper)
+        value = numpy.where(missed, evaluate(upper), value)
+    reached = value >= target
+    lower_value = evaluate(lower)
+    at_lower = lower_value >= target
+
+    # The distances from the target that set the next false position.  One
+    # of them is halved when the same end moves twice in a row.
+    lower_distance = lower_value - target
+    upper_distance = value - target
+    last_upper = numpy.zeros(shape, dtype=bool)
+    last_lower = numpy.zeros(shape, dtype=bool)
+    while True:
+        active = (reached & ~at_lower &
+                  (upper - lower > tolerance * numpy.maximum(numpy.abs(upper),
+                                                             1)) &
+                  (value - target > tolerance))
+        if not numpy.any(active):
+            break
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            middle = upper - upper_distance * (upper - lower) / (
+                upper_distance - lower_distance)
+        inside = (middle > lower) & (middle < upper)
+        middle = numpy.where(active & inside, middle, (lower + upper) / 2)
+        middle_value = evaluate(middle)
+        above = active & (middle_value >= target)
+        below = active & ~(middle_value >= target)
+        upper = numpy.where(above, middle, upper)
+        value = numpy.where(above, middle_value, value)
+        upper_distance = numpy.where(above, middle_value - target,
+                                     upper_distance)
+        lower_distance = numpy.where(above & last_upper, lower_distance / 2,
+                                     lower_distance)
+        lower = numpy.where(below, middle, lower)
+        lower_distance = numpy.where(below, middle_value - target,
+                                     lower_distance)
+        upper_distance = numpy.where(below & last_lower, upper_distance / 2,
+                                     upper_distance)
+        last_upper = numpy.where(active, above, last_upper)
+        last_lower = numpy.where(active, below, last_lower)
+
+    root = numpy.where(at_lower, lower, numpy.where(reached, upper, numpy.nan))
+    value = numpy.where(at_lower, lower_value,
+                        numpy.where(reached, value, numpy.nan))
+    if root.ndim == 0:
+        return float(root), float(value)
+    return root, value
@@ -0,0 +1,378 @@
+""" Shared random number streams for the simulation based power calculations.
+
+Simulations are split into fixed blocks of `_BLOCK_SIZE` samples.  Block `b`
+always draws from child `b` of `numpy.random.SeedSequence(seed)`, so the
+results are the same whether the blocks run in this process or are spread
+over a pool of `n_jobs` processes.
+"""
+import atexit
+import concurrent.futures
+import functools
+import math
+import os
+import time
+import numpy
+from skdesign.power import (PowerBase,
+                            is_boolean,
+                            is_positive)
+
+_BLOCK_SIZE = 100
+
+# Parameters controling sequential stopping.  The simulations stop once the
+# power is `_STOP_Z` standard errors away from its target, after at least
+# `_MIN_SIMS` simulations.
+_MIN_SIMS = 200
+_STOP_Z = 2.576
+
+
+@functools.lru_cache(maxsize=None)
+def _executor(n_jobs):
+    """ A process pool with `n_jobs` workers, shared between calculations.
+
+    This is an internal method only.
+    """
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs)
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def _workers(n_jobs):
+    """ The number of processes to use for `n_jobs`.  -1 uses every CPU.
+
+    This is an internal method only.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _block_sizes(n_sims):
+    """ Split `n_sims` simulations into blocks of at most `_BLOCK_SIZE`.
+
+    This is an internal method only.
+    """
+    sizes = [_BLOCK_SIZE] * (n_sims // _BLOCK_SIZE)
+    if n_sims % _BLOCK_SIZE:
+        sizes.append(n_sims % _BLOCK_SIZE)
+    return sizes
+
+
+def _run_block(function, seed_sequence, size, args):
+    """ Run one block of simulations.
+
+    This is an internal method only.
+    """
+    random_state = numpy.random.default_rng(seed_sequence)
+    return function(random_state, size, *args)
+
+
+def _collect(block_function, blocks, workers, stop):
+    """ Run `block_function` over `blocks` and concatenate the results.
+
+    The blocks are run in order, in waves of `workers` blocks.  If `stop` is
+    given, it is called on the results so far after each block, and the
+    remaining blocks are skipped once it returns True.  The blocks are
+    checked one at a time whatever the number of workers, so the stopping
+    point does not depend on `workers`.
+
+    This is an internal method only.
+    """
+    if workers == 1 or len(blocks) == 1:
+        wave_size = 1
+    else:
+        wave_size = workers
+    results = []
+    for start in range(0, len(blocks), wave_size):
+        wave = blocks[start:start + wave_size]
+        if wave_size == 1:
+            outputs = [block_function(*wave[0])]
+        else:
+            outputs = _executor(workers).map(block_function, *zip(*wave))
+        for output in outputs:
+            results.append(output)
+            if stop is not None and stop(numpy.concatenate(results)):
+                return numpy.concatenate(results)
+    return numpy.concatenate(results)
+
+
+def simulate(function, n_sims, seed, n_jobs=None, args=(), stop=None):
+    """ Run `n_sims` simulations in reproducible blocks.
+
+    Arguments:
+        function: a function called as `function(random_state, size, *args)`
+            that returns an array with the results of `size` simulations.
+            It must be defined at the top level of a module so that it can
+            be sent to other processes.
+        n_sims: the number of simulations.
+        seed: the seed for the simulations.
+        n_jobs: (optional) the number of processes to use.  -1 uses every
+            CPU.  The default is to run in this process.
+        args: (optional) extra arguments for `function`.
+        stop: (optional) a function of the results so far that returns True
+            once no more simulations are needed.  It is checked after each
+            block.
+
+    Returns:
+        An array with the results of the simulations, in order.  It has
+        `n_sims` entries unless `stop` ended the simulations early.
+    """
+    sizes = _block_sizes(n_sims)
+    seed_sequences = numpy.random.SeedSequence(seed).spawn(len(sizes))
+    blocks = [(function, seed_sequence, size, args)
+              for seed_sequence, size in zip(seed_sequences, sizes)]
+    return _collect(_run_block, blocks, _workers(n_jobs), stop)
+
+
+def _map_rows_block(function, rows, args):
+    """ Apply `function` to one block of rows.
+
+    This is an internal method only.
+    """
+    return function(rows, *args)
+
+
+def map_rows(function, sample, n_jobs=None, args=(), stop=None):
+    """ Apply `function` to the rows of `sample` in blocks of `_BLOCK_SIZE`.
+
+    This is used when the samples are already drawn, for instance from a
+    `CommonRandomNumbers` stream.
+
+    Arguments:
+        function: a function called as `function(rows, *args)` that returns
+            an array with one result per row.
+        sample: a two dimensional array.
+        n_jobs: (optional) the number of processes to use.  -1 uses every
+            CPU.  The default is to run in this process.
+        args: (optional) extra arguments for `function`.
+        stop: (optional) a function of the results so far that returns True
+            once no more rows are needed.  It is checked after each block.
+
+    Returns:
+        An array with one result per row of `sample` that was used.
+    """
+    workers = _workers(n_jobs)
+    if stop is None and (workers == 1 or len(sample) <= _BLOCK_SIZE):
+        return function(sample, *args)
+    blocks = [(function, sample[i:i + _BLOCK_SIZE], args)
+              for i in range(0, len(sample), _BLOCK_SIZE)]
+    return _collect(_map_rows_block, blocks, workers, stop)
+
+
+def power_stderr(p_vals, alpha):
+    """ The simulated power and its Monte Carlo standard error.
+
+    Arguments:
+        p_vals: the simulated p-values.
+        alpha: the significance level.
+
+    Returns:
+        A tuple of the power and its standard error.
+    """
+    n_sims = len(p_vals)
+    power = float(numpy.mean(p_vals < alpha))
+    return power, math.sqrt(power * (1 - power) / n_sims)
+
+
+def stopping_rule(alpha, target=None, deadline=None):
+    """ A `stop` function for sequential power simulations.
+
+    The simulations stop once the confidence interval for the power lies
+    entirely above or below `target`, or once the clock passes `deadline`.
+    The interval is only checked after `_MIN_SIMS` simulations and uses the
+    adjusted estimate :math:`(x + 2) / (m + 4)`, so that a power estimate of
+    exactly 0 or 1 does not stop the simulations at once.
+
+    Arguments:
+        alpha: the significance level.
+        target: (optional) the power that is searched for.  If it is None,
+            only the deadline is checked.
+        deadline: (optional) a time from `time.monotonic` after which the
+            simulations stop.
+
+    Returns:
+        A function of the p-values so far that returns True once the
+        simulations can stop.
+    """
+    def stop(p_vals):
+        if deadline is not None and time.monotonic() > deadline:
+            return True
+        n_sims = len(p_vals)
+        if target is None or n_sims < _MIN_SIMS:
+            return False
+        adjusted = (numpy.sum(p_vals < alpha) + 2) / (n_sims + 4)
+        stderr = math.sqrt(adjusted * (1 - adjusted) / (n_sims + 4))
+        return abs(adjusted - target) > _STOP_Z * stderr
+    return stop
+
+
+def row_p_values(sample, test, vectorized):
+    """ The p-values of `test` for each row of `sample`.
+
+    Arguments:
+        sample: a two dimensional array with one sample per row.
+        test: a test returning a tuple of the statistic and the p-value.
+        vectorized: if True, `test` tests every row at once.
+
+    Returns:
+        An array of p-values.
+    """
+    if vectorized:
+        _, p_vals = test(sample)
+        return numpy.asarray(p_vals, dtype=float)
+    return numpy.array([test(row)[1] for row in sample], dtype=float)
+
+
+def sample_p_values(random_state, size, dist, n, test, vectorized):
+    """ Draw `size` samples of size `n` from `dist` and test each of them.
+
+    This is the block function for `simulate` used by the tests of
+    distributions.
+
+    Returns:
+        An array of p-values.
+    """
+    sample = dist.rvs(size=(size, n), random_state=random_state)
+    return row_p_values(sample, test, vectorized)
+
+
+class CommonRandomNumbers(object):
+    """ A fixed stream of draws that is shared by every candidate sample size.
+
+    The draws form a (`n_sims`, `max_n`) matrix that is generated lazily in
+    blocks of `chunk_size` columns.  A sample of size `n` is the first `n`
+    columns of the matrix, so the samples for different sample sizes are
+    nested and the simulated power changes smoothly with `n`.
+
+    Each block of columns has its own seed derived from `seed`, so the
+    draws do not depend on the order in which the blocks are generated.
+
+    Attributes:
+        dist: A frozen distribution from `scipy.stats` to draw from.
+        n_sims: The number of simulated samples (rows).
+        seed: The seed for the stream.
+        chunk_size: (optional) The number of columns generated at a time.
+    """
+
+    _CHUNK_SIZE = 64
+
+    def __init__(self, dist, n_sims, seed, chunk_size=None):
+        self.dist = dist
+        self.n_sims = n_sims
+        self.seed = seed
+        if chunk_size is None:
+            chunk_size = self._CHUNK_SIZE
+        self.chunk_size = chunk_size
+        self._draws = numpy.empty((n_sims, 0))
+
+    def sample(self, n):
+        """ The first `n` columns of the stream.
+
+        Arguments:
+            n: the sample size.
+
+        Returns:
+            A (`n_sims`, `n`) array, with one simulated sample per row.
+        """
+        while self._draws.shape[1] < n:
+            self._draws = numpy.hstack([self._draws, self._next_chunk()])
+        return self._draws[:, :n]
+
+    def _next_chunk(self):
+        """ Draw the next block of columns.
+
+        This is an internal method only.
+        """
+        chunk = self._draws.shape[1] // self.chunk_size
+        seed_sequence = numpy.random.SeedSequence(self.seed,
+                                                  spawn_key=(chunk,))
+        random_state = numpy.random.default_rng(seed_sequence)
+        return self.dist.rvs(size=(self.n_sims, self.chunk_size),
+                             random_state=random_state)
+
+
+class SimulationBase(PowerBase):
+    """ The base for power calculations that are estimated by simulation.
+
+    It handles sequential stopping of the simulations and reports the
+    Monte Carlo error of the simulated power.
+
+    Attributes:
+        adaptive: (optional) If True, the simulations for a candidate
+            sample size stop once the simulated power is clearly above or
+            below the target power.  The default is False.
+        time_budget: (optional) The number of seconds a calculation may
+            run for.  Once it is used up, each power estimate stops after
+            its current block of simulations.
+        mc_stderr: The Monte Carlo standard error of the simulated power.  It
+            is 0 when the power is calculated exactly.
+        n_sims: The number of simulations behind the simulated power.  It is
+            0 when the power is calculated exactly.
+    """
+
+    def __init__(self, adaptive=None, time_budget=None, **kwargs):
+        if adaptive is None:
+            adaptive = False
+        else:
+            is_boolean(adaptive, 'adaptive')
+        self.adaptive = adaptive
+
+        if time_budget is not None:
+            is_positive(time_budget, 'time_budget')
+        self.time_budget = time_budget
+
+        self.mc_stderr = None
+        self.n_sims = None
+        self._estimates = {}
+        self._deadline = None
+
+        super(SimulationBase, self).__init__(**kwargs)
+
+    def _start_clock(self):
+        """ Start the clock for `time_budget`.
+
+        This is an internal method only.
+        """
+        self._estimates = {}
+        if self.time_budget is None:
+            self._deadline = None
+        else:
+            self._deadline = time.monotonic() + self.time_budget
+
+    def _stopping_rule(self, alpha, target=None):
+        """ The `stop` function for a power estimate, or None if the
+        simulations always run to the end.
+
+        This is an internal method only.
+        """
+        if not self.adaptive:
+            target = None
+        if target is None and self._deadline is None:
+            return None
+        return stopping_rule(alpha, target=target, deadline=self._deadline)
+
+    def _power_estimate(self, key, p_vals, alpha):
+        """ The simulated power, keeping its standard error for `key`.
+
+        This is an internal method only.
+        """
+        power, stderr = power_stderr(p_vals, alpha)
+        self._estimates[key] = (stderr, len(p_vals))
+        return power
+
+    def _exact_estimate(self, key, power):
+        """ Keep an exactly calculated power for `key`.  It has no Monte
+        Carlo error and uses no simulations.
+
+        This is an internal method only.
+        """
+        self._estimates[key] = (0.0, 0)
+        return power
+
+    def _set_simulation_error(self, key):
+        """ Report the Monte Carlo error of the estimate for `key`.
+
+        This is an internal method only.
+        """
+        self.mc_stderr, self.n_sims = self._estimates[key]
@@ -1,2 +1,6 @@
-from .cox import Cox
-from .exponential import Exponential
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'Cox': 'cox',
+    'Exponential': 'exponential'
+})
@@ -2,6 +2,7 @@ from skdesign.power import (is_in_0_1,
                             is_positive)
 from skdesign.power.means import OneSample
 import math
+import numpy
 
 
 class Cox(OneSample):
@@ -37,7 +38,8 @@ class Cox(OneSample):
             respect to the power calculation so choose 'superiority' for both.
         margin: This is the superiority or equivalence margin.
         hazard_ratio: The ratio of the hazards of the two survival curves,
-            :math:`b`.
+            :math:`b`.  If it is None, the hazard ratio above 1 at which the
+            test has the power at n is calculated.
         proportion_visible: (optional) The proportion of events that can be
             detected.  `proportion_visible` must be in (0, 1]. The default
             is 1.
@@ -56,12 +58,17 @@ class Cox(OneSample):
                  hypothesis=None, margin=None, hazard_ratio=None,
                  proportion_visible=None, control_proportion=None,
                  treatment_proportion=None):
-        is_positive(hazard_ratio, 'Hazard Ratio')
         is_in_0_1(treatment_proportion, 'Treatment Proportion')
         is_in_0_1(control_proportion, 'Control Proportion')
         is_in_0_1(proportion_visible, 'Proportion Visible')
 
-        epsilon = math.log(hazard_ratio)
+        # The hazard ratio is calculated when it is None
+        self.hazard_ratio = hazard_ratio
+        if hazard_ratio is None:
+            epsilon = None
+        else:
+            is_positive(hazard_ratio, 'Hazard Ratio')
+            epsilon = math.log(hazard_ratio)
         stdev = treatment_proportion * control_proportion * proportion_visible
         stdev = 1 / math.sqrt(stdev)
 
@@ -69,3 +76,11 @@ class Cox(OneSample):
                                   stdev=stdev, known_stdev=True, alpha=alpha,
                                   beta=beta, power=power, margin=margin,
                                   hypothesis=hypothesis)
+
+    def _set_effect(self):
+        """ Set the hazard ratio from the calculated log hazard ratio.
+
+        This is an internal method only.
+        """
+        super(Cox, self)._set_effect()
+        self.hazard_ratio = numpy.exp(self.mu)
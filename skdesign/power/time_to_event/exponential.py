@@ -1,8 +1,10 @@
 import math
+import numpy
 from skdesign.power.means import TwoSampleParallel
-from skdesign.power import (is_non_negative,
+from skdesign.power import (ceil,
+                            is_non_negative,
                             is_positive)
-import scipy.stats as stats
+from skdesign.power import numerics
 
 
 class Exponential(TwoSampleParallel):
@@ -49,6 +51,7 @@ class Exponential(TwoSampleParallel):
             sizes.  If :math:`n_{1}` is the control sample size and
             :math:`n_{2}` is the treatment sample size, the ratio, :math:`k`,
             is defined as :math:`n_{1} = k n_{2}`.  The default value is 1.
+            It can be an array when n is calculated.
 
     Notes:
         The follow up time is defined as :math:`T - T_{0}`.
@@ -101,13 +104,12 @@ class Exponential(TwoSampleParallel):
 
         This is an internal method only.
         """
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
 
         n_2 = (z_alpha + z_beta)**2 / self.epsilon**2 * (self.stdev_control**2 / self.ratio + self.stdev_treatment**2)
-        self.n_2 = math.ceil(n_2)
-        self.n_1 = math.ceil(self.ratio * self.n_2)
+        self.n_2 = ceil(n_2)
+        self.n_1 = ceil(self.ratio * self.n_2)
         self.n = self.n_1 + self.n_2
 
     def _calculate_alpha_known(self):
@@ -117,12 +119,11 @@ class Exponential(TwoSampleParallel):
         This is an internal method only.
         """
         theta = (self.stdev_control**2 / self.ratio + self.stdev_treatment**2) / self.epsilon**2
-        theta = 1 / math.sqrt(theta)
-        distribution = stats.norm()
-        z_beta = distribution.ppf(1 - self.beta / self._beta_adjustment)
-        z_alpha = math.sqrt(self.n_2) * abs(theta) - z_beta
+        theta = 1 / numpy.sqrt(theta)
+        z_beta = numerics.norm_ppf(1 - self.beta / self._beta_adjustment)
+        z_alpha = numpy.sqrt(self.n_2) * abs(theta) - z_beta
 
-        self.alpha = (1 - distribution.cdf(z_alpha)) * self._alpha_adjustment
+        self.alpha = (1 - numerics.norm_cdf(z_alpha)) * self._alpha_adjustment
 
     def _calculate_power_known(self):
         """ Calculate power in the case that the standard deviation is known.
@@ -130,12 +131,11 @@ class Exponential(TwoSampleParallel):
         This is an internal method only.
         """
         theta = (self.stdev_control**2 / self.ratio + self.stdev_treatment**2) / self.epsilon**2
-        theta = 1 / math.sqrt(theta)
-        distribution = stats.norm()
-        z_alpha = distribution.ppf(1 - self.alpha / self._alpha_adjustment)
-        z_beta = math.sqrt(self.n_2) * abs(theta) - z_alpha
+        theta = 1 / numpy.sqrt(theta)
+        z_alpha = numerics.norm_ppf(1 - self.alpha / self._alpha_adjustment)
+        z_beta = numpy.sqrt(self.n_2) * abs(theta) - z_alpha
 
-        self.beta = (1 - stats.norm.cdf(z_beta)) * self._beta_adjustment
+        self.beta = (1 - numerics.norm_cdf(z_beta)) * self._beta_adjustment
         self.power = 1 - self.beta
 
     def calculate(self):
@@ -1,10 +1,16 @@
-from .variance_base import VarianceBase
-from .intra_subject_parallel import IntraSubjectParallel
-from .intra_subject_crossover import IntraSubjectCrossover
-from .intra_subject_cv import IntraSubjectCV
-from .inter_subject_parallel import InterSubjectParallel
-from .inter_subject_crossover import InterSubjectCrossover
-from .total_parallel_no_replication import TotalParallelNoReplication
-from .total_parallel_replication import TotalParallelReplication
-from .total_2_by_2_crossover import Total2By2Crossover
-from .total_2_by_2M_crossover import Total2By2MCrossover
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'VarianceBase': 'variance_base',
+    'IntraSubjectParallel': 'intra_subject_parallel',
+    'IntraSubjectCrossover': 'intra_subject_crossover',
+    'IntraSubjectCV': 'intra_subject_cv',
+    'InterSubjectParallel': 'inter_subject_parallel',
+    'InterSubjectCrossover': 'inter_subject_crossover',
+    'TotalParallelNoReplication': 'total_parallel_no_replication',
+    'TotalParallelReplication': 'total_parallel_replication',
+    'Total2By2Crossover': 'total_2_by_2_crossover',
+    'Total2By2MCrossover': 'total_2_by_2M_crossover',
+    'ReplicateResult': 'replicates',
+    'optimize_replicates': 'replicates'
+})
@@ -1,7 +1,5 @@
-import math
 from skdesign.power.variances import VarianceBase
-import scipy.stats as stats
-from scipy.optimize import brenth
+from skdesign.power import numerics
 
 
 class IntraSubjectCrossover(VarianceBase):
@@ -57,51 +55,37 @@ class IntraSubjectCrossover(VarianceBase):
         df = (2 * n - 2) * (m - 1)
         ratioLeft = sigma_ratio**2
 
-        ratioRight = (stats.f.ppf(beta, df, df) /
-                      stats.f.ppf(1 - alpha, df, df))
+        ratioRight = (numerics.f_ppf(beta, df, df) /
+                      numerics.f_ppf(1 - alpha, df, df))
         res = ratioLeft - ratioRight
         return res
 
+    def _degrees_of_freedom(self, n):
+        """ The degrees of freedom of each variance estimate.
+
+        This is an internal method only.
+        """
+        return (2 * n - 2) * (self.m - 1)
+
     def calculate(self):
-        if self.n is None:
+        if self.sigma_ratio is None:
+            self._calculate_effect()
+        elif self.n is None:
             self._set_default_alpha()
             self._set_default_power()
-            res = brenth(lambda n:
-                         self._calculate_power_unknown(n,
-                                                       self.m,
-                                                       self.sigma_ratio,
-                                                       self._alpha,
-                                                       self._beta),
-                         a=2, b=1e7)
-            self.n = math.ceil(res)
-            res = brenth(lambda beta:
-                         self._calculate_power_unknown(self.n,
-                                                       self.m,
-                                                       self.sigma_ratio,
-                                                       self._alpha,
-                                                       beta),
-                         a=0, b=1)
-            self._beta = res
+            self.n = self._search_n(
+                lambda n: self._calculate_power_unknown(n,
+                                                        self.m,
+                                                        self.sigma_ratio,
+                                                        self._alpha,
+                                                        self._beta),
+                self._normal_df() / (2 * (self.m - 1)) + 1)
+            self._beta = self._calculate_beta(self.n, self._alpha)
             self.update_beta()
-            print(self.hypothesis)
         elif self.power is None:
             self._set_default_alpha()
-            res = brenth(lambda beta:
-                         self._calculate_power_unknown(self.n,
-                                                       self.m,
-                                                       self.sigma_ratio,
-                                                       self._alpha,
-                                                       beta),
-                         a=1e-7, b=1 - 1e-7)
-            self._beta = res
+            self._beta = self._calculate_beta(self.n, self._alpha)
             self.update_beta()
         elif self.alpha is None:
-            res = brenth(lambda alpha:
-                         self._calculate_power_unknown(self.n,
-                                                       self.m,
-                                                       self.sigma_ratio,
-                                                       alpha,
-                                                       self._beta),
-                         a=1e-7, b=1 - 1e-7)
-            self._alpha = res
+            self._alpha = self._calculate_alpha(self.n, self._beta)
             self.update_alpha()
@@ -0,0 +1,91 @@
+""" The cheapest combination of subjects and replicates for replicated
+designs on variances.
+"""
+import collections
+import numpy
+from skdesign.power.variances import VarianceBase
+
+ReplicateResult = collections.namedtuple('ReplicateResult',
+                                         ['n', 'm', 'cost', 'frontier'])
+
+# The largest number of replicates considered by default.
+_MAX_M = 10
+
+
+def optimize_replicates(design, subject_cost=1, replicate_cost=0, m_max=None,
+                        **parameters):
+    """ Find the number of subjects n and of replicates m with the smallest
+    cost :math:`n (c_{subject} + m c_{replicate})`.
+
+    The smallest n is found for every m from 2 to `m_max`.  Since n does
+    not increase with m, an m only joins the frontier if it lowers n, and
+    an m whose cost at the smallest possible n is already above the cost at
+    m = 2 is not searched.  For the designs based on the F test
+    (IntraSubjectParallel and IntraSubjectCrossover) the searches for every
+    m run together on arrays of F quantiles.  The other designs, such as
+    TotalParallelReplication and Total2By2MCrossover, have a closed form for
+    n and are calculated for each m.
+
+    Arguments:
+        design: a class from skdesign.power.variances that takes `m`.
+        subject_cost: (optional) the cost of a subject.  The default is 1.
+        replicate_cost: (optional) the cost of one replicate of a subject.
+            The default is 0.
+        m_max: (optional) the largest number of replicates.  The default is
+            10.  It must be given when `replicate_cost` is 0, since n then
+            keeps falling with m and the cheapest m is only set by the cap.
+        parameters: the other arguments of `design`, such as the standard
+            deviations and the hypothesis.  alpha defaults to 0.05 and power
+            to 0.8.
+
+    Returns:
+        A `ReplicateResult` with the cheapest n, m and their cost, and the
+        frontier, a list of (n, m) pairs where n is lower than for any
+        smaller m.
+
+    Raises:
+        ValueError: if `m_max` is less than 2, or is not given when
+            `replicate_cost` is 0.
+    """
+    if m_max is None:
+        if replicate_cost == 0:
+            raise ValueError('`m_max` must be provided when `replicate_cost` '
+                             'is 0')
+        m_max = _MAX_M
+    if m_max < 2:
+        raise ValueError('`m_max` must be at least 2')
+    parameters.setdefault('alpha', 0.05)
+    if parameters.get('beta') is None:
+        parameters.setdefault('power', 0.8)
+
+    def cost(n, m):
+        return n * (subject_cost + m * replicate_cost)
+
+    n_first = _sample_sizes(design, numpy.array([2]), parameters)[0]
+    m = numpy.arange(2, m_max + 1)
+    # No m with a larger cost at the smallest n can beat m = 2.
+    m = m[cost(design._minN, m) <= cost(n_first, 2)]
+    n = _sample_sizes(design, m, parameters)
+
+    smallest_so_far = numpy.minimum.accumulate(n)
+    lowers = numpy.concatenate([[True], n[1:] < smallest_so_far[:-1]])
+    frontier = [(int(n_i), int(m_i)) for n_i, m_i in zip(n[lowers], m[lowers])]
+    costs = [cost(n_i, m_i) for n_i, m_i in frontier]
+    best = int(numpy.argmin(costs))
+    return ReplicateResult(frontier[best][0], frontier[best][1], costs[best],
+                           frontier)
+
+
+def _sample_sizes(design, m, parameters):
+    """ The smallest n of `design` for each number of replicates in `m`.
+
+    This is an internal method only.
+    """
+    if issubclass(design, VarianceBase):
+        return design(m=int(m[0]), **parameters)._replicate_n(m)
+    n = []
+    for m_i in m:
+        hypothesis = design(m=int(m_i), **parameters)
+        hypothesis.calculate()
+        n.append(hypothesis.n)
+    return numpy.array(n)
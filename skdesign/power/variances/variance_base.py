@@ -1,5 +1,10 @@
+import math
+import numpy
 from skdesign.power import (PowerBase,
                             is_positive)
+from skdesign.power.search import (integer_search,
+                                   vectorized_search)
+from skdesign.power import numerics
 
 
 class VarianceBase(PowerBase):
@@ -10,7 +15,9 @@ class VarianceBase(PowerBase):
             :math:`\\alpha` level and a power of :math:`1 - \\beta`.
         m: The number of replicates per subject.
         stdev_1: The variance of the first treament.
-        stdev_2: The variance of the second treamment.
+        stdev_2: The variance of the second treamment.  If it is None, it is
+            calculated as the value at which the test has the power with n
+            subjects.
         similarity_limit: :math:`\\delta`
 
         alpha: The :math:`\\alpha` level required by the hypothesis.
@@ -18,8 +25,16 @@ class VarianceBase(PowerBase):
             :math:`1` - power).
         power: The power required by the hypothesis (equal to
             :math:`1 - \\beta`).
+
+    Each design defines `_degrees_of_freedom(n)`, the degrees of freedom of
+    each variance estimate for `n` subjects, which the direct calculations
+    of :math:`\\alpha`, power and stdev_2 use.
     """
 
+    # Parameters controling the search for n.
+    _minN = 2
+    _maxN = 10**7
+
     def __init__(self, n=None, m=None, stdev_1=None, stdev_2=None,
                  similarity_limit=None, hypothesis=None,
                  alpha=None, beta=None, power=None):
@@ -42,7 +57,9 @@ class VarianceBase(PowerBase):
 
         is_positive(stdev_1, 'stdev_1')
         self.stdev_1 = stdev_1
-        is_positive(stdev_2, 'stdev_2')
+        # stdev_2 is calculated when it is None
+        if stdev_2 is not None:
+            is_positive(stdev_2, 'stdev_2')
         self.stdev_2 = stdev_2
 
         # _alpha and _beta are adjusted to be used as cutpoints.
@@ -60,7 +77,6 @@ class VarianceBase(PowerBase):
             else:
                 self._beta = None
             similarity_limit = 1
-            sigma_ratio = stdev_2 / stdev_1
         elif hypothesis == 'superiority':
             if alpha is not None:
                 self._alpha = alpha
@@ -74,7 +90,6 @@ class VarianceBase(PowerBase):
                 self._beta = None
             if similarity_limit is None:
                 raise ValueError('A similarity_limit must be provided')
-            sigma_ratio = stdev_2 / (stdev_1 * similarity_limit)
         elif hypothesis == 'equivalence':
             if alpha is not None:
                 self._alpha = 1 - alpha
@@ -88,10 +103,12 @@ class VarianceBase(PowerBase):
                 self._beta = None
             if similarity_limit is None:
                 raise ValueError('A similarity_limit must be provided')
-            sigma_ratio = stdev_2 / (stdev_1 * similarity_limit)
 
         self.similarity_limit = similarity_limit
-        self.sigma_ratio = sigma_ratio
+        if stdev_2 is None:
+            self.sigma_ratio = None
+        else:
+            self.sigma_ratio = stdev_2 / (stdev_1 * similarity_limit)
 
         # Initialize the remaining arguments through the parent.
         super(VarianceBase, self).__init__(alpha=alpha, power=power,
@@ -117,3 +134,146 @@ class VarianceBase(PowerBase):
         elif self.hypothesis == 'equivalence':
             self.beta = 1 - 2 * self._beta
             self.power = 1 - self.beta
+
+    def _set_default_levels(self):
+        """ Set alpha to 0.05 and power to 0.8 when they are None, and
+        `_alpha` and `_beta` to match them.
+
+        This is an internal method only.
+        """
+        if self._alpha is None:
+            self._set_default_alpha()
+            if self.hypothesis == 'equality':
+                self._alpha = self.alpha / 2
+            elif self.hypothesis == 'superiority':
+                self._alpha = self.alpha
+            elif self.hypothesis == 'equivalence':
+                self._alpha = 1 - self.alpha
+        if self._beta is None:
+            self._set_default_power()
+            if self.hypothesis == 'equivalence':
+                self._beta = self.power / 2
+            else:
+                self._beta = self.beta
+
+    def _calculate_beta(self, n, alpha):
+        """ Calculate `_beta` for `n` subjects directly from the F
+        distribution.
+
+        The test reaches its power when
+        :math:`\\sigma_{ratio}^{2} = F_{\\beta} / F_{1 - \\alpha}`, so
+        :math:`\\beta` is the F cdf at
+        :math:`\\sigma_{ratio}^{2} F_{1 - \\alpha}`.
+
+        This is an internal method only.
+        """
+        df = self._degrees_of_freedom(n)
+        quantile = self.sigma_ratio**2 * numerics.f_ppf(1 - alpha, df, df)
+        return numerics.f_cdf(quantile, df, df)
+
+    def _calculate_alpha(self, n, beta):
+        """ Calculate `_alpha` for `n` subjects directly from the F
+        distribution, as the upper tail at
+        :math:`F_{\\beta} / \\sigma_{ratio}^{2}`.
+
+        This is an internal method only.
+        """
+        df = self._degrees_of_freedom(n)
+        quantile = numerics.f_ppf(beta, df, df) / self.sigma_ratio**2
+        return numerics.f_sf(quantile, df, df)
+
+    def _calculate_effect(self):
+        """ Calculate the ratio of the standard deviations, and so stdev_2,
+        at which the test has the required power with n subjects.  alpha
+        defaults to 0.05 and power to 0.8.
+
+        It inverts `_calculate_beta` directly, since the power is reached at
+        :math:`\\sigma_{ratio}^{2} = F_{\\beta} / F_{1 - \\alpha}`.
+
+        This is an internal method only.
+        """
+        if self.n is None:
+            raise ValueError('`n` must be provided to calculate `stdev_2`')
+        self._set_default_levels()
+        df = self._degrees_of_freedom(self.n)
+        self.sigma_ratio = math.sqrt(numerics.f_ppf(self._beta, df, df) /
+                                     numerics.f_ppf(1 - self._alpha, df, df))
+        self.stdev_2 = self.sigma_ratio * self.stdev_1 * self.similarity_limit
+
+    def _normal_df(self):
+        """ The degrees of freedom at which the F test reaches the required
+        power, from the normal approximation to the log of an F statistic.
+        It is the starting point for the search for n.
+
+        This is an internal method only.
+        """
+        if self.sigma_ratio == 1:
+            return math.inf
+        z_alpha = numerics.norm_ppf(1 - self._alpha)
+        z_beta = numerics.norm_ppf(self._beta)
+        return ((z_beta - z_alpha) / math.log(self.sigma_ratio))**2
+
+    def _search_n(self, function, start):
+        """ The smallest integer n past the root of `function`, which is the
+        difference between the squared ratio of the standard deviations and
+        the ratio of the F quantiles.
+
+        As n grows the ratio of the quantiles tends to 1, so the difference
+        tends to `sigma_ratio**2 - 1` and the search is for the first n where
+        it has that sign.
+
+        This is an internal method only.
+        """
+        if self.sigma_ratio > 1:
+            sign = 1
+        else:
+            sign = -1
+        result = integer_search(lambda n: sign * function(n), 0, start,
+                                self._minN, self._maxN)
+        self._check_power(sign * result.value)
+        return result.n
+
+    def _check_power(self, difference):
+        """ Check that the test has the required power where `function`
+        of `_search_n` is `difference`.
+
+        The power is :math:`1 - F(\\sigma_{ratio}^{2} F_{1 - \\alpha})`, so
+        it is reached where the difference is at most 0.  For equivalence
+        the power is :math:`2 F(\\sigma_{ratio}^{2} F_{1 - \\alpha})`, which
+        is reached where the difference is at least 0.  The search stops at
+        the first n where the difference has the sign it tends to, so when
+        that is the other sign no n has the power.
+
+        This is an internal method only.
+
+        Raises:
+            ValueError: if the power is not reached.
+        """
+        if self.hypothesis == 'equivalence':
+            reached = numpy.all(difference >= 0)
+        else:
+            reached = numpy.all(difference <= 0)
+        if not reached:
+            raise ValueError('No n has the required power')
+
+    def _replicate_n(self, m):
+        """ The smallest n for each number of replicates in the array `m`.
+
+        The searches for every m run in lockstep, so the F quantiles are
+        evaluated for all of them at once.  It needs a design whose
+        `_calculate_power_unknown` takes the number of replicates.
+
+        This is an internal method only.
+        """
+        if self.sigma_ratio > 1:
+            sign = 1
+        else:
+            sign = -1
+        result = vectorized_search(
+            lambda n: sign * self._calculate_power_unknown(n, m,
+                                                           self.sigma_ratio,
+                                                           self._alpha,
+                                                           self._beta),
+            0, self._minN, self._minN, self._maxN)
+        self._check_power(sign * result.value)
+        return result.n
@@ -1,16 +1,20 @@
-from .randomization import (simple,
-                            simple_max_deviation,
-                            complete,
-                            complete_max_deviation,
-                            block,
-                            random_block,
-                            random_treatment_order,
-                            efrons_biased_coin,
-                            smiths_exponent,
-                            weis_urn,
-                            stratification,
-                            cumsum,
-                            max_deviation)
-from .adaptive_randomization import (double_biased_coin_minimize,
-                                     double_biased_coin_urn)
-from .minimization import minimization
+from skdesign._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={
+    'simple': 'randomization',
+    'simple_max_deviation': 'randomization',
+    'complete': 'randomization',
+    'complete_max_deviation': 'randomization',
+    'block': 'randomization',
+    'random_block': 'randomization',
+    'random_treatment_order': 'randomization',
+    'efrons_biased_coin': 'randomization',
+    'smiths_exponent': 'randomization',
+    'weis_urn': 'randomization',
+    'stratification': 'randomization',
+    'cumsum': 'randomization',
+    'max_deviation': 'randomization',
+    'double_biased_coin_minimize': 'adaptive_randomization',
+    'double_biased_coin_urn': 'adaptive_randomization',
+    'minimization': 'minimization'
+})
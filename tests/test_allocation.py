@@ -0,0 +1,56 @@
+""" Test cases for the power.allocation module """
+
+import numpy
+from skdesign.power.allocation import optimize_ratio
+from skdesign.power.means import TwoSampleParallel
+from skdesign.power.proportions import (Fisher,
+                                        RelativeRiskParallel)
+from skdesign.power.time_to_event import Exponential
+
+
+def grid_cost(design, cost_1, cost_2, **parameters):
+    """ The smallest cost over a fine grid of ratios """
+    h = design(ratio=numpy.geomspace(0.1, 10, 20001), alpha=0.05, power=0.8,
+               **parameters)
+    h.calculate()
+    return numpy.min(cost_1 * h.n_1 + cost_2 * h.n_2)
+
+
+def test_optimize_ratio():
+    """ The cheapest allocation is at least as cheap as a fine grid and
+    matches the design at its ratio """
+    parameters = dict(mu_1=1, mu_2=0.5, stdev=1, known_stdev=True)
+    result = optimize_ratio(TwoSampleParallel, cost_1=1, cost_2=4,
+                            **parameters)
+    # With equal variances the cheapest ratio is sqrt(cost_2 / cost_1).
+    assert abs(result.ratio - 2) < 0.2
+    assert result.cost <= grid_cost(TwoSampleParallel, 1, 4, **parameters)
+    h = TwoSampleParallel(ratio=result.ratio, alpha=0.05, power=0.8,
+                          **parameters)
+    h.calculate()
+    assert (h.n_1, h.n_2) == (result.n_1, result.n_2)
+    assert result.cost == result.n_1 + 4 * result.n_2
+
+    # The control group has the larger variance.
+    parameters = dict(control_hazard=2, treatment_hazard=0.5, trial_time=3,
+                      accrual_time=1)
+    result = optimize_ratio(Exponential, **parameters)
+    assert result.ratio > 1
+    assert result.cost <= grid_cost(Exponential, 1, 1, **parameters)
+
+    parameters = dict(p_1=0.2, p_2=0.5)
+    result = optimize_ratio(RelativeRiskParallel, cost_1=2, **parameters)
+    assert result.cost <= grid_cost(RelativeRiskParallel, 2, 1, **parameters)
+
+
+def test_optimize_ratio_loop():
+    """ Designs without arrays of ratios are calculated for each ratio """
+    result = optimize_ratio(Fisher, p_1=0.2, p_2=0.6, exact=True,
+                            ratios=[0.5, 1, 2], refinements=0)
+    costs = []
+    for ratio in [0.5, 1, 2]:
+        h = Fisher(ratio=ratio, p_1=0.2, p_2=0.6, exact=True, alpha=0.05,
+                   power=0.8)
+        h.calculate()
+        costs.append(h.n_1 + h.n_2)
+    assert result.cost == min(costs)
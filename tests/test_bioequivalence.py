@@ -3,6 +3,8 @@ from skdesign.power.bioequivalence import (Average,
                                            InVitro,
                                            Population)
 import math
+import numpy
+import pytest
 
 
 def test_average_bioequivalence():
@@ -29,6 +31,17 @@ def test_population_bioequivalence():
     assert h.n == 12
 
 
+def test_individual_bioequivalence_search():
+    """ The smallest n with a negative IBE bound. """
+    h = Individual(delta=0.05, stdev_wr=0.5, stdev_wt=0.4, rho=0.5,
+                   stdev_br=0.3, stdev_bt=0.3, alpha=0.05, power=0.8)
+    h.calculate()
+    assert h.n == 51
+    bounds = h.bound(numpy.arange(2, 101))
+    assert numpy.all(numpy.diff(bounds) < 0)
+    assert numpy.arange(2, 101)[bounds < 0][0] == 51
+
+
 # def test_individual_bioequivalence():
 #     """ Tests for Population Bioequivalence. """
 #     # See 10.4 Example from Chow et al.
@@ -38,6 +51,30 @@ def test_population_bioequivalence():
 #     assert h.n == 22
 
 
+def test_in_vitro_bioequivalence_frontier():
+    """ The frontier of (n, m) pairs for In Vitro Bioequivalence. """
+    h = InVitro(delta=0, stdev_wr=0.3, stdev_wt=0.5, stdev_br=0.5,
+                stdev_bt=0.3, alpha=0.05, power=0.8)
+    h.calculate()
+    assert (h.n, h.m) == h.frontier[0] == (1, 41)
+    for n, m in h.frontier:
+        assert h.bound(n, m) <= 0
+        assert h.bound(n, m - 1) > 0
+    bounds = h.bound(numpy.arange(1, 100)[:, None], numpy.arange(30, 41))
+    assert numpy.all(bounds > 0)
+
+
+def test_scalar_only():
+    """ The bioequivalence designs other than Average are not vectorized """
+    with pytest.raises(ValueError):
+        Individual(delta=[0.05, 0.1], stdev_wr=0.5, stdev_wt=0.4, rho=0.5,
+                   stdev_br=0.3, stdev_bt=0.3, alpha=0.05, power=0.8)
+    with pytest.raises(ValueError):
+        Population(delta=0, l=0.2, stdev_11=0.4, stdev_tt=0.3,
+                   stdev_tr=0.3, stdev_bt=0.4, stdev_br=0.4,
+                   rho=numpy.array([0.5, 0.75]), alpha=0.05, power=0.8)
+
+
 # def test_in_vitro_bioequivalence():
 #     """ Tests for Population Bioequivalence. """
 #     # See 10.4 Example from Chow et al.
@@ -1,5 +1,11 @@
 from skdesign.power.distributions import (Normal, 
-                                          Distribution)
+                                          Distribution,
+                                          vectorized)
+import numpy as np
+import pytest
+import subprocess
+import sys
+import scipy.stats as stats
 
 
 def test_normal():
@@ -9,3 +15,104 @@ def test_normal():
     h.calculate()
     print(h)
     assert h.n == 23
+
+
+def test_vectorized_kstest():
+    """ The batched Kolmogorov-Smirnov test agrees with scipy """
+    sample = np.random.default_rng(1).normal(size=(20, 40))
+    statistic, p_value = vectorized.norm_kstest(sample)
+    for i, row in enumerate(sample):
+        res = stats.kstest(row, 'norm')
+        assert np.isclose(statistic[i], res.statistic)
+        assert np.isclose(p_value[i], res.pvalue)
+
+
+def test_vectorized_shapiro():
+    """ The batched Shapiro-Wilk test agrees with scipy """
+    rng = np.random.default_rng(2)
+    for n in [3, 5, 10, 20, 50]:
+        sample = rng.exponential(size=(10, n))
+        statistic, p_value = vectorized.shapiro(sample)
+        for i, row in enumerate(sample):
+            res = stats.shapiro(row)
+            assert np.isclose(statistic[i], res.statistic)
+            assert np.isclose(p_value[i], res.pvalue)
+
+
+def test_normal_vectorized():
+    """ Batched and looped simulations estimate the same power """
+    looped = Normal(n=30, alpha=0.05, method='skew', dist='expon',
+                    vectorized=False)
+    looped.calculate()
+    batched = Normal(n=30, alpha=0.05, method='skew', dist='expon')
+    batched.calculate()
+    assert batched.vectorized
+    assert abs(looped.power - batched.power) < 0.05
+
+
+def test_common_random_numbers():
+    """ Every sample size uses the leading columns of the same draws """
+    from skdesign.power.simulation import CommonRandomNumbers
+    stream = CommonRandomNumbers(stats.expon(), 50, 1, chunk_size=8)
+    short = stream.sample(5).copy()
+    long = stream.sample(30)
+    assert long.shape == (50, 30)
+    assert np.array_equal(short, long[:, :5])
+    fresh = CommonRandomNumbers(stats.expon(), 50, 1, chunk_size=8)
+    assert np.array_equal(fresh.sample(30), long)
+
+    h = Normal(alpha=0.05, power=0.8, method='skew', dist='expon',
+               common_random_numbers=True)
+    h.calculate()
+    assert h.power >= 0.8
+
+
+def test_normal_n_jobs():
+    """ The simulations do not depend on the number of processes """
+    powers = []
+    for n_jobs in [None, 2]:
+        h = Normal(n=25, alpha=0.05, method='ks', dist='expon', loc=-1,
+                   n_jobs=n_jobs)
+        h.calculate()
+        powers.append(h.power)
+    assert powers[0] == powers[1]
+
+
+def test_normal_adaptive():
+    """ Sequential stopping finds the same n and reports its error """
+    fixed = Normal(alpha=0.05, power=0.8, method='shapiro', dist='expon')
+    fixed.calculate()
+    assert fixed.n_sims == 1000
+
+    adaptive = Normal(alpha=0.05, power=0.8, method='shapiro', dist='expon',
+                      adaptive=True)
+    adaptive.calculate()
+    assert adaptive.n == fixed.n
+    assert 0 < adaptive.mc_stderr < 0.05
+    assert adaptive.n_sims <= 1000
+
+
+def test_scalar_only():
+    """ The simulations take a single n, alpha and power """
+    with pytest.raises(ValueError):
+        Normal(n=np.array([20, 30]), alpha=0.05, method='shapiro',
+               dist='expon')
+    with pytest.raises(ValueError):
+        Distribution(n=20, alpha=[0.05, 0.1], method='ks', dist='norm',
+                     compare_dist='expon')
+
+
+def test_fresh_interpreter():
+    """ The distributions are found before scipy.stats is loaded """
+    code = ('from skdesign.power.distributions import Distribution, Normal; '
+            'h = Normal(n=20, alpha=0.05, method="shapiro", dist="expon"); '
+            'h.dist; '
+            'Distribution(n=20, alpha=0.05, method="ks", dist="expon", '
+            'compare_dist="norm")')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+    with pytest.raises(ValueError):
+        Normal(n=20, alpha=0.05, method='shapiro', dist='not_a_dist')
+    with pytest.raises(ValueError):
+        Distribution(n=20, alpha=0.05, method='ks', dist='expon',
+                     compare_dist='kstest')
@@ -0,0 +1,61 @@
+""" Test cases for the power.functions module """
+
+import pickle
+import numpy
+from skdesign.power.means import (OneSample,
+                                  TwoSampleParallel,
+                                  TwoSampleCrossover)
+from skdesign.power.gof import Pearson
+
+
+def test_power_function_matches_calculate():
+    """ The power functions give the same n and power as the hypotheses """
+    for known_stdev in [True, False]:
+        for hypothesis, margin in [('equality', None),
+                                   ('superiority', 0.1),
+                                   ('equivalence', 0.8)]:
+            parameters = dict(mu=1, mu_0=0.5, stdev=1, margin=margin,
+                              known_stdev=known_stdev,
+                              hypothesis=hypothesis)
+            h = OneSample(alpha=0.05, power=0.8, **parameters)
+            h.calculate()
+            function = OneSample(**parameters).power_function()
+            assert function.n(0.8) == h.n
+            assert function(h.n) == h.power
+
+    h = TwoSampleParallel(mu_1=1, mu_2=0.5, stdev=1, ratio=2,
+                          known_stdev=False)
+    h.calculate()
+    function = TwoSampleParallel(mu_1=1, mu_2=0.5, stdev=1, ratio=2,
+                                 known_stdev=False).power_function()
+    assert function.n(0.8) == h.n_2
+    assert function(h.n_2) == h.power
+
+    # The exact power of the two one-sided tests
+    parameters = dict(mu_1=0.05, mu_2=0, stdev=0.3, margin=0.2231,
+                      hypothesis='equivalence', known_stdev=False,
+                      exact=True)
+    h = TwoSampleCrossover(**parameters)
+    h.calculate()
+    function = TwoSampleCrossover(**parameters).power_function()
+    assert function.n(0.8) == h.n
+    assert function(h.n) == h.power
+
+    h = Pearson(p=[0.3, 0.3, 0.4], p_0=[0.25, 0.35, 0.4])
+    h.calculate()
+    function = Pearson(p=[0.3, 0.3, 0.4],
+                       p_0=[0.25, 0.35, 0.4]).power_function()
+    assert function.n(0.8) == h.n
+    assert function(h.n) >= 0.8 > function(h.n - 1)
+
+
+def test_power_function_arrays_and_pickle():
+    """ The power functions take arrays and survive pickling """
+    function = OneSample(mu=1, mu_0=0.5, stdev=1,
+                         known_stdev=False).power_function()
+    function = pickle.loads(pickle.dumps(function))
+    n = function.n(numpy.array([0.8, 0.9]))
+    assert list(n) == [function.n(0.8), function.n(0.9)]
+    power = function(n)
+    assert numpy.all(power >= [0.8, 0.9])
+    assert numpy.all(function(n - 1) < [0.8, 0.9])
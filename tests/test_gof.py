@@ -1,6 +1,7 @@
 """ Test cases for the power.gof module """
 
-# import pytest
+import pytest
+import numpy
 from skdesign.power.gof import (Pearson,
                                 PearsonIndependance,
                                 CMH,
@@ -92,3 +93,46 @@ def test_carry_over_effect():
                         n=110, power=0.8)
     h.calculate()
     assert h.alpha < 0.05
+
+
+def test_array_tables():
+    """ Tables given as arrays give the same results as lists """
+    h = Pearson(p=numpy.array([0.2, 0.6, 0.2]),
+                p_0=numpy.array([0.25, 0.45, 0.30]), alpha=0.05, power=0.8)
+    h.calculate()
+    assert h.n == 104
+
+    p = numpy.array([[3.0, 4.0, 4.0], [2.0, 5.0, 3.0], [1.0, 2.0, 3.0]]) / 25
+    h = StuartMaxwell(p=p, alpha=0.05, power=0.8)
+    h.calculate()
+    assert h.n == 103
+
+    # Repeating the strata of Chow et al. 6.3.2 leaves n unchanged.
+    p = numpy.array([[[0.35, 0.15], [0.25, 0.25]],
+                     [[0.30, 0.20], [0.20, 0.30]],
+                     [[0.40, 0.10], [0.20, 0.30]],
+                     [[0.35, 0.15], [0.15, 0.35]]])
+    h = CMH(p=numpy.tile(p, (1000, 1, 1)), alpha=0.05, power=0.8)
+    h.calculate()
+    assert h.n == 86
+
+    h = McNemar(p=[[0.1, 0.2], [0.5, 0.2]], alpha=0.05, power=0.8)
+    h.calculate()
+    assert h.n == 59
+
+    h = McNemar(p_01=numpy.array([0.2, 0.3]), p_10=0.5, alpha=0.05,
+                power=0.8)
+    h.calculate()
+    assert h.n[0] == 59
+
+
+def test_scalar_only():
+    """ The goodness of fit tests take tables but single values of n, alpha
+    and power """
+    with pytest.raises(ValueError):
+        Pearson(p=[0.2, 0.6, 0.2], p_0=[0.25, 0.45, 0.30], alpha=0.05,
+                power=numpy.array([0.8, 0.9]))
+    with pytest.raises(ValueError):
+        StuartMaxwell(p=[[0.2, 0.3], [0.1, 0.4]], n=numpy.array([50, 100]))
+    with pytest.raises(ValueError):
+        CarryOverEffect(gamma=[0.89, 0.5], stdev_1=2.3, stdev_2=2.4)
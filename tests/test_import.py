@@ -0,0 +1,59 @@
+""" Test cases for the lazy loading of the package """
+
+import subprocess
+import sys
+
+
+def import_times(code):
+    """ The cumulative import time in microseconds of each module imported
+    by `code`, from `python -X importtime`.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            times[fields[2].strip()] = int(fields[1])
+        except ValueError:
+            continue
+    return times
+
+
+def test_randomization_loads_no_scipy():
+    """ A randomization list is made without importing scipy """
+    times = import_times('import skdesign; '
+                         'from skdesign.randomization import simple; '
+                         'simple(10, 2, seed=1)')
+    assert 'skdesign.randomization.randomization' in times
+    assert not [name for name in times if name.startswith('scipy')]
+
+
+def test_power_imports_lazily():
+    """ The power packages and classes load no scipy until a calculation """
+    times = import_times('import skdesign.power.means, skdesign.power.gof; '
+                         'from skdesign.power.means import OneSample; '
+                         'OneSample(mu=1, mu_0=0, stdev=1)')
+    assert 'skdesign.power.means.one_sample' in times
+    assert 'skdesign.power.gof.pearson' not in times
+    assert not [name for name in times if name.startswith('scipy')]
+
+    times = import_times('from skdesign.power import gof, means; '
+                         'means.OneSample, means.TwoSampleParallel; '
+                         'gof.Pearson, gof.LikelihoodRatio')
+    assert 'skdesign.power.gof.pearson' in times
+    assert not [name for name in times if name.startswith('scipy')]
+
+    times = import_times('from skdesign.power import distributions, '
+                         'proportions; '
+                         'proportions.Fisher, proportions.Binomial; '
+                         'distributions.Normal, distributions.Distribution')
+    assert 'skdesign.power.proportions.exact' in times
+    assert 'skdesign.power.distributions.vectorized' in times
+    assert not [name for name in times if name.startswith('scipy')]
+
+    times = import_times('from skdesign.power.means import OneSample; '
+                         'OneSample(mu=1, mu_0=0, stdev=1).calculate()')
+    assert 'scipy.special' in times
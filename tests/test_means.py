@@ -1,6 +1,7 @@
 """ Test cases for the power.means module """
 
-# import pytest
+import pytest
+import numpy
 from skdesign.power.means import (OneSample,
                                   TwoSampleParallel,
                                   TwoSampleCrossover,
@@ -414,3 +415,183 @@ def test_multi_sample_williams():
                             known_stdev=True)
     h.calculate()
     assert h.alpha < 0.05
+
+
+def test_array_parameters():
+    """ Arrays of parameters give the same values as the scalar cases """
+    mus = numpy.array([0.8, 1.0, 1.2])
+    for known_stdev in [True, False]:
+        h = OneSample(mu=mus, mu_0=0.5, stdev=1, n=20, alpha=0.05,
+                      known_stdev=known_stdev)
+        h.calculate()
+        for mu, power in zip(mus, h.power):
+            g = OneSample(mu=mu, mu_0=0.5, stdev=1, n=20, alpha=0.05,
+                          known_stdev=known_stdev)
+            g.calculate()
+            assert numpy.isclose(power, g.power)
+
+        h = TwoSampleParallel(mu_1=mus, mu_2=0.5, stdev=1, n_1=20,
+                              alpha=0.05, known_stdev=known_stdev)
+        h.calculate()
+        for mu, power in zip(mus, h.power):
+            g = TwoSampleParallel(mu_1=mu, mu_2=0.5, stdev=1, n_1=20,
+                                  alpha=0.05, known_stdev=known_stdev)
+            g.calculate()
+            assert numpy.isclose(power, g.power)
+
+        h = TwoSampleCrossover(mu_1=mus, mu_2=0.5, stdev=1, n=20,
+                               power=0.8, known_stdev=known_stdev)
+        h.calculate()
+        for mu, alpha in zip(mus, h.alpha):
+            g = TwoSampleCrossover(mu_1=mu, mu_2=0.5, stdev=1, n=20,
+                                   power=0.8, known_stdev=known_stdev)
+            g.calculate()
+            assert numpy.isclose(alpha, g.alpha)
+
+    h = OneSample(mu=mus, mu_0=0.5, stdev=1, alpha=0.05, power=0.8)
+    h.calculate()
+    for mu, n in zip(mus, h.n):
+        g = OneSample(mu=mu, mu_0=0.5, stdev=1, alpha=0.05, power=0.8)
+        g.calculate()
+        assert n == g.n
+
+
+def test_alpha_inverts_power():
+    """ The alpha calculated for a power gives back that power """
+    for cls, kwargs in [(OneSample, {'mu': 1, 'mu_0': 0.5, 'n': 32}),
+                        (TwoSampleParallel, {'mu_1': 1, 'mu_2': 0.5,
+                                             'n_1': 40}),
+                        (TwoSampleCrossover, {'mu_1': 1, 'mu_2': 0.5,
+                                              'n': 20})]:
+        h = cls(stdev=1, power=0.8, known_stdev=False, **kwargs)
+        h.calculate()
+        g = cls(stdev=1, alpha=h.alpha, known_stdev=False, **kwargs)
+        g.calculate()
+        assert numpy.isclose(g.power, 0.8)
+
+    h = OneWayAnova(n=11, mu=[8.25, 11.75, 12.00, 13.00], stdev=3.5,
+                    comparison='simultaneous', power=0.8)
+    h.calculate()
+    g = OneWayAnova(n=11, mu=[8.25, 11.75, 12.00, 13.00], stdev=3.5,
+                    comparison='simultaneous', alpha=h.alpha)
+    g.calculate()
+    assert numpy.isclose(g.power, 0.8)
+
+
+def test_pairwise_power():
+    """ The pairwise designs report the power of every pair """
+    mu = [8.25, 11.75, 12.00, 13.00]
+    h = OneWayAnova(mu=mu, stdev=3.5, alpha=0.05, power=0.8)
+    h.calculate()
+    g = OneWayAnova(n=h.n, mu=mu, stdev=3.5, alpha=0.05)
+    g.calculate()
+    assert len(g.pairwise_power) == 6
+    assert numpy.isclose(g.power, h.power)
+    assert g.power == g.pairwise_power.min()
+    g = OneWayAnova(n=h.n, mu=mu, stdev=3.5, power=0.8)
+    g.calculate()
+    assert numpy.isclose(g.alpha, 0.05, atol=1e-3)
+
+    h = MultiSampleWilliams(n=6, mu=[0.20, 0.15, 0.25], stdev=0.1,
+                            alpha=0.05)
+    h.calculate()
+    assert len(h.pairwise_power) == 3
+    assert h.power == h.pairwise_power.min()
+
+    # alpha defaults to 0.05.
+    h = OneWayAnova(mu=mu, stdev=3.5)
+    h.calculate()
+    g = OneWayAnova(n=h.n, mu=mu, stdev=3.5)
+    g.calculate()
+    assert g.alpha == 0.05
+    assert numpy.isclose(g.power, h.power)
+
+    # No alpha below 1 gives the closest pair, 2.1 and 2.02, a power of 0.8.
+    mu = [3.79, 2.1, 1.29, 2.56, 2.02]
+    for known_stdev in [True, False]:
+        h = MultiSampleWilliams(n=10, mu=mu, stdev=2, power=0.8,
+                                known_stdev=known_stdev)
+        with pytest.raises(ValueError):
+            h.calculate()
+        h = OneWayAnova(n=10, mu=mu, stdev=2, power=0.8,
+                        known_stdev=known_stdev)
+        with pytest.raises(ValueError):
+            h.calculate()
+
+
+def test_exact_tost():
+    """ Exact TOST power for a 2x2 crossover with CV 30% and GMR 0.95 """
+    # PowerTOST::sampleN.TOST(CV=0.3) gives 40 subjects (20 per sequence)
+    # with a power of 0.815845.
+    stdev = numpy.sqrt(2 * numpy.log(0.3**2 + 1))
+    h = TwoSampleCrossover(mu_1=numpy.log(0.95), mu_2=0, stdev=stdev,
+                           margin=numpy.log(1.25), hypothesis='equivalence',
+                           known_stdev=False, exact=True)
+    h.calculate()
+    assert h.n == 20
+    assert numpy.isclose(h.power, 0.815845, atol=1e-6)
+
+    h = TwoSampleCrossover(n=20, mu_1=numpy.log(0.95), mu_2=0, stdev=stdev,
+                           margin=numpy.log(1.25), hypothesis='equivalence',
+                           known_stdev=False, exact=True, power=0.815845)
+    h.calculate()
+    assert numpy.isclose(h.alpha, 0.05, atol=1e-6)
+
+    # Tables of CV and GMR are solved together.
+    cv = numpy.array([[0.1], [0.3], [0.5]])
+    gmr = numpy.array([0.9, 0.95, 1.0])
+    h = TwoSampleCrossover(mu_1=numpy.log(gmr), mu_2=0,
+                           stdev=numpy.sqrt(2 * numpy.log(cv**2 + 1)),
+                           margin=numpy.log(1.25), hypothesis='equivalence',
+                           known_stdev=False, exact=True)
+    h.calculate()
+    assert h.n.shape == (3, 3)
+    assert h.n[1, 1] == 20
+    assert numpy.all(h.power >= 0.8)
+
+
+def test_minimum_detectable_effect():
+    """ The effect calculated at n has the required power at n """
+    for known_stdev in [True, False]:
+        for hypothesis, margin in [('equality', None),
+                                   ('superiority', 0.1),
+                                   ('equivalence', 0.8)]:
+            h = OneSample(n=32, mu_0=0.5, stdev=1, known_stdev=known_stdev,
+                          hypothesis=hypothesis, margin=margin)
+            h.calculate()
+            check = OneSample(n=32, mu=h.mu, mu_0=0.5, stdev=1, alpha=0.05,
+                              known_stdev=known_stdev, hypothesis=hypothesis,
+                              margin=margin)
+            check.calculate()
+            assert abs(check.power - 0.8) < 1e-8
+
+    # From Chow et al. 3.1.4, n = 32 detects a difference of 0.5
+    h = OneSample(n=32, mu_0=0, stdev=1, alpha=0.05, power=0.8)
+    h.calculate()
+    assert 0.49 < h.mu < 0.5
+
+    # Arrays of n give the effects of the scalar calculations
+    n = numpy.array([10, 40, 160])
+    h = TwoSampleParallel(n_1=n, mu_2=0, stdev=1, known_stdev=False)
+    h.calculate()
+    for n_1, mu_1 in zip(n, h.mu_1):
+        scalar = TwoSampleParallel(n_1=int(n_1), mu_2=0, stdev=1,
+                                   known_stdev=False)
+        scalar.calculate()
+        assert scalar.mu_1 == pytest.approx(mu_1)
+
+    # The exact TOST reaches the power only for large enough n
+    h = TwoSampleCrossover(n=20, mu_2=0, stdev=0.3, margin=0.2231,
+                           hypothesis='equivalence', known_stdev=False,
+                           exact=True)
+    h.calculate()
+    check = TwoSampleCrossover(n=20, mu_1=h.mu_1, mu_2=0, stdev=0.3,
+                               margin=0.2231, hypothesis='equivalence',
+                               known_stdev=False, exact=True, alpha=0.05)
+    check.calculate()
+    assert abs(check.power - 0.8) < 1e-8
+    h = TwoSampleCrossover(n=4, mu_2=0, stdev=0.3, margin=0.2231,
+                           hypothesis='equivalence', known_stdev=False,
+                           exact=True)
+    h.calculate()
+    assert numpy.isnan(h.mu_1)
@@ -0,0 +1,68 @@
+""" Test cases for the power.numerics module """
+
+import numpy
+import scipy.stats as stats
+from skdesign.power import numerics
+
+
+def test_numerics():
+    """ The special function calls match scipy.stats """
+    x = numpy.linspace(-4, 4, 9)
+    positive = numpy.abs(x) + 0.5
+    q = numpy.linspace(0.05, 0.95, 9)
+    df = 12.5
+    nc = 2.5
+
+    pairs = [(numerics.norm_cdf(x), stats.norm.cdf(x)),
+             (numerics.norm_ppf(q), stats.norm.ppf(q)),
+             (numerics.t_cdf(x, df), stats.t.cdf(x, df)),
+             (numerics.t_sf(x, df), stats.t.sf(x, df)),
+             (numerics.t_ppf(q, df), stats.t.ppf(q, df)),
+             (numerics.nct_cdf(x, df, nc), stats.nct.cdf(x, df, nc)),
+             (numerics.nct_ppf(q, df, nc), stats.nct.ppf(q, df, nc)),
+             (numerics.chi2_cdf(positive, df), stats.chi2.cdf(positive, df)),
+             (numerics.chi2_sf(positive, df), stats.chi2.sf(positive, df)),
+             (numerics.chi2_ppf(q, df), stats.chi2.ppf(q, df)),
+             (numerics.ncx2_cdf(positive, df, nc),
+              stats.ncx2.cdf(positive, df, nc)),
+             (numerics.ncx2_ppf(q, df, nc), stats.ncx2.ppf(q, df, nc)),
+             (numerics.f_cdf(positive, df, df), stats.f.cdf(positive, df, df)),
+             (numerics.f_sf(positive, df, df), stats.f.sf(positive, df, df)),
+             (numerics.f_ppf(q, df, df), stats.f.ppf(q, df, df))]
+    for fast, reference in pairs:
+        assert numpy.allclose(fast, reference, rtol=1e-12, atol=0)
+
+    # The far lower tail of the noncentral t is finite and tiny.
+    tail = numerics.nct_cdf(-4.540344575142282, 15, 5.999999999999999)
+    assert 0 <= tail < 1e-12
+
+
+def test_quantile_cache():
+    """ Repeated quantiles come from the cache, which can be turned off """
+    numerics.clear_quantile_cache()
+    first = numerics.t_ppf(0.975, 12)
+    second = numerics.t_ppf(0.975, 12)
+    assert first == second == stats.t.ppf(0.975, 12)
+    info = numerics.quantile_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+    # Arrays are not cached.
+    numerics.t_ppf(numpy.array([0.9, 0.975]), 12)
+    assert numerics.quantile_cache_info().currsize == 1
+
+    numerics.set_quantile_cache(False)
+    try:
+        assert numerics.t_ppf(0.975, 12) == first
+        assert numerics.quantile_cache_info().currsize == 0
+    finally:
+        numerics.set_quantile_cache(True)
+
+
+def test_noncentrality():
+    """ The noncentrality gives the power, from the table or not """
+    for df, alpha, power in [(3, 0.05, 0.8), (7, 0.05, 0.83),
+                             (250, 0.01, 0.9)]:
+        nc = numerics.noncentrality(df, alpha, power)
+        beta = stats.ncx2.cdf(stats.chi2.ppf(1 - alpha, df), df, nc)
+        assert numpy.isclose(1 - beta, power)
@@ -1,4 +1,7 @@
+import pytest
+import warnings
 from skdesign.power.proportions import (Binomial,
+                                        ExactUnconditional,
                                         Fisher,
                                         # MultiSampleWilliams,
                                         OneSample,
@@ -10,17 +13,35 @@ from skdesign.power.proportions import (Binomial,
 
 def test_binomial():
     """ See 5.1.3 in Chow et al. for calculations """
-    # h = Binomial(alpha=0.05, power=0.8, p=0.3, p_0=0.1)
-    # h.calculate()
-    # assert h.n == 25
-    # assert h.power > 0.8
-    # assert h.alpha < 0.05
+    h = Binomial(alpha=0.05, power=0.8, p=0.3, p_0=0.1)
+    h.calculate()
+    assert h.n == 25
+    assert h.power > 0.8
+    assert h.alpha < 0.05
 
-    # h = Binomial(alpha=0.05, power=0.8, p=0.3, p_0=0.05, margin=0.05)
-    # h.calculate()
-    # assert h.n == 25
-    # assert h.power > 0.8
-    # assert h.alpha < 0.05
+    h = Binomial(alpha=0.05, power=0.8, p=0.3, p_0=0.05, margin=0.05)
+    h.calculate()
+    assert h.n == 25
+    assert h.power > 0.8
+    assert h.alpha < 0.05
+
+
+def test_binomial_exact():
+    """ Exact power agrees with scipy's binomial test """
+    import scipy.stats as stats
+
+    power = sum(stats.binom.pmf(x, 25, 0.3) for x in range(26)
+                if stats.binomtest(x, 25, 0.1).pvalue < 0.05)
+    h = Binomial(n=25, alpha=0.05, p=0.3, p_0=0.1, exact=True)
+    h.calculate()
+    assert abs(h.power - power) < 1e-12
+
+    h = Binomial(alpha=0.05, power=0.8, p=0.3, p_0=0.1, exact=True)
+    h.calculate()
+    assert h.n == 25
+    assert h.n_conservative == 29
+    assert h.power > 0.8
+    assert h.alpha < 0.05
 
 
 def test_fisher():
@@ -34,6 +55,64 @@ def test_fisher():
     assert h.n_1 == 30
 
 
+def test_scalar_only():
+    """ The simulated and exact designs are not vectorized, so they reject
+    arrays """
+    with pytest.raises(ValueError):
+        Fisher(alpha=0.05, power=0.8, p_1=[0.05, 0.1], p_2=0.3)
+    with pytest.raises(ValueError):
+        Binomial(n=[10, 20], alpha=0.05, p=0.5, p_0=0.3)
+    with pytest.raises(ValueError):
+        ExactUnconditional(alpha=[0.05, 0.1], power=0.8, p_1=0.05, p_2=0.3)
+
+
+def test_fisher_exact():
+    """ Exact power agrees with enumerating scipy's Fisher test """
+    import scipy.stats as stats
+    from skdesign.power.proportions import exact
+
+    n_1, n_2, p_1, p_2 = 8, 6, 0.2, 0.8
+    power = 0
+    for x_1 in range(n_1 + 1):
+        for x_2 in range(n_2 + 1):
+            _, p_val = stats.fisher_exact([[x_1, n_1 - x_1], [x_2, n_2 - x_2]])
+            if p_val < 0.05:
+                power += (stats.binom.pmf(x_1, n_1, p_1) *
+                          stats.binom.pmf(x_2, n_2, p_2))
+    h = Fisher(n_1=n_1, n_2=n_2, alpha=0.05, p_1=p_1, p_2=p_2, exact=True)
+    h.calculate()
+    assert abs(h.power - power) < 1e-12
+    assert h.mc_stderr == 0
+
+    h = Fisher(alpha=0.05, power=0.8, p_1=0.6, p_2=0.9, exact=True)
+    h.calculate()
+    assert h.n_1 == 34
+    assert h.power > 0.8
+    assert exact.fisher_p_values.cache_info().hits > 0
+
+
+def test_exact_unconditional():
+    """ The p-values agree with scipy and the size is kept """
+    import scipy.stats as stats
+    from skdesign.power.proportions import exact
+
+    # Tables with no variance do not give invalid values or overflows.
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        p_vals = exact.unconditional_p_values(8, 7, 0, 'barnard', 2001)
+        h = ExactUnconditional(alpha=0.025, power=0.8, p_1=0.8, p_2=0.8,
+                               margin=-0.15)
+        h.calculate()
+    res = stats.barnard_exact([[6, 1], [2, 6]], alternative='greater',
+                              pooled=False)
+    assert abs(p_vals[6, 1] - res.pvalue) < 1e-6
+    assert h.power > 0.8
+    assert h.size <= 0.025
+
+    with pytest.raises(ValueError):
+        ExactUnconditional(p_1=0.8, p_2=0.8, margin=-0.1, method='boschloo')
+
+
 def test_one_sample():
     """ See 4.1.4 in Chow et al. for calculations
     """
@@ -161,6 +240,46 @@ def test_two_sample_parallel():
     assert h.alpha < 0.05
 
 
+def test_two_sample_parallel_effect():
+    """ The p_2 calculated at n gives back the power, as in 4.2.4 in Chow
+    et al.
+    """
+    for hypothesis, margin in [('equality', None),
+                               ('superiority', 0.05),
+                               ('equivalence', 0.2)]:
+        h = TwoSampleParallel(p_1=0.65, n_2=300, margin=margin,
+                              hypothesis=hypothesis)
+        h.calculate()
+        g = TwoSampleParallel(p_1=0.65, p_2=h.p_2, n_2=300, margin=margin,
+                              alpha=0.05, hypothesis=hypothesis)
+        g.calculate()
+        assert g.power == pytest.approx(0.8)
+
+    h = TwoSampleParallel(p_1=0.65, n_2=70, alpha=0.05, power=0.8,
+                          hypothesis='equality')
+    h.calculate()
+    assert 0.84 < h.p_2 < 0.85
+
+
+def test_one_sample_effect():
+    """ The p calculated at n gives back the power """
+    for hypothesis, margin in [('equality', None),
+                               ('superiority', -0.1),
+                               ('equivalence', 0.2)]:
+        h = OneSample(p_0=0.3, n=100, margin=margin, hypothesis=hypothesis)
+        h.calculate()
+        assert h.p > 0.3
+        g = OneSample(p=h.p, p_0=0.3, n=100, margin=margin, alpha=0.05,
+                      hypothesis=hypothesis)
+        g.calculate()
+        assert g.power == pytest.approx(0.8)
+
+    # See 4.1.4 in Chow et al., where n = 50 is needed for p = 0.5.
+    h = OneSample(p_0=0.3, n=50, alpha=0.05, power=0.8)
+    h.calculate()
+    assert 0.49 < h.p < 0.5
+
+
 def test_two_sample_crossover():
     """ See 4.3.4 in Chow et al. for calculations
     """
@@ -0,0 +1,74 @@
+""" Test cases for the power.search module """
+
+import pytest
+import numpy
+from skdesign.power.search import (gallop_search,
+                                   integer_search,
+                                   vectorized_root,
+                                   vectorized_search)
+
+
+def test_gallop_search():
+    """ The smallest n reaching the target, with few evaluations """
+    calls = []
+
+    def function(n):
+        calls.append(n)
+        return n / 1000
+
+    n, value = gallop_search(function, 0.4, 2, 1000)
+    assert n == 400
+    assert value == 0.4
+    assert len(calls) < 25
+
+    assert gallop_search(function, 0.001, 2, 1000) == (2, 0.002)
+    with pytest.raises(BaseException):
+        gallop_search(function, 2, 2, 1000)
+
+
+def test_integer_search():
+    """ The same n from any start, with few evaluations near the answer """
+    def function(n):
+        return n / 1000
+
+    for start in [2, 390.2, 400, 650, 1000, None]:
+        result = integer_search(function, 0.4, start, 2, 1000)
+        assert result.n == 400
+        assert result.value == 0.4
+
+    assert integer_search(function, 0.4, 399.5, 2, 1000).evaluations <= 3
+    assert integer_search(function, 0.001, 50, 2, 1000).n == 2
+    with pytest.raises(BaseException):
+        integer_search(function, 2, 50, 2, 1000)
+
+
+def test_vectorized_search():
+    """ The same n as integer_search for every element at once """
+    def function(n):
+        return n / 1000
+
+    targets = numpy.array([0.001, 0.0505, 0.4, 0.999])
+    for start in [2, 390.2, numpy.array([2, 100, 1000, numpy.nan])]:
+        result = vectorized_search(function, targets, start, 2, 1000)
+        assert list(result.n) == [2, 51, 400, 999]
+        assert numpy.allclose(result.value, result.n / 1000)
+
+    result = vectorized_search(function, 0.4, 399.5, 2, 1000)
+    assert result.n == 400
+    assert result.evaluations <= 3
+    with pytest.raises(BaseException):
+        vectorized_search(function, targets + 0.5, 50, 2, 1000)
+
+
+def test_vectorized_root():
+    """ The root of an increasing function for every element at once """
+    targets = numpy.array([0.5, 2, 8, 100])
+    root, value = vectorized_root(numpy.sqrt, targets, 0, 1)
+    assert numpy.allclose(root, targets**2)
+    assert numpy.all(value >= targets)
+
+    # Past the maximum there is no root, and at the lower end it is reached.
+    root, value = vectorized_root(numpy.sqrt, targets, 1, 2, 100)
+    assert numpy.isnan(root[-1])
+    assert root[0] == 1
+    assert vectorized_root(numpy.sqrt, 3, 0, 1)[0] == pytest.approx(9)
@@ -1,3 +1,4 @@
+import pytest
 from skdesign.power.variances import (IntraSubjectParallel,
                                       IntraSubjectCrossover,
                                       IntraSubjectCV,
@@ -6,7 +7,8 @@ from skdesign.power.variances import (IntraSubjectParallel,
                                       TotalParallelNoReplication,
                                       TotalParallelReplication,
                                       Total2By2Crossover,
-                                      Total2By2MCrossover)
+                                      Total2By2MCrossover,
+                                      optimize_replicates)
 
 
 def test_intra_subject_parallel():
@@ -31,6 +33,80 @@ def test_intra_subject_parallel():
     assert h.alpha < 0.05
 
 
+def test_equivalence_unreachable_power():
+    """ An n is not returned when no n has the power """
+    for design, parameters in [
+            (IntraSubjectParallel, dict(m=3, stdev_wt=0.30, stdev_wr=0.45)),
+            (IntraSubjectCrossover, dict(m=3, stdev_wt=0.30, stdev_wr=0.45)),
+            (TotalParallelNoReplication, dict(stdev_tt=0.30,
+                                              stdev_tr=0.45))]:
+        h = design(similarity_limit=1.1, alpha=0.05, power=0.8,
+                   hypothesis='equivalence', **parameters)
+        with pytest.raises(ValueError):
+            h.calculate()
+
+
+def test_intra_subject_parallel_inversion():
+    """ The alpha calculated for a power gives back that power """
+    h = IntraSubjectParallel(n=13, m=3, stdev_wt=0.30, stdev_wr=0.45,
+                             similarity_limit=1.1, alpha=None, power=0.8,
+                             hypothesis='superiority')
+    h.calculate()
+    g = IntraSubjectParallel(n=13, m=3, stdev_wt=0.30, stdev_wr=0.45,
+                             similarity_limit=1.1, alpha=h.alpha, power=None,
+                             hypothesis='superiority')
+    g.calculate()
+    assert abs(g.power - 0.8) < 1e-8
+
+
+def test_intra_subject_parallel_effect():
+    """ The stdev_wt calculated for n = 13 gives back the power """
+    h = IntraSubjectParallel(n=13, m=3, stdev_wr=0.45, similarity_limit=1.1,
+                             alpha=0.05, power=0.8, hypothesis='superiority')
+    h.calculate()
+    assert 0.30 < h.stdev_2 < 0.45
+    g = IntraSubjectParallel(n=13, m=3, stdev_wt=h.stdev_2, stdev_wr=0.45,
+                             similarity_limit=1.1, alpha=0.05, power=None,
+                             hypothesis='superiority')
+    g.calculate()
+    assert abs(g.power - 0.8) < 1e-8
+
+    # alpha and power default to 0.05 and 0.8.
+    g = IntraSubjectParallel(n=13, m=3, stdev_wr=0.45, similarity_limit=1.1,
+                             hypothesis='superiority')
+    g.calculate()
+    assert g.stdev_2 == h.stdev_2
+
+
+def test_optimize_replicates():
+    """ The cheapest (n, m) and the frontier match fixed m designs """
+    parameters = dict(stdev_wt=0.30, stdev_wr=0.45, similarity_limit=1.1,
+                      alpha=0.05, power=0.8, hypothesis='superiority')
+    result = optimize_replicates(IntraSubjectParallel, subject_cost=10,
+                                 replicate_cost=1, **parameters)
+    assert result.frontier[:2] == [(26, 2), (13, 3)]
+    assert (result.n, result.m, result.cost) == (3, 10, 60)
+    for n, m in result.frontier:
+        h = IntraSubjectParallel(m=m, **parameters)
+        h.calculate()
+        assert h.n == n
+
+    result = optimize_replicates(IntraSubjectCrossover, subject_cost=1,
+                                 replicate_cost=100, m_max=5, **parameters)
+    costs = []
+    for m in range(2, 6):
+        h = IntraSubjectCrossover(m=m, **parameters)
+        h.calculate()
+        costs.append(h.n * (1 + 100 * m))
+    assert result.cost == min(costs)
+
+    # Free replicates only make sense up to a given number of them.
+    with pytest.raises(ValueError):
+        optimize_replicates(IntraSubjectParallel, **parameters)
+    result = optimize_replicates(IntraSubjectParallel, m_max=4, **parameters)
+    assert result.m <= 4
+
+
 def test_intra_subject_crossover():
     """ See Chow et al. 9.2.1 """
     h = IntraSubjectCrossover(n=None, m=2, stdev_wt=0.30, stdev_wr=0.45,